@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+from ...simulator.main import Main
+from ...simulator.network_simulator import simulation
+from ...simulator.configuration.sim_config import config
+from ...simulator.tools.contact_plan import ContactPlan
+
+
+class Command(BaseCommand):
+    help = ('Precompute the edges added and removed in each round of a project '
+            'whose mobility and connectivity models are deterministic. Set '
+            '"contact_plan" in the config.json of the project to the output '
+            'file to replay it instead of moving the nodes and evaluating '
+            'their connections.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('project', help='Name of the project.')
+        parser.add_argument('--rounds', type=int, default=None,
+                            help='Number of rounds (default: simulation_rounds of the project).')
+        parser.add_argument('--output', default=None,
+                            help='Output file (default: contact_plan.npz in the project directory).')
+
+    def handle(self, *args, **options):
+        project = options['project']
+
+        Main.init(project)
+
+        rounds = options['rounds'] if options['rounds'] is not None else config.simulation_rounds
+        output = options['output'] or f'{config.PROJECT_DIR}{project}/contact_plan.npz'
+
+        try:
+            plan = ContactPlan.build(simulation, rounds)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        plan.save(output)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Saved {len(plan.sources)} edge events over {plan.rounds} rounds to {output}'))
@@ -0,0 +1,28 @@
+import os
+from django.core.management.base import BaseCommand, CommandError
+from ...simulator.tools.trace_2d import Trace2D
+
+
+class Command(BaseCommand):
+    help = ('Convert a `time,x,y,id` CSV trace file to a binary trace file '
+            'that the FromTrace2DInMemory models map in memory. Set '
+            '"trace_file" in the config.json of the project to the output '
+            'file to use it.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('input', help='CSV trace file.')
+        parser.add_argument('--output', default=None,
+                            help='Output file, ending with .npy (default: the input file with the .npy extension).')
+
+    def handle(self, *args, **options):
+        input = options['input']
+        output = options['output'] or os.path.splitext(input)[0] + '.npy'
+
+        try:
+            trace = Trace2D.from_csv(input)
+            trace.save(output)
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Saved {len(trace)} lines to {output} and its index to {Trace2D.index_filename(output)}'))
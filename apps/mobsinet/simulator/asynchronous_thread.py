@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from .global_vars import Global
 import time
 from .network_simulator import simulation
+from .tools.packet_event_log import PacketEventLog
 
 if TYPE_CHECKING:
     from .models.nodes.abc_node import AbcNode
@@ -27,6 +28,8 @@ class AsynchronousThread(Thread):
             f'Starting simulation thread for {self.number_of_events} events...')
 
         Global.is_running = True
+        PacketEventLog.open_configured()
+
         if (AsynchronousThread.connectivity_initialized == False):
             self.reevaluate_connections()
 
@@ -62,39 +65,14 @@ class AsynchronousThread(Thread):
             print('event handled')
             print([event.id for event in simulation.event_queue])
 
+        if (Global.packet_event_log is not None):
+            Global.packet_event_log.close()
+
         Global.is_running = False
 
+    @staticmethod
     def reevaluate_connections():
-        """(private) Updates the connections in the network graph."""
-
-        for node in simulation.nodes():
-            node: 'AbcNode'
-
-            # reset neighboorhood_changed flag
-            node.neighborhood_changed = False
-            connections = 0
-            disconnections = 0
-
-            # update the connections
-            for possible_neighbor in simulation.nodes():
-                possible_neighbor: 'AbcNode'
-
-                if possible_neighbor == node:
-                    continue
-
-                is_connected = node.connectivity_model.is_connected(
-                    node, possible_neighbor)
-                has_edge = simulation.has_edge(node, possible_neighbor)
-
-                if (is_connected and not has_edge):
-                    simulation.add_edge(node, possible_neighbor)
-                    node.neighborhood_changed = True
-                    connections += 1
-
-                elif (not is_connected and has_edge):
-                    simulation.remove_edge(node, possible_neighbor)
-                    simulation.packets_in_the_air.denyFromEdge(
-                        node, possible_neighbor)
-                    node.neighborhood_changed = True
-                    disconnections += 1
+        """Updates the connections in the network graph."""
+
+        simulation.connectivity_engine.update_connections(full=True)
         AsynchronousThread.connectivity_initialized = True
@@ -17,6 +17,8 @@ class SimulationConfig:
         self.dimY = 100
         self.dimZ = 100
         self.save_trace = False
+        self.trace_format = 'csv'  # 'csv' or 'npz' (only the moves, compressed)
+        self.save_contacts = False  # edges changed in each round, for replays
         self.network_parameters = {
             'type': 'random_graph',
             'avg_degree': 4
@@ -49,10 +51,16 @@ class SimulationConfig:
             'trace_file': None,
             'should_padding': False,
             'addapt_to_dimensions': False,
+            'window_duration': 100,  # time kept in memory by from_trace_streaming
             'waypoint_radius_range': [0, 0]
         }
         self.connectivity_model = 'no_connectivity'
         self.connectivity_enabled = True
+        self.connectivity_index = 'grid'  # 'grid', 'kdtree' or 'none'
+        self.connectivity_processes = 1  # 1 evaluates connections serially
+        self.contact_plan = None  # path of a plan built with build_contact_plan
+        self.packet_event_log = None  # path of the ring file of packet events
+        self.packet_event_log_capacity = 1000000  # records kept in the ring
         self.connectivity_model_parameters = {
             # 10% da medida da menor dimensão do mapa
             'max_radius': self.dimX * 0.1 if self.dimX < self.dimY else self.dimY * 0.1,
@@ -141,8 +149,22 @@ class SimulationConfig:
         self.set_asynchronous(config_data.get(
             'asynchronous', self.asynchronous))
         self.set_save_trace(config_data.get('save_trace', self.save_trace))
+        self.set_trace_format(config_data.get(
+            'trace_format', self.trace_format))
+        self.set_save_contacts(config_data.get(
+            'save_contacts', self.save_contacts))
         self.set_connectivity_enabled(config_data.get(
             'connectivitiy_enabled', self.connectivity_enabled))
+        self.set_connectivity_index(config_data.get(
+            'connectivity_index', self.connectivity_index))
+        self.set_connectivity_processes(config_data.get(
+            'connectivity_processes', self.connectivity_processes))
+        self.set_contact_plan(config_data.get(
+            'contact_plan', self.contact_plan))
+        self.set_packet_event_log(config_data.get(
+            'packet_event_log', self.packet_event_log))
+        self.set_packet_event_log_capacity(config_data.get(
+            'packet_event_log_capacity', self.packet_event_log_capacity))
 
     def set_project_dir(self, dirname):
         self.PROJECT_DIR = dirname
@@ -227,9 +249,30 @@ class SimulationConfig:
     def set_save_trace(self, save_trace):
         self.save_trace = save_trace
 
+    def set_trace_format(self, trace_format):
+        self.trace_format = trace_format
+
+    def set_save_contacts(self, save_contacts):
+        self.save_contacts = save_contacts
+
     def set_connectivity_enabled(self, enabled):
         self.connectivity_enabled = enabled
 
+    def set_connectivity_index(self, index):
+        self.connectivity_index = index
+
+    def set_connectivity_processes(self, processes):
+        self.connectivity_processes = processes
+
+    def set_contact_plan(self, path):
+        self.contact_plan = path
+
+    def set_packet_event_log(self, path):
+        self.packet_event_log = path
+
+    def set_packet_event_log_capacity(self, capacity):
+        self.packet_event_log_capacity = capacity
+
     def print_config(self):
         print("Simulation Configuration:")
         print(f"Simulation Name: {self.simulation_name}")
@@ -263,7 +306,14 @@ class SimulationConfig:
         print(f"Node Color: {self.node_color}")
         print(f"Node Size: {self.node_size}")
         print(f"Save Trace: {self.save_trace}")
+        print(f"Trace Format: {self.trace_format}")
+        print(f"Save Contacts: {self.save_contacts}")
         print(f"Connectivity Enabled: {self.connectivity_enabled}")
+        print(f"Connectivity Index: {self.connectivity_index}")
+        print(f"Connectivity Processes: {self.connectivity_processes}")
+        print(f"Contact Plan: {self.contact_plan}")
+        print(f"Packet Event Log: {self.packet_event_log}")
+        print(f"Packet Event Log Capacity: {self.packet_event_log_capacity}")
 
 
 config = SimulationConfig()
@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+import numpy as np
 from ...models.abc_connectivity_model import AbcConnectivityModel
 
 if TYPE_CHECKING:
@@ -6,6 +7,10 @@ if TYPE_CHECKING:
 
 
 class NoConnectivity(AbcConnectivityModel):
+    symmetric = True
+    deterministic = True
+    shareable = True
+
     def __init__(self):
         super().__init__('NoConnectivity')
 
@@ -13,5 +18,13 @@ class NoConnectivity(AbcConnectivityModel):
         """Check if the nodes are connected."""
         return False
 
+    def is_connected_batch(self, nodes: list['AbcNode'], candidates: list['AbcNode']) -> np.ndarray:
+        """Check if the nodes are connected. No pair is ever connected."""
+        return np.zeros((len(nodes), len(candidates)), dtype=bool)
+
+    def get_max_radius(self) -> float | None:
+        """Nodes are never connected, so no other node must be tested."""
+        return 0
+
 
 model = NoConnectivity
@@ -1,12 +1,16 @@
 import random
+import numpy as np
 from ...configuration.sim_config import config
 from ...models.nodes.abc_node import AbcNode
 from ...models.abc_connectivity_model import AbcConnectivityModel
+from ...tools.position import distance_matrix
 
 # TODO: mudar isso para dentro da classe em todos os lugares que declare essa variável
 
 
 class QUDGConnectivity(AbcConnectivityModel):
+    symmetric = True
+
     def __init__(self):
         super().__init__('QUDGConnectivity')
 
@@ -46,6 +50,38 @@ class QUDGConnectivity(AbcConnectivityModel):
 
         return False
 
+    def is_connected_batch(self, nodes: list[AbcNode], candidates: list[AbcNode]) -> np.ndarray:
+        """Check if each node is connected to each candidate at once.
+
+        Raises
+        ------
+        ValueError
+            If the maximum or minimum radius of some node is not set.
+
+            If the big radius probability of some node is not set.
+        """
+
+        models: list[QUDGConnectivity] = [
+            node.connectivity_model for node in nodes]
+        min_radius = [model.min_radius for model in models]
+        max_radius = [model.max_radius for model in models]
+        probability = [model.big_radius_probability for model in models]
+
+        if (None in max_radius or None in min_radius):
+            raise ValueError('The maximum or minimum radius is not set.')
+
+        if (None in probability):
+            raise ValueError('The big radius probability is not set.')
+
+        distances = distance_matrix(nodes, candidates)
+        min_radius = np.array(min_radius, dtype=np.float64)[:, np.newaxis]
+        max_radius = np.array(max_radius, dtype=np.float64)[:, np.newaxis]
+        probability = np.array(probability, dtype=np.float64)[:, np.newaxis]
+
+        return (distances <= min_radius) | \
+            ((distances <= max_radius) &
+             (np.random.random(distances.shape) < probability))
+
     def set_max_radius(self, radius: int):
         """Set the maximum radius that the nodes can be connected.
 
@@ -105,5 +141,18 @@ class QUDGConnectivity(AbcConnectivityModel):
 
         self.big_radius_probability = probability
 
+    def is_symmetric_with(self, other: AbcConnectivityModel) -> bool:
+        """Both nodes must use the same radii and probability."""
+
+        return super().is_symmetric_with(other) and \
+            self.min_radius == other.min_radius and \
+            self.max_radius == other.max_radius and \
+            self.big_radius_probability == other.big_radius_probability
+
+    def get_max_radius(self) -> float | None:
+        """Return the maximum radius that the nodes can be connected."""
+
+        return self.max_radius
+
 
 model = QUDGConnectivity
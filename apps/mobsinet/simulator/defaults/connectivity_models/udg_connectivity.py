@@ -1,11 +1,16 @@
+import numpy as np
 from ...models.nodes.abc_node import AbcNode
 from ...models.abc_connectivity_model import AbcConnectivityModel
 from ...configuration.sim_config import config
+from ...tools.position import distance_matrix
 
 config.connectivity_model_parameters = config.connectivity_model_parameters
 
 
 class UDGConnectivity(AbcConnectivityModel):
+    symmetric = True
+    deterministic = True
+
     def __init__(self):
         super().__init__('UDGConnectivity')
 
@@ -32,6 +37,23 @@ class UDGConnectivity(AbcConnectivityModel):
 
         return False
 
+    def is_connected_batch(self, nodes: list[AbcNode], candidates: list[AbcNode]) -> np.ndarray:
+        """Check if each node is connected to each candidate at once.
+
+        Raises
+        ------
+        ValueError
+            If the maximum radius of some node is not set.
+        """
+
+        max_radius = [node.connectivity_model.max_radius for node in nodes]
+
+        if (None in max_radius):
+            raise ValueError('The maximum radius is not set.')
+
+        return distance_matrix(nodes, candidates) <= \
+            np.array(max_radius, dtype=np.float64)[:, np.newaxis]
+
     def set_max_radius(self, radius: int):
         """Set the maximum radius that the nodes can be connected.
 
@@ -51,5 +73,16 @@ class UDGConnectivity(AbcConnectivityModel):
 
         self.max_radius = radius
 
+    def is_symmetric_with(self, other: AbcConnectivityModel) -> bool:
+        """Both nodes must use the same maximum radius."""
+
+        return super().is_symmetric_with(other) and \
+            self.max_radius == other.max_radius
+
+    def get_max_radius(self) -> float | None:
+        """Return the maximum radius that the nodes can be connected."""
+
+        return self.max_radius
+
 
 model = UDGConnectivity
@@ -1,7 +1,9 @@
 from ...models.abc_distribution_model import AbcDistributionModel
 from ...configuration.sim_config import config
 from ...tools.position import Position
-import utm
+from ...tools.trace_2d import Trace2D
+from ...tools.trace_registry import TraceRegistry
+import numpy as np
 
 
 class FromTrace2DInMemory(AbcDistributionModel):
@@ -17,7 +19,9 @@ class FromTrace2DInMemory(AbcDistributionModel):
             trace: The trace data to be used for generating the distribution.
         """
         super().__init__('FromTrace2DInMemory')
-        self.__trace: list[list[float]] = None
+        self.__trace: Trace2D = None
+        # rows of the lines at time 0, ordered by node id
+        self.__initial_rows: np.ndarray = None
         self.is_lat_long = config.distribution_model_parameters.get(
             'is_lat_long', False)
         self.should_padding = config.distribution_model_parameters.get(
@@ -26,10 +30,6 @@ class FromTrace2DInMemory(AbcDistributionModel):
         self.addapt_to_dimensions = config.distribution_model_parameters.get(
             'addapt_to_dimensions', False
         )
-        self.__min_x = None
-        self.__max_x = None
-        self.__min_y = None
-        self.__max_y = None
         self.__trace_index = 0
 
         self.load_trace(
@@ -70,11 +70,15 @@ class FromTrace2DInMemory(AbcDistributionModel):
 
     def load_trace(self, filename: str):
         """
-        Load a trace file and parse it into a list of positions.
+        Load a trace file, which is parsed once per process and shared with
+        the other models that load the same version of the file.
 
         The trace file should be a CSV file with the following format:
         `timestamp, x, y, id` or `timestamp, lat, long, id`
 
+        It can also be a binary `.npy` trace file converted with the
+        `convert_trace` command, which is mapped in memory instead of parsed.
+
         Parameters
         ----------
         filename : str
@@ -82,24 +86,9 @@ class FromTrace2DInMemory(AbcDistributionModel):
 
 
         """
-        self.__trace = []
-        with open(filename, 'r') as f:
-
-            for line in f.readlines()[1:]:
-                line = list(map(float, line.split(',')))
-                if (line[0] == 0):
-                    self.__trace.append(line)
-
-                if (self.__min_x is None or line[1] < self.__min_x):
-                    self.__min_x = line[1]
-                if (self.__max_x is None or line[1] > self.__max_x):
-                    self.__max_x = line[1]
-                if (self.__min_y is None or line[2] < self.__min_y):
-                    self.__min_y = line[2]
-                if (self.__max_y is None or line[2] > self.__max_y):
-                    self.__max_y = line[2]
-
-        self.__trace.sort(key=lambda x: x[3])
+        self.__trace = TraceRegistry.acquire(filename, self)
+        self.__initial_rows = np.flatnonzero(self.__trace.times == 0)
+        self.__trace_index = 0
 
     def get_position(self):
         """
@@ -118,47 +107,51 @@ class FromTrace2DInMemory(AbcDistributionModel):
             raise ValueError(
                 "Should padding must be false if addapt to dimensions is false.")
 
+        trace = self.__trace
+
         if (self.is_lat_long):
-            max_x = self.__max_x - self.__min_x
-            max_y = self.__max_y - self.__min_y
+            # projected once for the whole trace, bounds included
+            trace = trace.to_utm()
+            max_x = trace.max_x - trace.min_x
+            max_y = trace.max_y - trace.min_y
         else:
-            max_x = self.__max_x
-            max_y = self.__max_y
+            max_x = trace.max_x
+            max_y = trace.max_y
 
         if max_x > config.dimX or max_y > config.dimY:
             raise ValueError("Trace coordinates exceed simulation dimensions.")
 
-        corresponding_position: list[float] = self.__trace[self.__trace_index]
+        corresponding_position: list[float] = trace.line(
+            self.__initial_rows[self.__trace_index])
         self.__trace_index += 1
 
         if self.is_lat_long:
-            # Convert latitude/longitude to x/y
-            x, y, _, _ = utm.from_latlon(
-                corresponding_position[1], corresponding_position[2])
+            x = corresponding_position[1]
+            y = corresponding_position[2]
 
             if (self.should_padding):
-                x = (x - self.__min_x) / \
-                    (self.__max_x - self.__min_x) * \
+                x = (x - trace.min_x) / \
+                    (trace.max_x - trace.min_x) * \
                     config.dimX * 0.9 + config.dimX * 0.05
-                y = (y - self.__min_y) / \
-                    (self.__max_y - self.__min_y) * \
+                y = (y - trace.min_y) / \
+                    (trace.max_y - trace.min_y) * \
                     config.dimY * 0.9 + config.dimY * 0.05
             elif (self.addapt_to_dimensions):
-                x = (x - self.__min_x) / \
-                    (self.__max_x - self.__min_x) * config.dimX
-                y = (y - self.__min_y) / \
-                    (self.__max_y - self.__min_y) * config.dimY
+                x = (x - trace.min_x) / \
+                    (trace.max_x - trace.min_x) * config.dimX
+                y = (y - trace.min_y) / \
+                    (trace.max_y - trace.min_y) * config.dimY
 
         else:
             # Use x/y directly
             if (self.should_padding):
-                x = corresponding_position[1] / (self.__max_x) * \
+                x = corresponding_position[1] / (trace.max_x) * \
                     config.dimX * 0.9 + config.dimX * 0.05
-                y = corresponding_position[2] / (self.__max_y) * \
+                y = corresponding_position[2] / (trace.max_y) * \
                     config.dimY * 0.9 + config.dimY * 0.05
             elif (self.addapt_to_dimensions):
-                x = corresponding_position[1] / (self.__max_x) * config.dimX
-                y = corresponding_position[2] / (self.__max_y) * config.dimY
+                x = corresponding_position[1] / (trace.max_x) * config.dimX
+                y = corresponding_position[2] / (trace.max_y) * config.dimY
             else:
                 x = corresponding_position[1]
                 y = corresponding_position[2]
@@ -3,6 +3,8 @@ from ...models.abc_interference_model import AbcInterferenceModel
 
 
 class NoInterference(AbcInterferenceModel):
+    shareable = True
+
     def __init__(self):
         super().__init__('NoInterference')
 
@@ -5,12 +5,12 @@ from ...global_vars import Global
 from ...network_simulator import simulation
 from ...configuration.sim_config import config
 from ...tools.position import Position
-import utm
+from ...tools.trace_2d import Trace2D
+from ...tools.trace_registry import TraceRegistry
 
 
 class FromTrace2DInMemory(AbcMobilityModel):
-    __traces: dict[str, list[list[list[float]],
-                             float, float, float, float]] = {}
+    deterministic = True
 
     def __init__(self):
         super().__init__('FromTrace2DInMemory')
@@ -21,9 +21,9 @@ class FromTrace2DInMemory(AbcMobilityModel):
         self.addapt_to_dimensions: bool = config.mobility_model_parameters.get(
             'addapt_to_dimensions', False
         )
-        self.__trace_index: int = 0
         self.trace_file: str = config.mobility_model_parameters.get(
             'trace_file')
+        self.__trace: Trace2D = None
 
         self.load_trace(self.trace_file)
 
@@ -62,11 +62,15 @@ class FromTrace2DInMemory(AbcMobilityModel):
 
     def load_trace(self, filename: str):
         """
-        Load a trace file and parse it into a list of positions.
+        Load a trace file, which is parsed once per process and shared with
+        the other models that load the same version of the file.
 
         The trace file should be a CSV file with the following format:
         `timestamp, x, y, id` or `timestamp, lat, long, id`
 
+        It can also be a binary `.npy` trace file converted with the
+        `convert_trace` command, which is mapped in memory instead of parsed.
+
         Parameters
         ----------
         filename : str
@@ -74,32 +78,8 @@ class FromTrace2DInMemory(AbcMobilityModel):
 
 
         """
-        if (filename not in FromTrace2DInMemory.__traces):
-            FromTrace2DInMemory.__traces.__setitem__(
-                filename, [[], None, None, None, None])
-        else:
-            return
-        with open(filename, 'r') as f:
-
-            for line in f.readlines()[1:]:
-                line = list(map(float, line.split(',')))
-                FromTrace2DInMemory.__traces[filename][0].append(line)
-
-                min_x = FromTrace2DInMemory.__traces[filename][1]
-                max_x = FromTrace2DInMemory.__traces[filename][2]
-                min_y = FromTrace2DInMemory.__traces[filename][3]
-                max_y = FromTrace2DInMemory.__traces[filename][4]
-
-                if (min_x is None or line[1] < min_x):
-                    FromTrace2DInMemory.__traces[filename][1] = line[1]
-                if (max_x is None or line[1] > max_x):
-                    FromTrace2DInMemory.__traces[filename][2] = line[1]
-                if (min_y is None or line[2] < min_y):
-                    FromTrace2DInMemory.__traces[filename][3] = line[2]
-                if (max_y is None or line[2] > max_y):
-                    FromTrace2DInMemory.__traces[filename][4] = line[2]
-
-        FromTrace2DInMemory.__traces[filename][0].sort(key=lambda x: x[0])
+        self.__trace = TraceRegistry.acquire(filename, self)
+        self.trace_file = filename
 
     def get_next_position(self, node: AbcNode):
         """Return the next position for the node.
@@ -109,7 +89,7 @@ class FromTrace2DInMemory(AbcMobilityModel):
         node : AbcNode
             The node object.
         """
-        if self.trace_file not in FromTrace2DInMemory.__traces:
+        if self.__trace is None:
             raise ValueError(
                 "Trace not loaded. Please load a trace file first.")
 
@@ -117,67 +97,57 @@ class FromTrace2DInMemory(AbcMobilityModel):
             raise ValueError(
                 "Should padding must be false if addapt to dimensions is false.")
 
-        trace_data = FromTrace2DInMemory.__traces[self.trace_file]
+        trace = self.__trace
+
+        if (self.is_lat_long):
+            # projected once for the whole trace, bounds included
+            trace = trace.to_utm()
 
-        """
-        trace_data[0] is the list of positions
-        trace_data[1] is the min x
-        trace_data[2] is the max x
-        trace_data[3] is the min y
-        trace_data[4] is the max y
-        """
         if (self.is_lat_long):
-            max_x = trace_data[2] - trace_data[1]
-            max_y = trace_data[4] - trace_data[3]
+            max_x = trace.max_x - trace.min_x
+            max_y = trace.max_y - trace.min_y
         else:
-            max_x = trace_data[2]
-            max_y = trace_data[4]
+            max_x = trace.max_x
+            max_y = trace.max_y
 
         if max_x > config.dimX or max_y > config.dimY:
             raise ValueError("Trace coordinates exceed simulation dimensions.")
 
-        corresponding_position: list[float] = None
-
-        for i in range(self.__trace_index, len(trace_data[0])):
-            line = trace_data[0][i]
-            if (line[0] > Global.current_time):
-                break
-            if (line[3] == node.id and line[0] == Global.current_time):
-                corresponding_position = line
-                self.__trace_index = i
-                break
+        row = trace.row_of(Global.current_time, node.id)
 
-        if (corresponding_position is None):
+        if (row < 0):
             return node.position.copy()
 
+        corresponding_position: list[float] = trace.line(row)
+
         if self.is_lat_long:
-            x, y, _, _ = utm.from_latlon(
-                corresponding_position[1], corresponding_position[2])
+            x = corresponding_position[1]
+            y = corresponding_position[2]
 
             if (self.should_padding):
-                x = (x - trace_data[1]) / \
-                    (trace_data[2] - trace_data[1]) * \
+                x = (x - trace.min_x) / \
+                    (trace.max_x - trace.min_x) * \
                     config.dimX * 0.9 + (config.dimX * 0.05)
-                y = (y - trace_data[3]) / \
-                    (trace_data[4] - trace_data[3]) * \
+                y = (y - trace.min_y) / \
+                    (trace.max_y - trace.min_y) * \
                     config.dimY * 0.9 + (config.dimY * 0.05)
             elif (self.addapt_to_dimensions):
-                x = (x - trace_data[1]) / \
-                    (trace_data[2] - trace_data[1]) * config.dimX
-                y = (y - trace_data[3]) / \
-                    (trace_data[4] - trace_data[3]) * config.dimY
+                x = (x - trace.min_x) / \
+                    (trace.max_x - trace.min_x) * config.dimX
+                y = (y - trace.min_y) / \
+                    (trace.max_y - trace.min_y) * config.dimY
 
         else:
             if (self.should_padding):
                 x = corresponding_position[1] / \
-                    (trace_data[2]) * config.dimX * 0.9 + (config.dimX * 0.05)
+                    (trace.max_x) * config.dimX * 0.9 + (config.dimX * 0.05)
                 y = corresponding_position[2] / \
-                    (trace_data[4]) * config.dimY * 0.9 + (config.dimY * 0.05)
+                    (trace.max_y) * config.dimY * 0.9 + (config.dimY * 0.05)
             elif (self.addapt_to_dimensions):
                 x = corresponding_position[1] / \
-                    (trace_data[2]) * config.dimX
+                    (trace.max_x) * config.dimX
                 y = corresponding_position[2] / \
-                    (trace_data[4]) * config.dimY
+                    (trace.max_y) * config.dimY
             else:
                 x = corresponding_position[1]
                 y = corresponding_position[2]
@@ -0,0 +1,147 @@
+from ...models.abc_mobility_model import AbcMobilityModel
+from ...models.nodes.abc_node import AbcNode
+from ...global_vars import Global
+from ...configuration.sim_config import config
+from ...tools.position import Position
+from ...tools.trace_stream import TraceStream
+
+
+class FromTraceStreaming(AbcMobilityModel):
+    """Mobility model that replays a trace file too large to be loaded in
+    memory.
+
+    The trace must be a CSV file sorted by timestamp. Only a window of
+    `window_duration` time units is kept in memory, and the next window is
+    read on a background thread while the current one is replayed.
+    """
+
+    deterministic = True
+
+    def __init__(self):
+        super().__init__('FromTraceStreaming')
+        self.is_lat_long: bool = config.mobility_model_parameters.get(
+            'is_lat_long', False)
+        self.should_padding: bool = config.mobility_model_parameters.get(
+            'should_padding', False)
+        self.addapt_to_dimensions: bool = config.mobility_model_parameters.get(
+            'addapt_to_dimensions', False
+        )
+        self.window_duration: float = config.mobility_model_parameters.get(
+            'window_duration', 100)
+        self.trace_file: str = config.mobility_model_parameters.get(
+            'trace_file')
+
+    def set_lat_long(self, is_lat_long: bool):
+        """
+        Set whether the trace is in latitude/longitude format.
+
+        Parameters
+        ----------
+        is_lat_long : bool
+            True if the trace is in latitude/longitude format, False otherwise.
+        """
+        self.is_lat_long = is_lat_long
+
+    def set_should_padding(self, should_padding: bool):
+        """
+        Set whether the trace should be padded to the simulation dimensions.
+
+        Parameters
+        ----------
+        should_padding : bool
+            True if the trace should be padded, False otherwise.
+        """
+        self.should_padding = should_padding
+
+    def set_addapt_to_dimensions(self, addapt_to_dimensions: bool):
+        """
+        Set whether the trace should be addapted to the simulation dimensions.
+
+        Parameters
+        ----------
+        addapt_to_dimensions : bool
+            True if the trace should be addapted to the simulation dimensions, False otherwise.
+        """
+        self.addapt_to_dimensions = addapt_to_dimensions
+
+    def set_window_duration(self, window_duration: float):
+        """
+        Set the time covered by each window of the trace kept in memory.
+
+        Parameters
+        ----------
+        window_duration : float
+            The time covered by each window.
+        """
+        self.window_duration = window_duration
+
+    def get_next_position(self, node: AbcNode):
+        """Return the next position for the node.
+
+        Parameters
+        ----------
+        node : AbcNode
+            The node object.
+        """
+        if (self.trace_file is None):
+            raise ValueError("No trace file. Please set trace_file first.")
+
+        if (self.should_padding and not self.addapt_to_dimensions):
+            raise ValueError(
+                "Should padding must be false if addapt to dimensions is false.")
+
+        stream = TraceStream.shared(
+            self.trace_file, self.window_duration, self.is_lat_long)
+
+        if (self.addapt_to_dimensions):
+            # scaling needs the bounds of the whole trace, read once per
+            # stream while the first windows are read
+            stream.start_bounds()
+
+        corresponding_position = stream.position_of(
+            Global.current_time, node.id)
+
+        # without scaling, only the windows read so far are checked, since
+        # the rest of the trace is not read yet
+        bounds = stream.bounds() if self.addapt_to_dimensions else stream.read_bounds()
+
+        if (bounds is not None):
+            min_x, max_x, min_y, max_y = bounds
+
+            if (self.is_lat_long):
+                width = max_x - min_x
+                height = max_y - min_y
+            else:
+                width = max_x
+                height = max_y
+
+            if width > config.dimX or height > config.dimY:
+                raise ValueError(
+                    "Trace coordinates exceed simulation dimensions.")
+
+        if (corresponding_position is None):
+            return node.position.copy()
+
+        x, y = corresponding_position
+
+        if (not self.addapt_to_dimensions):
+            return Position(x, y)
+
+        if (self.is_lat_long):
+            x = (x - min_x) / (max_x - min_x)
+            y = (y - min_y) / (max_y - min_y)
+        else:
+            x = x / max_x
+            y = y / max_y
+
+        if (self.should_padding):
+            x = x * config.dimX * 0.9 + config.dimX * 0.05
+            y = y * config.dimY * 0.9 + config.dimY * 0.05
+        else:
+            x = x * config.dimX
+            y = y * config.dimY
+
+        return Position(x, y)
+
+
+model = FromTraceStreaming
@@ -1,3 +1,4 @@
+import math
 from ...models.nodes.abc_node import AbcNode
 from ...tools.position import Position
 from ...models.abc_mobility_model import AbcMobilityModel
@@ -6,6 +7,9 @@ from ...models.abc_mobility_model import AbcMobilityModel
 class NoMobility(AbcMobilityModel):
     """A mobility model with no mobility."""
 
+    deterministic = True
+    shareable = True
+
     def __init__(self):
         super().__init__('NoMobility')
 
@@ -18,5 +22,10 @@ class NoMobility(AbcMobilityModel):
 
         return node.position
 
+    def get_stationary_until(self, node: AbcNode) -> float:
+        """The node never moves."""
+
+        return math.inf
+
 
 model = NoMobility
@@ -1,7 +1,9 @@
 import math
 from random import random
+import numpy as np
 from ...configuration.sim_config import config
-from ...tools.position import Position
+from ...global_vars import Global
+from ...tools.position import Position, coordinates_array
 from ...models.abc_mobility_model import AbcMobilityModel
 from ...models.nodes.abc_node import AbcNode
 
@@ -11,7 +13,8 @@ class RandomDirection(AbcMobilityModel):
         super().__init__('RandomDirection')
 
         self._move_vector = None
-        self._remaining_waiting_time = 0
+        # first round in which the node moves again after a move
+        self._waiting_until = 0
         self._remaining_moves = 0
         self.speed_range = config.mobility_model_parameters['speed_range']
         self.waiting_time_range = config.mobility_model_parameters['waiting_time_range']
@@ -22,32 +25,13 @@ class RandomDirection(AbcMobilityModel):
         current_position = node.position
 
         if self._initialize:
-            wt = abs(random(
-            ) * (self.waiting_time_range[1] - self.waiting_time_range[0]) + self.waiting_time_range[0])
-            mt = abs(random(
-            ) * (self.move_time_range[1] - self.move_time_range[0]) + self.move_time_range[0])
-            fraction = random() * (wt + mt)
-
-            if (fraction < wt):
-                self._remaining_waiting_time = math.ceil(wt - fraction)
-                self._remaining_moves = 0
-            else:
-                speed = abs(
-                    random() * (self.speed_range[1] - self.speed_range[0]) + self.speed_range[0])
-                self._initialize_next_move(speed, mt + wt - fraction)
-            self._initialize = False
-
-        if self._remaining_waiting_time > 0:
-            self._remaining_waiting_time -= 1
+            self._initialize_state()
+
+        if Global.current_time < self._waiting_until:
             return current_position
 
         if self._remaining_moves == 0:
-            speed = abs(
-                random() * (self.speed_range[1] - self.speed_range[0]) + self.speed_range[0])
-            move_time = abs(random(
-            ) * (self.move_time_range[1] - self.move_time_range[0]) + self.move_time_range[0])
-
-            self._initialize_next_move(speed, move_time)
+            self._start_next_move()
 
         new_x = current_position.x + self._move_vector[0]
         new_y = current_position.y + self._move_vector[1]
@@ -57,15 +41,118 @@ class RandomDirection(AbcMobilityModel):
 
         next_position = Position(new_x, new_y, new_z)
 
+        self._end_move_step()
+
+        return next_position
+
+    @classmethod
+    def step_batch(cls, nodes: list[AbcNode]):
+        """Move every node with arrays of move vectors, following the same
+        rules as `get_next_position`."""
+
+        if (cls is not RandomDirection):
+            # subclasses may change the rules of get_next_position
+            return super().step_batch(nodes)
+
+        moving_nodes: list[AbcNode] = []
+
+        for node in nodes:
+            model: RandomDirection = node.mobility_model
+
+            if model._initialize:
+                model._initialize_state()
+
+            if Global.current_time < model._waiting_until:
+                node.node_position_updated()
+                continue
+
+            if model._remaining_moves == 0:
+                model._start_next_move()
+
+            moving_nodes.append(node)
+
+        if (len(moving_nodes) > 0):
+            models: list[RandomDirection] = [
+                node.mobility_model for node in moving_nodes]
+            move_vectors = np.array([model._move_vector for model in models],
+                                    dtype=np.float64)
+            coordinates = coordinates_array(moving_nodes) + move_vectors
+
+            # reflects the nodes off the boundaries
+            limits = (config.dimX, config.dimY, config.dimZ)
+
+            while True:
+                reflected = False
+
+                for axis, limit in enumerate(limits):
+                    lower = coordinates[:, axis] < 0
+                    coordinates[lower, axis] = -coordinates[lower, axis]
+                    upper = coordinates[:, axis] > limit
+                    coordinates[upper, axis] = 2 * limit - \
+                        coordinates[upper, axis]
+
+                    move_vectors[lower ^ upper, axis] *= -1
+                    reflected = reflected or lower.any() or upper.any()
+
+                if (not reflected):
+                    break
+
+            for model, move_vector in zip(models, move_vectors.tolist()):
+                model._move_vector = tuple(move_vector)
+                model._end_move_step()
+
+            AbcNode.set_positions(moving_nodes, coordinates)
+
+    def get_stationary_until(self, node: AbcNode) -> float:
+        """The node stays where it stopped until the end of its waiting
+        time."""
+
+        if self._initialize:
+            return 0
+
+        return self._waiting_until
+
+    def _initialize_state(self):
+        """(private) Draws whether the node starts waiting or moving, and for
+        how long, as if the model had been running before."""
+
+        wt = abs(random(
+        ) * (self.waiting_time_range[1] - self.waiting_time_range[0]) + self.waiting_time_range[0])
+        mt = abs(random(
+        ) * (self.move_time_range[1] - self.move_time_range[0]) + self.move_time_range[0])
+        fraction = random() * (wt + mt)
+
+        if (fraction < wt):
+            self._waiting_until = Global.current_time + \
+                math.ceil(wt - fraction)
+            self._remaining_moves = 0
+        else:
+            speed = abs(
+                random() * (self.speed_range[1] - self.speed_range[0]) + self.speed_range[0])
+            self._initialize_next_move(speed, mt + wt - fraction)
+        self._initialize = False
+
+    def _start_next_move(self):
+        """(private) Draws the speed and the duration of the next move."""
+
+        speed = abs(
+            random() * (self.speed_range[1] - self.speed_range[0]) + self.speed_range[0])
+        move_time = abs(random(
+        ) * (self.move_time_range[1] - self.move_time_range[0]) + self.move_time_range[0])
+
+        self._initialize_next_move(speed, move_time)
+
+    def _end_move_step(self):
+        """(private) Counts a step of the move and draws the waiting time
+        after the last one."""
+
         if self._remaining_moves <= 1:
-            self._remaining_waiting_time = math.ceil(
-                abs(random() * (self.waiting_time_range[1] - self.waiting_time_range[0]) + self.waiting_time_range[0]))
+            self._waiting_until = Global.current_time + math.ceil(
+                abs(random() * (self.waiting_time_range[1] - self.waiting_time_range[0]) + self.waiting_time_range[0])) + 1
             self._remaining_moves = 0
         else:
             self._remaining_moves -= 1
 
-        return next_position
-
     def _initialize_next_move(self, speed: float, move_time: float):
         angle_xy = 2 * math.pi * random()
         angle_z = math.pi * (0.5 - random()) if config.dimZ else 0
@@ -8,6 +8,8 @@ from ...configuration.sim_config import config
 class RandomMob(AbcMobilityModel):
     """A random mobility model."""
 
+    shareable = True
+
     def __init__(self):
         super().__init__('RandomMob')
 
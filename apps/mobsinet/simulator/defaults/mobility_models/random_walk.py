@@ -8,9 +8,10 @@ from ..nodes.inert_node import InertNode
 from ..reliability_models.no_reliability import NoReliability
 from ...models.abc_mobility_model import AbcMobilityModel
 from ...models.nodes.abc_node import AbcNode
-from ...tools.position import Position
+from ...tools.position import Position, coordinates_array
 from random import randint, random
 import matplotlib.pyplot as plt
+import numpy as np
 
 config.mobility_model_parameters = config.mobility_model_parameters
 
@@ -96,6 +97,74 @@ class RandomWalk(AbcMobilityModel):
 
         return position
 
+    @classmethod
+    def step_batch(cls, nodes: list[AbcNode]):
+        """Move every node with arrays of speeds, directions and remaining
+        time and distance, following the same rules as `get_next_position`.
+
+        Raises
+        ------
+        ValueError
+            If `travel_distance` or `travel_time` is not set for some node.
+        """
+
+        if (cls is not RandomWalk):
+            # subclasses may change the rules of get_next_position
+            return super().step_batch(nodes)
+
+        models: list[RandomWalk] = [node.mobility_model for node in nodes]
+
+        for model in models:
+            if (not model.travel_distance and not model.travel_time):
+                raise ValueError('travel_distance or travel_time must be set')
+
+            # verify remaining time and distance
+            if (model._remaining_distance <= 0 or model._remaining_time <= 0):
+                model._new_random_attributes()
+
+        speed = np.array([model._current_speed for model in models],
+                         dtype=np.float64)
+        direction = np.array([model._current_direction for model in models],
+                             dtype=np.float64)
+        remaining_distance = np.array([model._remaining_distance for model in models],
+                                      dtype=np.float64)
+        prioritize_speed = np.array([bool(model.prioritize_speed) for model in models],
+                                    dtype=bool)
+
+        # calculates next position
+        used_speed = np.where(prioritize_speed, speed,
+                              np.minimum(remaining_distance, speed))
+        coordinates = coordinates_array(nodes)
+        coordinates[:, 0] += used_speed * np.cos(direction)
+        coordinates[:, 1] += used_speed * np.sin(direction)
+
+        # bounces the nodes off the boundaries
+        while True:
+            left = coordinates[:, 0] < 0
+            coordinates[left, 0] = -coordinates[left, 0]
+            right = coordinates[:, 0] > config.dimX
+            coordinates[right, 0] = 2 * config.dimX - coordinates[right, 0]
+            direction[left ^ right] = pi - direction[left ^ right]
+
+            bottom = coordinates[:, 1] < 0
+            coordinates[bottom, 1] = -coordinates[bottom, 1]
+            top = coordinates[:, 1] > config.dimY
+            coordinates[top, 1] = 2 * config.dimY - coordinates[top, 1]
+            direction[bottom ^ top] = -direction[bottom ^ top]
+
+            if (not (left.any() or right.any() or bottom.any() or top.any())):
+                break
+
+        # updates variables
+        for model, new_direction, distance in zip(models, direction.tolist(), used_speed.tolist()):
+            model._current_direction = new_direction
+            if (model._remaining_time is not None):
+                model._remaining_time -= 1
+            if (model._remaining_distance is not None):
+                model._remaining_distance -= distance
+
+        AbcNode.set_positions(nodes, coordinates)
+
     def _new_random_attributes(self):
         """(private) Sets new random values for `current_speed` and `current_direction`.
 
@@ -2,16 +2,18 @@ from math import cos, sin, sqrt, pi
 from typing import Tuple
 from networkx import DiGraph, Graph, draw, draw_networkx_edge_labels, draw_networkx_labels, get_edge_attributes, get_node_attributes
 from ...configuration.sim_config import config
+from ...global_vars import Global
 from ..connectivity_models.no_connectivity import NoConnectivity
 from ..interference_models.no_interference import NoInterference
 from ..nodes.inert_node import InertNode
 from ..reliability_models.no_reliability import NoReliability
 from ...models.abc_mobility_model import AbcMobilityModel
 from ...models.nodes.abc_node import AbcNode
-from ...tools.position import Position
+from ...tools.position import Position, coordinates_array
 from random import randint, random
 import matplotlib.pyplot as plt
 import math
+import numpy as np
 
 config.mobility_model_parameters = config.mobility_model_parameters
 
@@ -23,7 +25,8 @@ class RandomWaypoint(AbcMobilityModel):
 
         self._next_destination = None
         self._move_vector = None
-        self._remaining_waiting_time = 0
+        # first round in which the node moves again after a waypoint
+        self._waiting_until = 0
         self._remaining_moves = 0
         self.speed_range: list[float |
                                int] = config.mobility_model_parameters['speed_range']
@@ -47,32 +50,16 @@ class RandomWaypoint(AbcMobilityModel):
         current_position = node.position
         next_position = None
 
-        if (self._remaining_waiting_time > 0):
-            self._remaining_waiting_time -= 1
+        if (Global.current_time < self._waiting_until):
             return current_position
 
         if (self._remaining_moves == 0):
-            speed = random() * \
-                (self.speed_range[1] - self.speed_range[0]) + \
-                self.speed_range[0]
-
-            self.next_destination = self.get_next_waypoint()
-
-            distance = current_position.euclidean_distance(
-                self.next_destination)
-            rounds = distance / speed
-            self._remaining_moves = math.ceil(rounds)
-
-            self._move_vector = (
-                (self.next_destination.x - current_position.x) / rounds,
-                (self.next_destination.y - current_position.y) / rounds,
-                (self.next_destination.z - current_position.z) / rounds
-            )
+            self._start_next_move(current_position)
 
         if (self._remaining_moves <= 1):
             next_position = self.next_destination.copy()
-            self._remaining_waiting_time = randint(
-                self.waiting_time_range[0], self.waiting_time_range[1])
+            self._waiting_until = Global.current_time + randint(
+                self.waiting_time_range[0], self.waiting_time_range[1]) + 1
             self._remaining_moves = 0
         else:
             next_position = Position(
@@ -84,6 +71,81 @@ class RandomWaypoint(AbcMobilityModel):
 
         return next_position
 
+    @classmethod
+    def step_batch(cls, nodes: list[AbcNode]):
+        """Move every node with arrays of move vectors and destinations,
+        following the same rules as `get_next_position`."""
+
+        if (cls is not RandomWaypoint):
+            # subclasses may change the rules of get_next_position
+            return super().step_batch(nodes)
+
+        moving_nodes: list[AbcNode] = []
+
+        for node in nodes:
+            model: RandomWaypoint = node.mobility_model
+
+            if (Global.current_time < model._waiting_until):
+                node.node_position_updated()
+                continue
+
+            if (model._remaining_moves == 0):
+                model._start_next_move(node.position)
+
+            moving_nodes.append(node)
+
+        if (len(moving_nodes) == 0):
+            return
+
+        models: list[RandomWaypoint] = [
+            node.mobility_model for node in moving_nodes]
+        arriving = np.array([model._remaining_moves <= 1 for model in models],
+                            dtype=bool)
+        move_vectors = np.array([model._move_vector for model in models],
+                                dtype=np.float64)
+        destinations = np.array([model.next_destination.get_coordinates() for model in models],
+                                dtype=np.float64)
+
+        coordinates = coordinates_array(moving_nodes) + move_vectors
+        coordinates[arriving] = destinations[arriving]
+
+        for model, has_arrived in zip(models, arriving.tolist()):
+            if (has_arrived):
+                model._waiting_until = Global.current_time + randint(
+                    model.waiting_time_range[0], model.waiting_time_range[1]) + 1
+                model._remaining_moves = 0
+            else:
+                model._remaining_moves -= 1
+
+        AbcNode.set_positions(moving_nodes, coordinates)
+
+    def get_stationary_until(self, node: AbcNode) -> float:
+        """The node stays at the waypoint it reached until the end of its
+        waiting time."""
+
+        return self._waiting_until
+
+    def _start_next_move(self, current_position: Position):
+        """(private) Draws the speed and the next waypoint, and the move
+        vector to reach it."""
+
+        speed = random() * \
+            (self.speed_range[1] - self.speed_range[0]) + \
+            self.speed_range[0]
+
+        self.next_destination = self.get_next_waypoint()
+
+        distance = current_position.euclidean_distance(
+            self.next_destination)
+        rounds = distance / speed
+        self._remaining_moves = math.ceil(rounds)
+
+        self._move_vector = (
+            (self.next_destination.x - current_position.x) / rounds,
+            (self.next_destination.y - current_position.y) / rounds,
+            (self.next_destination.z - current_position.z) / rounds
+        )
+
     def get_next_waypoint(self) -> Position:
         """Get a random waypoint.
 
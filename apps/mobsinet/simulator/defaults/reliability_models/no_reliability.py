@@ -3,6 +3,7 @@ from ...models.abc_reliability_model import AbcReliabilityModel
 
 
 class NoReliability(AbcReliabilityModel):
+    shareable = True
 
     def __init__(self):
         super().__init__('NoReliability')
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .models.abc_message_transmission_model import AbcMessageTransmissionModel
     from .abc_custom_global import AbcCustomGlobal
+    from .tools.packet_event_log import PacketEventLog
 
 
 class Global:
@@ -27,6 +28,8 @@ class Global:
     project_name: str = ""
     is_gui_mode: bool = False
     round_logs: list[str] = []
+    # records of the packet events, if config.packet_event_log is set
+    packet_event_log: 'PacketEventLog' = None
 
     @staticmethod
     def reset():
@@ -44,3 +47,8 @@ class Global:
         Global.project_name = ""
         Global.is_gui_mode = False
         Global.round_logs = []
+
+        if (Global.packet_event_log is not None):
+            Global.packet_event_log.close()
+
+        Global.packet_event_log = None
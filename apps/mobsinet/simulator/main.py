@@ -9,6 +9,7 @@ import logging
 from time import sleep
 from .asynchronous_thread import AsynchronousThread
 from .tools.event import Event
+from .tools.packet_event_log import PacketEventLog
 
 
 class Main:
@@ -46,6 +47,8 @@ class Main:
 
         Global.custom_global.check_project_requirements()
 
+        PacketEventLog.open_configured()
+
         simulation.add_project_nodes()
 
         if (Global.is_async_mode and len(simulation.nodes()) > 0):
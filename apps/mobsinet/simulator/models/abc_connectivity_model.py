@@ -3,10 +3,21 @@ from typing import  TYPE_CHECKING
 from .abc_model import AbcModel
 
 if (TYPE_CHECKING):
+    import numpy as np
     from .nodes.abc_node import AbcNode
 
 class AbcConnectivityModel(AbcModel):
 
+    # Whether `is_connected(a, b)` always equals `is_connected(b, a)` when
+    # both nodes use equivalent models. The connectivity engine then evaluates
+    # each unordered pair once and sets both directed edges, which also gives
+    # probabilistic models a single decision per pair.
+    symmetric: bool = False
+
+    # Whether the decisions depend only on the nodes, and not on chance, so
+    # that they can be precomputed in a contact plan.
+    deterministic: bool = False
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
 
@@ -21,3 +32,87 @@ class AbcConnectivityModel(AbcModel):
         node_b : AbcNode
             The second node.
         """
+
+    def is_connected_batch(self, nodes: list['AbcNode'], candidates: list['AbcNode']) -> 'np.ndarray | None':
+        """Check if each node is connected to each candidate at once.
+
+        The connectivity engine calls it when every node of the simulation
+        uses a connectivity model of the same type as this one. Each row must
+        be evaluated with the parameters of the connectivity model of its own
+        node. The values for a node paired with itself are ignored.
+
+        Models without a vectorized implementation return `None` (the
+        default) and are evaluated pair by pair with `is_connected`.
+
+        Parameters
+        ----------
+        nodes : list[AbcNode]
+            The nodes of the rows, whose models decide the connections.
+        candidates : list[AbcNode]
+            The nodes of the columns.
+
+        Returns
+        -------
+        np.ndarray | None
+            A boolean array of shape (len(nodes), len(candidates)) where the
+            element (i, j) is `True` if `nodes[i]` is connected to
+            `candidates[j]`, or `None` if the model is not vectorized.
+        """
+
+        return None
+
+    def prepare_node(self, node: 'AbcNode'):
+        """Precompute the data of the node that this model uses in every
+        evaluation and that does not change during the simulation.
+
+        It is called when the node is added to the simulation and when this
+        model is assigned to a node. Can be implemented by subclasses.
+
+        Parameters
+        ----------
+        node : AbcNode
+            The node that uses this connectivity model.
+        """
+
+    def release_node(self, node: 'AbcNode'):
+        """Forget the data precomputed by `prepare_node` for the node.
+
+        It is called when the node is removed from the simulation and when
+        another model is assigned to the node. Can be implemented by
+        subclasses.
+
+        Parameters
+        ----------
+        node : AbcNode
+            The node that used this connectivity model.
+        """
+
+    def is_symmetric_with(self, other: 'AbcConnectivityModel') -> bool:
+        """Check if a pair of nodes using this model and the other model can
+        be evaluated once for both directions.
+
+        By default, both models must be symmetric and of the same type.
+        Models with parameters must also compare them.
+
+        Parameters
+        ----------
+        other : AbcConnectivityModel
+            The connectivity model of the other node of the pair.
+        """
+
+        return self.symmetric and type(self) is type(other)
+
+    def get_max_radius(self) -> float | None:
+        """Return the distance beyond which this model never connects two nodes.
+
+        The connectivity engine uses it to size its spatial index and only
+        test nearby nodes. Models that are not range-limited must return
+        `None` (the default), which makes the engine test every pair of nodes.
+
+        Returns
+        -------
+        float | None
+            The maximum connection radius in unit of length, or `None`.
+        """
+
+        return None
@@ -1,12 +1,19 @@
 from abc import abstractmethod
-
+from typing import TYPE_CHECKING
 
 from ..tools.position import Position
 from .abc_model import AbcModel
 
+if TYPE_CHECKING:
+    from .nodes.abc_node import AbcNode
+
 
 class AbcMobilityModel(AbcModel):
 
+    # Whether the positions depend only on the node and the round, and not on
+    # chance, so that the connections can be precomputed in a contact plan.
+    deterministic: bool = False
+
     def __init__(self, name: str):
         super().__init__(name)
 
@@ -20,3 +27,40 @@ class AbcMobilityModel(AbcModel):
             The node object.
         """
 
+    def get_stationary_until(self, node: 'AbcNode') -> float:
+        """Return the first round in which the node may move again.
+
+        Called after the node moved in a round. In the rounds before the
+        returned one, the node is not moved and its `node_position_updated`
+        is not called. By default, the node may move in every round.
+
+        Parameters
+        ----------
+        node : AbcNode
+            The node object.
+
+        Returns
+        -------
+        float
+            The round, or `math.inf` if the node never moves again.
+        """
+
+        return 0
+
+    @classmethod
+    def step_batch(cls, nodes: list['AbcNode']):
+        """Move every node whose mobility model is exactly of this type, once.
+
+        Called in each round with all the nodes that use this model type.
+        Models can override it to advance every node at once with arrays.
+        By default, each node is moved with `get_next_position`.
+
+        Parameters
+        ----------
+        nodes : list[AbcNode]
+            The nodes to move.
+        """
+
+        for node in nodes:
+            node.set_position(node.mobility_model.get_next_position(node))
+
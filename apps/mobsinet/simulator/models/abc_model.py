@@ -2,6 +2,11 @@ from abc import ABC
 from copy import deepcopy
 
 class AbcModel(ABC):
+    # Whether the model keeps no state of its own for each node, so that a
+    # single instance can serve every node added in a batch. Models with
+    # setters meant to configure a single node must not be shareable, since
+    # the setters of a shared instance change it for all of its nodes.
+    shareable: bool = False
 
     def __init__(self, name: str):
         self.name = name
@@ -1,16 +1,142 @@
 from abc import ABC
 from copy import deepcopy
 
+
+def _read_only(container_name: str):
+    """Return a method that raises the error of a frozen container."""
+
+    def mutate(self, *args, **kwargs):
+        raise TypeError(
+            f'This {container_name} belongs to a frozen message, which may be shared by several packets. Modify a copy made with clone() instead.')
+
+    return mutate
+
+
+class _FrozenList(list):
+    """List of a frozen message, which cannot be modified. Its copies are
+    plain lists."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only('list')
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only(
+        'list')
+
+    def __deepcopy__(self, memo):
+        copy = memo[id(self)] = []
+        copy.extend(deepcopy(item, memo) for item in self)
+
+        return copy
+
+    def __reduce__(self):
+        return (_FrozenList, (list(self),))
+
+
+class _FrozenDict(dict):
+    """Dict of a frozen message, which cannot be modified. Its copies are
+    plain dicts."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only('dict')
+    clear = pop = popitem = setdefault = update = _read_only('dict')
+
+    def __deepcopy__(self, memo):
+        copy = memo[id(self)] = {}
+        copy.update((deepcopy(key, memo), deepcopy(value, memo))
+                    for key, value in self.items())
+
+        return copy
+
+    def __reduce__(self):
+        return (_FrozenDict, (dict(self),))
+
+
+class _FrozenSet(set):
+    """Set of a frozen message, which cannot be modified. Its copies are
+    plain sets."""
+
+    __ior__ = __iand__ = __isub__ = __ixor__ = _read_only('set')
+    add = discard = remove = pop = clear = update = _read_only('set')
+    intersection_update = difference_update = symmetric_difference_update = _read_only(
+        'set')
+
+    def __deepcopy__(self, memo):
+        return {deepcopy(item, memo) for item in self}
+
+    def __reduce__(self):
+        return (_FrozenSet, (set(self),))
+
+
+def _freeze(value, memo: dict):
+    """Return the value with its lists, dicts and sets, nested or not,
+    replaced by frozen ones, and freeze its messages in place. `memo` maps
+    the id of each value already frozen to its frozen version."""
+
+    frozen = memo.get(id(value))
+
+    if (frozen is not None):
+        return frozen
+
+    if (isinstance(value, AbcMessage)):
+        memo[id(value)] = value
+
+        for name, item in list(value.__dict__.items()):
+            value.__dict__[name] = _freeze(item, memo)
+
+        value.__dict__['_frozen'] = True
+
+        return value
+
+    if (isinstance(value, list)):
+        frozen = memo[id(value)] = _FrozenList()
+        list.extend(frozen, [_freeze(item, memo) for item in value])
+    elif (isinstance(value, dict)):
+        frozen = memo[id(value)] = _FrozenDict()
+        dict.update(frozen, {key: _freeze(item, memo)
+                    for key, item in value.items()})
+    elif (isinstance(value, tuple)):
+        frozen = tuple(_freeze(item, memo) for item in value)
+    elif (isinstance(value, set)):
+        frozen = _FrozenSet(value)
+    else:
+        frozen = value
+
+    return frozen
+
+
 class AbcMessage(ABC):
+    # Whether a broadcast of the message sends a single frozen copy to all
+    # the neighbors, instead of one copy for each of them. Messages that are
+    # only read by their receivers should enable it. The lists, dicts, sets
+    # and messages held by a frozen message are frozen too, but any other
+    # object it references is shared by the receivers and must not be
+    # modified.
+    shared_broadcast: bool = False
+
     def __init__(self):
         self.content: str = None
 
     def __str__(self):
         return self.content
 
+    def __setattr__(self, name, value):
+        if (self.__dict__.get('_frozen', False)):
+            raise AttributeError(
+                f'{type(self).__name__} is frozen, since it may be shared by several packets. Modify a copy made with clone() instead.')
+
+        super().__setattr__(name, value)
+
+    def __deepcopy__(self, memo):
+        # copies of frozen messages, nested or not, are not frozen
+        message = type(self).__new__(type(self))
+        memo[id(self)] = message
+        message.__dict__.update(deepcopy(self.__dict__, memo))
+        message.__dict__['_frozen'] = False
+
+        return message
+
     def clone(self):
         """Create a copy of the object.
 
+        The copy of a frozen message is not frozen, so it can be modified.
+
         Returns
         -------
         AbcMessage
@@ -18,3 +144,25 @@ class AbcMessage(ABC):
         """
         
         return deepcopy(self)
+
+    def frozen(self):
+        """Return a frozen copy of the object, which can be shared by several
+        packets since it cannot be modified, or the object itself if it is
+        already frozen. Its lists, dicts, sets and messages are frozen too.
+
+        Returns
+        -------
+        AbcMessage
+            The frozen message.
+        """
+
+        if (self.is_frozen()):
+            return self
+
+        # the clone is not shared yet, so it is frozen in place
+        return _freeze(self.clone(), {})
+
+    def is_frozen(self) -> bool:
+        """Return whether the object is frozen."""
+
+        return self.__dict__.get('_frozen', False)
@@ -1,4 +1,6 @@
 from typing import TYPE_CHECKING, Union
+from operator import attrgetter
+import numpy as np
 from abc import ABC, abstractmethod
 from ...tools.inbox_packet_buffer import InboxPacketBuffer
 from .packet import Packet
@@ -11,10 +13,13 @@ from ...tools.models_normalizer import ModelsNormalizer
 from ...tools.color import Color
 from ...configuration.sim_config import config
 from ...tools.packet_event import PacketEvent
+from ...tools.packet_event_log import SENT
+from ...tools.position import PositionView, coordinates_array, set_coordinates_array
 
 if TYPE_CHECKING:
     from .abc_timer import AbcTimer
     from ...tools.position import Position
+    from ...tools.position_store import PositionStore
     from ..abc_mobility_model import AbcMobilityModel
     from ..abc_connectivity_model import AbcConnectivityModel
     from ..abc_interference_model import AbcInterferenceModel
@@ -32,7 +37,7 @@ class AbcNode(ABC):
             interference_model: 'AbcInterferenceModel' = None,
             reliability_model: 'AbcReliabilityModel' = None):
         self.id = id
-        self.position: Position = position
+        self._position: Position = position
         self.mobility_model: AbcMobilityModel = mobility_model
         self.connectivity_model: AbcConnectivityModel = connectivity_model
         self.interference_model: AbcInterferenceModel = interference_model
@@ -54,10 +59,79 @@ class AbcNode(ABC):
     def __repr__(self) -> str:
         return self.__str__()
 
+    def __assign_position(self, position: 'Position'):
+        """(private) Sets the position of the node. Called when a position
+        is assigned to `position`."""
+
+        if (position is not self._position and
+                (self._position is None or position is None or self._position != position)):
+            simulation.connectivity_engine.mark_dirty(self)
+            simulation.neighbor_centroids.node_moved(self)
+
+        if (isinstance(self._position, PositionView) and position is not None):
+            if (position is not self._position):
+                self._position.set_coordinates(*position.get_coordinates())
+        else:
+            self._position = position
+
+    # the getter is a C function instead of a method, so reading the position
+    # of a node, which the connectivity models do for every pair of nodes,
+    # costs half as much as with a Python getter
+    position = property(attrgetter('_position'), __assign_position, doc="""The position of the node.
+
+        While the node is in the simulation, it is a view of the slot of the
+        node in the position store of the simulation, so it always has the
+        current coordinates of the node; use `copy()` to keep a previous
+        position. Assigning a position copies its coordinates into that slot
+        and, like `set_position`, marks the node to have its connections
+        re-evaluated.
+        """)
+
+    def attach_position_store(self, store: 'PositionStore'):
+        """Move the coordinates of the node into a slot of the store. Called
+        when the node is added to the simulation."""
+
+        if (self._position is not None):
+            self._position = store.add(self._position)
+
+    def detach_position_store(self):
+        """Release the slot of the node in its position store and keep a
+        plain copy of its position. Called when the node is removed from the
+        simulation."""
+
+        if (isinstance(self._position, PositionView)):
+            view = self._position
+            self._position = view.copy()
+            view.store.remove(view)
+
     def set_position(self, position: 'Position'):
         self.position = position
         self.node_position_updated()
 
+    @staticmethod
+    def set_positions(nodes: list['AbcNode'], coordinates: 'np.ndarray'):
+        """Set the positions of many nodes at once, as `set_position` does for
+        a single node.
+
+        Parameters
+        ----------
+        nodes : list[AbcNode]
+            The nodes to move.
+        coordinates : np.ndarray
+            Row i holds the new x, y and z coordinates of `nodes[i]`.
+        """
+
+        moved = np.any(coordinates_array(nodes) != coordinates, axis=1)
+
+        set_coordinates_array(nodes, coordinates)
+
+        for node, has_moved in zip(nodes, moved.tolist()):
+            if (has_moved):
+                simulation.connectivity_engine.mark_dirty(node)
+                simulation.neighbor_centroids.node_moved(node)
+
+            node.node_position_updated()
+
     def set_color(self, color: Color):
         self.node_color = color
 
@@ -66,9 +140,15 @@ class AbcNode(ABC):
 
     def set_mobility_model(self, mobility_model: 'AbcMobilityModel'):
         self.mobility_model = mobility_model
+        simulation.movement_scheduler.wake(self)
 
     def set_connectivity_model(self, connectivity_model: 'AbcConnectivityModel'):
+        if (self.connectivity_model is not None):
+            self.connectivity_model.release_node(self)
+
         self.connectivity_model = connectivity_model
+        connectivity_model.prepare_node(self)
+        simulation.connectivity_engine.mark_dirty(self)
 
     def set_interference_model(self, interference_model: 'AbcInterferenceModel'):
         self.interference_model = interference_model
@@ -108,7 +188,8 @@ class AbcNode(ABC):
         simulation.packets_in_the_air.add(packet)
 
     def send_direct(self, message: 'AbcMessage', destination: 'AbcNode'):
-        cloned_message = message.clone()
+        # frozen messages are shared instead of copied
+        cloned_message = message if message.is_frozen() else message.clone()
 
         if (cloned_message == None):
             raise Exception("Cloned message is None")
@@ -127,6 +208,9 @@ class AbcNode(ABC):
 
         Global.number_of_messages_in_this_round += 1
 
+        if (Global.packet_event_log is not None):
+            Global.packet_event_log.append(packet, SENT)
+
         if (Global.is_async_mode):
             simulation.event_queue.append(
                 PacketEvent(packet, Global.current_time + transmission_time)
@@ -149,12 +233,15 @@ class AbcNode(ABC):
 
         longest_packet = None
 
+        # a single frozen copy is sent to every neighbor
+        if (message.shared_broadcast):
+            message = message.frozen()
+
         neighbors = self.get_neighbors()
 
         for neighbor in neighbors:
             sent_packet = self.__send_message(
-                message, True, self, neighbor, intensity)
-            sent_packet.type = PacketType['MULTICAST']
+                message, True, self, neighbor, intensity, PacketType['MULTICAST'])
 
             simulation.packets_in_the_air.add(sent_packet, True)
 
@@ -165,22 +252,22 @@ class AbcNode(ABC):
             simulation.packets_in_the_air.upgrade_to_active(longest_packet)
         else:
             self_sent_packet = self.__send_message(
-                message, False, self, self, intensity)
-            self_sent_packet.type = PacketType['MULTICAST']
+                message, False, self, self, intensity, PacketType['MULTICAST'])
             self_sent_packet.deny_delivery()
             simulation.packets_in_the_air.add(self_sent_packet)
 
-    def __send_message(self, msg: 'AbcMessage', has_edge: bool, sender: 'AbcNode', destination: 'AbcNode', intensity: float):
+    def __send_message(self, msg: 'AbcMessage', has_edge: bool, sender: 'AbcNode', destination: 'AbcNode', intensity: float, packet_type: str = PacketType['UNICAST']):
         if (Global.is_async_mode):
-            return self.__asynchronousSending(msg, has_edge, sender, destination, intensity)
+            return self.__asynchronousSending(msg, has_edge, sender, destination, intensity, packet_type)
         else:
-            return self.__synchronousSending(msg, has_edge, sender, destination, intensity)
+            return self.__synchronousSending(msg, has_edge, sender, destination, intensity, packet_type)
 
-    def __synchronousSending(self, msg: 'AbcMessage', has_edge: bool, sender: 'AbcNode', destination: 'AbcNode', intensity: float):
+    def __synchronousSending(self, msg: 'AbcMessage', has_edge: bool, sender: 'AbcNode', destination: 'AbcNode', intensity: float, packet_type: str = PacketType['UNICAST']):
         if (not Global.is_running):
             return
 
-        cloned_message = msg.clone()
+        # frozen messages are shared instead of copied
+        cloned_message = msg if msg.is_frozen() else msg.clone()
 
         if (cloned_message == None):
             raise Exception("Cloned message is None")
@@ -194,7 +281,7 @@ class AbcNode(ABC):
         packet.origin = sender
         packet.destination = destination
         packet.intensity = intensity
-        packet.type = PacketType['UNICAST']
+        packet.type = packet_type
 
         if (has_edge):
             packet.positive_delivery = self.reliability_model.reaches_destination(
@@ -208,10 +295,14 @@ class AbcNode(ABC):
 
         Global.number_of_messages_in_this_round += 1
 
+        if (Global.packet_event_log is not None):
+            Global.packet_event_log.append(packet, SENT)
+
         return packet
 
-    def __asynchronousSending(self, msg: 'AbcMessage', has_edge: bool, sender: 'AbcNode', destination: 'AbcNode', intensity: float):
-        cloned_message = msg.clone()
+    def __asynchronousSending(self, msg: 'AbcMessage', has_edge: bool, sender: 'AbcNode', destination: 'AbcNode', intensity: float, packet_type: str = PacketType['UNICAST']):
+        # frozen messages are shared instead of copied
+        cloned_message = msg if msg.is_frozen() else msg.clone()
 
         if (cloned_message == None):
             raise Exception("Cloned message is None")
@@ -225,7 +316,7 @@ class AbcNode(ABC):
         packet.origin = sender
         packet.destination = destination
         packet.intensity = intensity
-        packet.type = PacketType['UNICAST']
+        packet.type = packet_type
 
         if (has_edge):
             packet.positive_delivery = self.reliability_model.reaches_destination(
@@ -237,12 +328,17 @@ class AbcNode(ABC):
 
         Global.number_of_messages_over_all += 1
 
+        if (Global.packet_event_log is not None):
+            Global.packet_event_log.append(packet, SENT)
+
         simulation.event_queue.append(
             PacketEvent(packet, Global.current_time + transmission_time))
 
         return packet
 
     def set_coordinates(self, x: int, y: int, z: int):
+        simulation.connectivity_engine.mark_dirty(self)
+        simulation.neighbor_centroids.node_moved(self)
         return self.position.set_coordinates(x, y, z)
 
     def node_position_updated(self):
@@ -12,6 +12,11 @@ from .configuration.sim_config import config
 from .global_vars import Global
 from .tools.color import Color
 from .tools.event_queue import EventQueue
+from .tools.connectivity_engine import ConnectivityEngine
+from .tools.position_store import PositionStore
+from .tools.neighbor_centroids import NeighborCentroids
+from .tools.movement_scheduler import MovementScheduler
+from .tools.trace_stream import TraceStream
 
 from .tools.models_normalizer import ModelsNormalizer
 from typing import Type, TYPE_CHECKING
@@ -19,6 +24,7 @@ from typing import Type, TYPE_CHECKING
 if TYPE_CHECKING:
     from .models.nodes.abc_node import AbcNode
     from .tools.event import Event
+    from .tools.replay import Replay
 
 
 class NetworkSimulator(object):
@@ -30,9 +36,17 @@ class NetworkSimulator(object):
         self.arrived_packets: list[Packet] = []
         self.running_thread = None
         self.event_queue: EventQueue = EventQueue()
+        self.connectivity_engine = ConnectivityEngine(self)
+        self.position_store = PositionStore()
+        self.neighbor_centroids = NeighborCentroids(self)
+        self.movement_scheduler = MovementScheduler()
+        # recorded simulation shown by `run` instead of running the models
+        self.replay: 'Replay' | None = None
 
     def reset(self):
         NetworkSimulator.last_node_id = 0
+        self.connectivity_engine.close()
+        TraceStream.close_shared()
         self.__init__()
 
     def nodes(self) -> list['AbcNode']:
@@ -133,15 +147,22 @@ class NetworkSimulator(object):
         node_constructor = ModelsNormalizer.normalize_node_constructor(
             node_constructor)
 
+        mobility = connectivity = interference = reliability = None
+
+        # shareable models are instantiated once for the whole batch
         for _ in range(num_nodes):
-            mobility = ModelsNormalizer.normalize_mobility_model(
-                mobility_model)
-            connectivity = ModelsNormalizer.normalize_connectivity_model(
-                connectivity_model)
-            interference = ModelsNormalizer.normalize_interference_model(
-                interference_model)
-            reliability = ModelsNormalizer.normalize_reliability_model(
-                reliability_model)
+            if (mobility is None or not mobility.shareable):
+                mobility = ModelsNormalizer.normalize_mobility_model(
+                    mobility_model)
+            if (connectivity is None or not connectivity.shareable):
+                connectivity = ModelsNormalizer.normalize_connectivity_model(
+                    connectivity_model)
+            if (interference is None or not interference.shareable):
+                interference = ModelsNormalizer.normalize_interference_model(
+                    interference_model)
+            if (reliability is None or not reliability.shareable):
+                reliability = ModelsNormalizer.normalize_reliability_model(
+                    reliability_model)
 
             node = node_constructor(
                 self._gen_node_id(),
@@ -174,6 +195,12 @@ class NetworkSimulator(object):
 
         if node not in self.nodes():
             self.graph.add_node(node)
+            node.attach_position_store(self.position_store)
+            if (node.connectivity_model is not None):
+                node.connectivity_model.prepare_node(node)
+            self.connectivity_engine.mark_dirty(node)
+            self.neighbor_centroids.node_added(node)
+            self.movement_scheduler.node_added(node)
             Global.custom_global.node_added_event(node)
         else:
             raise ValueError(
@@ -191,6 +218,10 @@ class NetworkSimulator(object):
         for n in self.nodes():
             if n.id == node_id:
                 self.graph.remove_node(n)
+                self.connectivity_engine.node_removed(n)
+                self.neighbor_centroids.node_removed(n)
+                self.movement_scheduler.node_removed(n)
+                n.detach_position_store()
                 Global.custom_global.node_removed_event(n)
                 break
         else:
@@ -202,6 +233,10 @@ class NetworkSimulator(object):
 
         for n in self.nodes():
             self.graph.remove_node(n)
+            self.connectivity_engine.node_removed(n)
+            self.neighbor_centroids.node_removed(n)
+            self.movement_scheduler.node_removed(n)
+            n.detach_position_store()
             Global.custom_global.node_removed_event(n)
 
     def add_edge(self, node_from: 'AbcNode', node_to: 'AbcNode'):
@@ -217,6 +252,19 @@ class NetworkSimulator(object):
 
         # TODO: Criar EdgeImplementation (talvez)
         self.graph.add_edge(node_from, node_to, number_of_packets=0)
+        self.neighbor_centroids.edges_changed([(node_from, node_to)])
+
+    def add_edges(self, edges: list[tuple['AbcNode', 'AbcNode']]):
+        """Add the edges to the network graph at once.
+
+        Parameters
+        ----------
+        edges : list[tuple[AbcNode, AbcNode]]
+            The edges to add, as (source node, destination node) pairs.
+        """
+
+        self.graph.add_edges_from(edges, number_of_packets=0)
+        self.neighbor_centroids.edges_changed(edges)
 
     def add_bi_directional_edge(self, node1: 'AbcNode', node2: 'AbcNode'):
         """Add a bi-directional edge between two nodes in the network graph."""
@@ -236,6 +284,19 @@ class NetworkSimulator(object):
         """
 
         self.graph.remove_edge(node_from, node_to)
+        self.neighbor_centroids.edges_changed([(node_from, node_to)])
+
+    def remove_edges(self, edges: list[tuple['AbcNode', 'AbcNode']]):
+        """Remove the edges from the network graph at once.
+
+        Parameters
+        ----------
+        edges : list[tuple[AbcNode, AbcNode]]
+            The edges to remove, as (source node, destination node) pairs.
+        """
+
+        self.graph.remove_edges_from(edges)
+        self.neighbor_centroids.edges_changed(edges)
 
     def remove_bi_directional_edge(self, node1: 'AbcNode', node2: 'AbcNode'):
         """Remove a bi-directional edge between two nodes in the network graph."""
@@ -261,11 +322,15 @@ class NetworkSimulator(object):
     def run(self, rounds=config.simulation_rounds, refresh_rate: float = config.simulation_refresh_rate):
         from .synchronous_thread import SynchronousThread
         from .asynchronous_thread import AsynchronousThread
+        from .replay_thread import ReplayThread
 
         if Global.is_running:
             return
 
-        if Global.is_async_mode:
+        if (self.replay is not None):
+            self.running_thread = ReplayThread(
+                self.replay, rounds, refresh_rate)
+        elif Global.is_async_mode:
             self.running_thread = AsynchronousThread(
                 rounds, refresh_rate)
         else:
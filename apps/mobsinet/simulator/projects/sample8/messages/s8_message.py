@@ -3,6 +3,9 @@ from ....tools.color import Color
 
 
 class S8Message(AbcMessage):
+    # only read by the nodes, which forward the received message as is
+    shared_broadcast = True
+
     def __init__(self):
         # TODO: verificar se o método clone funciona se tiver outras variáveis
 
@@ -1,58 +1,131 @@
+import numpy as np
 from ....models.abc_connectivity_model import AbcConnectivityModel
 from ..nodes.s9_node import S9Node
 
+# Commands of the hierarchy. Any other command has the role UNKNOWN_ROLE.
+ROLES = ['Head Quarter',
+         'Battalion Commander',
+         'Deputy Battalion Commander',
+         'Company Commander',
+         'Deputy Company Commander',
+         'Platoon Leader',
+         'Deputy Platoon Leader',
+         '']
+UNKNOWN_ROLE = len(ROLES)
+
+# Qualifiers of a connection between two roles.
+NEVER = 0
+ALWAYS = 1
+SAME_COMPANY = 2
+SAME_PLATOON = 3  # same company and same platoon
+
+# Connections of the hierarchy, which hold in both directions.
+RULES = [('Head Quarter', 'Head Quarter', ALWAYS),
+         ('Battalion Commander', 'Head Quarter', ALWAYS),
+         ('Deputy Battalion Commander', 'Battalion Commander', ALWAYS),
+         ('Company Commander', 'Deputy Battalion Commander', ALWAYS),
+         ('Company Commander', 'Battalion Commander', ALWAYS),
+         ('Deputy Company Commander', 'Company Commander', SAME_COMPANY),
+         ('Platoon Leader', 'Deputy Company Commander', SAME_COMPANY),
+         ('Platoon Leader', 'Company Commander', SAME_COMPANY),
+         ('Deputy Platoon Leader', 'Platoon Leader', SAME_PLATOON),
+         ('', 'Deputy Platoon Leader', SAME_PLATOON),
+         ('', 'Platoon Leader', SAME_PLATOON)]
+
+# RULE_TABLE[role_a, role_b] is the qualifier of the pair of roles.
+RULE_TABLE = np.full((len(ROLES) + 1, len(ROLES) + 1), NEVER, dtype=np.int8)
+for role_a, role_b, qualifier in RULES:
+    RULE_TABLE[ROLES.index(role_a), ROLES.index(role_b)] = qualifier
+    RULE_TABLE[ROLES.index(role_b), ROLES.index(role_a)] = qualifier
+
 
 class HierarchyConnectivity(AbcConnectivityModel):
+    symmetric = True
+    deterministic = True
+    shareable = True
+
     def __init__(self):
         super().__init__('HierarchyConnectivity')
 
+        # (role, company_id, platoon_id) of each prepared node
+        self.__roles: dict[S9Node, tuple[int, int, int]] = {}
+
+    def prepare_node(self, node: 'S9Node'):
+        """Compute the role code of the node, since the hierarchy does not
+        change during the simulation."""
+
+        if (not isinstance(node, S9Node)):
+            return
+
+        self.__roles[node] = self.__compute_role(node)
+
+    def release_node(self, node: 'S9Node'):
+        """Forget the role code of the node."""
+
+        self.__roles.pop(node, None)
+
     def is_connected(self, node_a: 'S9Node', node_b: 'S9Node'):
         if (not isinstance(node_a, S9Node) or not isinstance(node_b, S9Node)):
             return False
 
-        if (node_a.command == 'Head Quarter' and node_b.command == 'Head Quarter'):
-            return True
-        if (node_a.command == 'Battalion Commander' and node_b.command == 'Head Quarter'):
-            return True
-        if (node_a.command == 'Head Quarter' and node_b.command == 'Battalion Commander'):
-            return True
-        if (node_a.command == 'Deputy Battalion Commander' and node_b.command == 'Battalion Commander'):
-            return True
-        if (node_a.command == 'Battalion Commander' and node_b.command == 'Deputy Battalion Commander'):
-            return True
-        if (node_a.command == 'Company Commander' and node_b.command == 'Deputy Battalion Commander'):
-            return True
-        if (node_a.command == 'Deputy Battalion Commander' and node_b.command == 'Company Commander'):
-            return True
-        if (node_a.command == 'Company Commander' and node_b.command == 'Battalion Commander'):
-            return True
-        if (node_a.command == 'Battalion Commander' and node_b.command == 'Company Commander'):
-            return True
-        if (node_a.command == 'Deputy Company Commander' and node_b.command == 'Company Commander' and node_a.company_id == node_b.company_id):
-            return True
-        if (node_a.command == 'Company Commander' and node_b.command == 'Deputy Company Commander' and node_a.company_id == node_b.company_id):
-            return True
-        if (node_a.command == 'Platoon Leader' and node_b.command == 'Deputy Company Commander' and node_a.company_id == node_b.company_id):
-            return True
-        if (node_a.command == 'Deputy Company Commander' and node_b.command == 'Platoon Leader' and node_a.company_id == node_b.company_id):
-            return True
-        if (node_a.command == 'Platoon Leader' and node_b.command == 'Company Commander' and node_a.company_id == node_b.company_id):
-            return True
-        if (node_a.command == 'Company Commander' and node_b.command == 'Platoon Leader' and node_a.company_id == node_b.company_id):
-            return True
-        if (node_a.command == 'Deputy Platoon Leader' and node_b.command == 'Platoon Leader' and node_a.company_id == node_b.company_id and node_a.platoon_id == node_b.platoon_id):
-            return True
-        if (node_a.command == 'Platoon Leader' and node_b.command == 'Deputy Platoon Leader' and node_a.company_id == node_b.company_id and node_a.platoon_id == node_b.platoon_id):
-            return True
-        if (node_a.command == '' and node_b.command == 'Deputy Platoon Leader' and node_a.company_id == node_b.company_id and node_a.platoon_id == node_b.platoon_id):
-            return True
-        if (node_a.command == 'Deputy Platoon Leader' and node_b.command == '' and node_a.company_id == node_b.company_id and node_a.platoon_id == node_b.platoon_id):
-            return True
-        if (node_a.command == '' and node_b.command == 'Platoon Leader' and node_a.company_id == node_b.company_id and node_a.platoon_id == node_b.platoon_id):
-            return True
-        if (node_a.command == 'Platoon Leader' and node_b.command == '' and node_a.company_id == node_b.company_id and node_a.platoon_id == node_b.platoon_id):
+        role_a, company_a, platoon_a = self.__role_of(node_a)
+        role_b, company_b, platoon_b = self.__role_of(node_b)
+        qualifier = RULE_TABLE[role_a, role_b]
+
+        if (qualifier == ALWAYS):
             return True
+        if (qualifier == SAME_COMPANY):
+            return company_a == company_b
+        if (qualifier == SAME_PLATOON):
+            return company_a == company_b and platoon_a == platoon_b
         return False
 
+    def is_connected_batch(self, nodes: list['S9Node'], candidates: list['S9Node']) -> np.ndarray:
+        """Check if each node is connected to each candidate at once."""
+
+        role_a, company_a, platoon_a = self.__role_arrays(nodes)
+        role_b, company_b, platoon_b = self.__role_arrays(candidates)
+
+        qualifier = RULE_TABLE[role_a[:, np.newaxis], role_b[np.newaxis, :]]
+        same_company = company_a[:, np.newaxis] == company_b[np.newaxis, :]
+        same_platoon = same_company & (
+            platoon_a[:, np.newaxis] == platoon_b[np.newaxis, :])
+
+        return (qualifier == ALWAYS) | \
+            ((qualifier == SAME_COMPANY) & same_company) | \
+            ((qualifier == SAME_PLATOON) & same_platoon)
+
+    def __role_of(self, node: 'S9Node') -> tuple[int, int, int]:
+        """(private) Returns the role, company and platoon of the node,
+        computing them if the node was not prepared by this model."""
+
+        role = self.__roles.get(node)
+
+        if (role is None):
+            role = self.__compute_role(node)
+
+        return role
+
+    def __compute_role(self, node: 'S9Node') -> tuple[int, int, int]:
+        """(private) Computes the role code, company and platoon of the
+        node."""
+
+        role = ROLES.index(
+            node.command) if node.command in ROLES else UNKNOWN_ROLE
+
+        return (role, node.company_id, node.platoon_id)
+
+    def __role_arrays(self, nodes: list['S9Node']) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(private) Returns the roles, companies and platoons of the nodes as
+        arrays. Nodes that are not S9 nodes get the unknown role."""
+
+        roles = [self.__role_of(node) if isinstance(node, S9Node)
+                 else (UNKNOWN_ROLE, -1, -1) for node in nodes]
+
+        if (len(roles) == 0):
+            return (np.zeros(0, dtype=np.intp),) * 3
+
+        return tuple(np.array(column) for column in zip(*roles))
+
 
 model = HierarchyConnectivity
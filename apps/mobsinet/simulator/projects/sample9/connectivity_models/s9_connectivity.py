@@ -1,24 +1,49 @@
 from ....models.abc_connectivity_model import AbcConnectivityModel
+from ....tools.position import coordinates_array
 from ..nodes.s9_node import S9Node
+import numpy as np
 import random
 
+# VHF radio range: a pair is connected within a random distance drawn
+# uniformly between these bounds.
+MIN_RADIO_RANGE = 5000
+MAX_RADIO_RANGE = 74000
+
 
 class S9Connectivity(AbcConnectivityModel):
+    symmetric = True
+    shareable = True
+
     def __init__(self):
         super().__init__('S9Connectivity')
 
+        # bit of each communication channel, in order of appearance
+        self.__channel_bits: dict[str, int] = {}
+        # bitmask of the communication channels of each prepared node
+        self.__channel_masks: dict[S9Node, int] = {}
+
+    def prepare_node(self, node: 'S9Node'):
+        """Compute the bitmask of the communication channels of the node."""
+
+        if (not isinstance(node, S9Node)):
+            return
+
+        self.__channel_masks[node] = self.__compute_mask(node)
+
+    def release_node(self, node: 'S9Node'):
+        """Forget the channel bitmask of the node."""
+
+        self.__channel_masks.pop(node, None)
+
     def is_connected(self, node_a: 'S9Node', node_b: 'S9Node'):
         if (not isinstance(node_a, S9Node) or not isinstance(node_b, S9Node)):
             return False
 
-        a_channels = set(node_a.comm_channels)
-        b_channels = set(node_b.comm_channels)
-
-        if (a_channels.isdisjoint(b_channels)):
+        if (self.__channel_mask(node_a) & self.__channel_mask(node_b) == 0):
             return False
 
         # Check distance for VHF radio distance
-        if (node_a.position.euclidean_distance(node_b.position) <= random.random() * 69000 + 5000):
+        if (node_a.position.euclidean_distance(node_b.position) <= random.random() * (MAX_RADIO_RANGE - MIN_RADIO_RANGE) + MIN_RADIO_RANGE):
             return True
 
         # if (node_a.position.euclidean_distance(node_b.position) <= 2000):
@@ -26,5 +51,76 @@ class S9Connectivity(AbcConnectivityModel):
 
         return False
 
+    def is_connected_batch(self, nodes: list['S9Node'], candidates: list['S9Node']) -> np.ndarray | None:
+        """Check if each node is connected to each candidate at once.
+
+        Only the pairs that share a channel have their distance computed.
+        Returns `None` if there are too many channels for a 64-bit mask.
+        """
+
+        masks_a = self.__masks(nodes)
+        masks_b = self.__masks(candidates)
+
+        # computing the masks of nodes that were not prepared may have given
+        # bits to new channels
+        if (len(self.__channel_bits) > 64):
+            return None
+
+        masks_a = np.array(masks_a, dtype=np.uint64)
+        masks_b = np.array(masks_b, dtype=np.uint64)
+        connected = (masks_a[:, np.newaxis] & masks_b[np.newaxis, :]) != 0
+
+        rows, columns = np.nonzero(connected)
+
+        if (len(rows) == 0):
+            return connected
+
+        coordinates_a = coordinates_array(nodes)
+        coordinates_b = coordinates_array(candidates)
+        distances = np.sqrt(
+            ((coordinates_a[rows] - coordinates_b[columns]) ** 2).sum(axis=1))
+        ranges = np.random.random(len(rows)) * \
+            (MAX_RADIO_RANGE - MIN_RADIO_RANGE) + MIN_RADIO_RANGE
+
+        connected[rows, columns] = distances <= ranges
+
+        return connected
+
+    def get_max_radius(self) -> float | None:
+        """Return the largest VHF radio range."""
+
+        return MAX_RADIO_RANGE
+
+    def __channel_mask(self, node: 'S9Node') -> int:
+        """(private) Returns the channel bitmask of the node, computing it if
+        the node was not prepared by this model."""
+
+        mask = self.__channel_masks.get(node)
+
+        if (mask is None):
+            mask = self.__compute_mask(node)
+
+        return mask
+
+    def __compute_mask(self, node: 'S9Node') -> int:
+        """(private) Computes the channel bitmask of the node, giving the next
+        bit to each channel that was not seen yet."""
+
+        mask = 0
+
+        for channel in node.comm_channels:
+            bit = self.__channel_bits.setdefault(
+                channel, len(self.__channel_bits))
+            mask |= 1 << bit
+
+        return mask
+
+    def __masks(self, nodes: list['S9Node']) -> list[int]:
+        """(private) Returns the channel bitmasks of the nodes. Nodes that
+        are not S9 nodes have no channel."""
+
+        return [self.__channel_mask(node) if isinstance(node, S9Node) else 0
+                for node in nodes]
+
 
 model = S9Connectivity
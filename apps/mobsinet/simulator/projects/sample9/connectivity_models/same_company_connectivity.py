@@ -3,6 +3,10 @@ from ..nodes.s9_node import S9Node
 
 
 class SameCompanyConnectivity(AbcConnectivityModel):
+    symmetric = True
+    deterministic = True
+    shareable = True
+
     def __init__(self):
         super().__init__('SameCompanyConnectivity')
 
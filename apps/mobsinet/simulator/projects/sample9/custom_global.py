@@ -30,6 +30,9 @@ class CustomGlobal(AbcCustomGlobal):
                 comm_lines = [list(filter(lambda x: x != '', line.strip().split(',')[0:35]))
                               for line in channels_f.readlines()]
 
+                mobility_model = connectivy_model = None
+                reliability_model = interference_model = None
+
                 for line in lines[:]:
                     vehicle_id = int(line[0])
                     company_id = int(line[1])
@@ -41,16 +44,22 @@ class CustomGlobal(AbcCustomGlobal):
                     command = line[7]
                     comm_channels = comm_lines[vehicle_id - 1]
                     position = distribution_model.get_position()
-                    mobility_model = FromTrace2DInMemoryMobility()
-                    mobility_model.set_lat_long(True)
-                    mobility_model.load_trace(
-                        'apps/mobsinet/simulator/projects/sample9/filtered_anglova.csv')
-                    connectivy_model = ModelsNormalizer.normalize_connectivity_model(
-                        config.connectivity_model)
-                    reliability_model = ModelsNormalizer.normalize_reliability_model(
-                        config.reliability_model)
-                    interference_model = ModelsNormalizer.normalize_interference_model(
-                        config.interference_model)
+
+                    # shareable models are instantiated once for all vehicles
+                    if (mobility_model is None or not mobility_model.shareable):
+                        mobility_model = FromTrace2DInMemoryMobility()
+                        mobility_model.set_lat_long(True)
+                        mobility_model.load_trace(
+                            'apps/mobsinet/simulator/projects/sample9/filtered_anglova.csv')
+                    if (connectivy_model is None or not connectivy_model.shareable):
+                        connectivy_model = ModelsNormalizer.normalize_connectivity_model(
+                            config.connectivity_model)
+                    if (reliability_model is None or not reliability_model.shareable):
+                        reliability_model = ModelsNormalizer.normalize_reliability_model(
+                            config.reliability_model)
+                    if (interference_model is None or not interference_model.shareable):
+                        interference_model = ModelsNormalizer.normalize_interference_model(
+                            config.interference_model)
 
                     if (company_type == 'Tank'):
                         node = TankNode(vehicle_id, company_id, platoon_id,
@@ -17,15 +17,9 @@ class MidPointOfOthers(AbcMobilityModel):
         ) * (radius_range[1] - radius_range[0]) + radius_range[0]
 
     def get_next_position(self, node):
-        midpoint = [0, 0]
-        nodes = list(filter(lambda n: n.id != node.id, simulation.nodes()))
-
-        for n in nodes:
-            midpoint[0] += n.position.x
-            midpoint[1] += n.position.y
-
-        midpoint[0] /= len(nodes)
-        midpoint[1] /= len(nodes)
+        centroid = simulation.neighbor_centroids.centroid_of_others(
+            node) or node.position
+        midpoint = [centroid.x, centroid.y]
 
         coordinates = [
             midpoint[0] + self.__radius * cos(self.__direction),
@@ -1,4 +1,5 @@
 from ....configuration.sim_config import config
+from ....global_vars import Global
 from ....models.abc_mobility_model import AbcMobilityModel
 from ....models.nodes.abc_node import AbcNode
 from ....tools.position import Position
@@ -14,7 +15,8 @@ class MidpointWaypoint(AbcMobilityModel):
 
         self._next_destination = None
         self._move_vector = None
-        self._remaining_waiting_time = 0
+        # first round in which the node moves again after a waypoint
+        self._waiting_until = 0
         self._remaining_moves = 0
         self._waypoint_radius_range = config.mobility_model_parameters.get(
             'waypoint_radius_range', [0, 200])
@@ -40,8 +42,7 @@ class MidpointWaypoint(AbcMobilityModel):
         current_position = node.position
         next_position = None
 
-        if (self._remaining_waiting_time > 0):
-            self._remaining_waiting_time -= 1
+        if (Global.current_time < self._waiting_until):
             return current_position
 
         if (self._remaining_moves == 0):
@@ -64,8 +65,8 @@ class MidpointWaypoint(AbcMobilityModel):
 
         if (self._remaining_moves <= 1):
             next_position = self.next_destination.copy()
-            self._remaining_waiting_time = randint(
-                self.waiting_time_range[0], self.waiting_time_range[1])
+            self._waiting_until = Global.current_time + randint(
+                self.waiting_time_range[0], self.waiting_time_range[1]) + 1
             self._remaining_moves = 0
         else:
             next_position = Position(
@@ -77,28 +78,29 @@ class MidpointWaypoint(AbcMobilityModel):
 
         return next_position
 
+    def get_stationary_until(self, node: 'AbcNode') -> float:
+        """The node stays at the waypoint it reached until the end of its
+        waiting time."""
+
+        return self._waiting_until
+
     def get_next_waypoint(self, node: 'AbcNode') -> Position:
         """Get the midpoint of other nodes as a waypoint.
 
+        The midpoint of the neighbors of the node is used, or the midpoint of
+        every other node if it has no neighbor. Both are kept up to date by
+        `simulation.neighbor_centroids`.
+
         Returns
         -------
         Position
             The midpoint of other nodes.
         """
 
-        midpoint = [0, 0]
-        other_nodes = list(
-            filter(lambda n: n.id != node.id and (simulation.has_edge(node, n) or simulation.has_edge(n, node)), simulation.nodes()))
-
-        other_nodes = other_nodes if len(other_nodes) > 0 else list(
-            filter(lambda n: n.id != node.id, simulation.nodes()))
-
-        for n in other_nodes:
-            midpoint[0] += n.position.x
-            midpoint[1] += n.position.y
-
-        midpoint[0] /= len(other_nodes)
-        midpoint[1] /= len(other_nodes)
+        centroid = simulation.neighbor_centroids.centroid_of(node) or \
+            simulation.neighbor_centroids.centroid_of_others(node) or \
+            node.position
+        midpoint = [centroid.x, centroid.y]
 
         rand_radius = random() * \
             (self._waypoint_radius_range[1] - self._waypoint_radius_range[0]
@@ -0,0 +1,43 @@
+from threading import Thread
+from .global_vars import Global
+from .network_simulator import simulation
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .tools.replay import Replay
+
+
+class ReplayThread(Thread):
+    """Shows the rounds of a replay one after the other, as
+    `SynchronousThread` runs the rounds of a simulation."""
+
+    def __init__(self, replay: 'Replay', number_of_rounds: int = 0, refresh_rate: float = 0):
+        super().__init__()
+        self.replay = replay
+        self.number_of_rounds = number_of_rounds
+        self.refresh_rate = refresh_rate    # rounds shown per second, 0 for no limit
+        self.__should_stop = False
+
+    def stop(self):
+        self.__should_stop = True
+        simulation.running_thread = None
+
+    def run(self):
+        self.__should_stop = False
+        Global.is_running = True
+
+        ts = time.time()
+        for _ in range(self.number_of_rounds):
+            if (self.refresh_rate != 0):
+                slept_time = 1/self.refresh_rate - (time.time() - ts)
+                time.sleep(slept_time if slept_time > 0 else 0)
+
+            ts = time.time()
+            if (Global.is_running == False or self.__should_stop):
+                break
+
+            if (not self.replay.step()):
+                break
+
+        Global.is_running = False
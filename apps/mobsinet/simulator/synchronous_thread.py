@@ -7,16 +7,25 @@ from .models.nodes.abc_node import AbcNode
 from .network_simulator import simulation
 import time
 from .configuration.sim_config import config
+from .tools.contact_plan import ContactPlan, ContactRecorder
+from .tools.trace_writer import TraceWriter, DeltaTraceWriter
+from .tools.packet_event_log import PacketEventLog
+import numpy as np
 
 
 class SynchronousThread(Thread):
     tracefile_suffix = ''
+    # writer of the trace file, kept open from one run to the next
+    trace_writer: TraceWriter | None = None
+    # edges changed in each round, saved with the trace for replays
+    contact_recorder: ContactRecorder | None = None
 
     def __init__(self, number_of_rounds: int = 0, refresh_rate: float = 0):
         super().__init__()
         self.number_of_rounds = number_of_rounds
         self.refresh_rate = refresh_rate    # Taxa de atualização da GUI
         self.__should_stop = False  # Controle local para parar a thread
+        self.__contact_plan: ContactPlan | None = None
 
     def stop(self):
         self.__should_stop = True
@@ -31,6 +40,11 @@ class SynchronousThread(Thread):
         Global.is_running = True
         Global.start_time = datetime.now()
 
+        if (config.contact_plan):
+            self.__contact_plan = ContactPlan.load(config.contact_plan)
+
+        PacketEventLog.open_configured()
+
         ts = time.time()
         for i in range(self.number_of_rounds):
             if (self.refresh_rate != 0):
@@ -59,6 +73,17 @@ class SynchronousThread(Thread):
             if (Global.custom_global.has_terminated()):
                 break
 
+        # the trace is complete on disk when the run ends
+        if (SynchronousThread.trace_writer is not None):
+            SynchronousThread.trace_writer.flush()
+
+        if (SynchronousThread.contact_recorder is not None):
+            SynchronousThread.contact_recorder.plan().save(
+                f'traces/{config.simulation_name+SynchronousThread.tracefile_suffix}.contacts.npz')
+
+        if (Global.packet_event_log is not None):
+            Global.packet_event_log.close()
+
         Global.is_running = False
 
     def __round(self):
@@ -67,13 +92,30 @@ class SynchronousThread(Thread):
         # ttimers = time.time()
         Global.custom_global.handle_global_timers()
         # print('Time to handle global timers: ', time.time() - ttimers)
-        # tmove = time.time()
-        self.__move_nodes()
-        # print('Time to move nodes: ', time.time() - tmove)
-        # tconn = time.time()
-        if (config.connectivity_enabled):
-            self.__update_connections()
-        # print('Time to update connections: ', time.time() - tconn)
+        if (Global.current_time == 1):
+            SynchronousThread.contact_recorder = ContactRecorder(
+                simulation) if config.save_contacts else None
+
+        edges_changed = True
+
+        if (self.__contact_plan is not None):
+            self.__replay_contact_plan()
+        else:
+            # tmove = time.time()
+            self.__move_nodes()
+            # print('Time to move nodes: ', time.time() - tmove)
+            # tconn = time.time()
+            if (config.connectivity_enabled):
+                self.__update_connections()
+            else:
+                edges_changed = False
+            # print('Time to update connections: ', time.time() - tconn)
+
+        if (SynchronousThread.contact_recorder is not None):
+            engine = simulation.connectivity_engine
+            SynchronousThread.contact_recorder.record_round(
+                engine.last_added_edges if edges_changed else [],
+                engine.last_removed_edges if edges_changed else [])
         # tinterf = time.time()
         simulation.packets_in_the_air.test_interference()
         # print('Time to test interference: ', time.time() - tinterf)
@@ -85,70 +127,69 @@ class SynchronousThread(Thread):
         """(private) Moves the nodes in the network graph."""
 
         if (config.save_trace and Global.current_time == 1):
-            tracefile = open(
-                f'traces/{config.simulation_name+SynchronousThread.tracefile_suffix}.csv', 'w')
-            tracefile.write('time,x,y,id\n')
+            # a new trace starts with the initial positions
+            self.__write_trace(Global.current_time - 1, new_file=True)
 
-            for node in simulation.nodes():
-                tracefile.write(
-                    f'{Global.current_time - 1},{node.position.x},{node.position.y},{node.id}\n')
+        # stationary nodes are skipped until their mobility model wakes them
+        movers = simulation.movement_scheduler.movers(Global.current_time)
+        nodes_by_model_type: dict[type, list['AbcNode']] = {}
 
-            tracefile.close()
+        for node in movers:
+            nodes_by_model_type.setdefault(
+                type(node.mobility_model), []).append(node)
 
-        tracefile = open(f"traces/{config.simulation_name+SynchronousThread.tracefile_suffix}.csv",
-                         "a") if config.save_trace else None
+        # move the nodes of each mobility model type at once
+        for model_type, model_nodes in nodes_by_model_type.items():
+            model_type.step_batch(model_nodes)
 
-        for node in simulation.nodes():
-            node: 'AbcNode'
+        simulation.movement_scheduler.moved(movers, Global.current_time)
+
+        if (config.save_trace):
+            self.__write_trace(Global.current_time)
 
-            # move the node
-            node.set_position(node.mobility_model.get_next_position(node))
+    def __write_trace(self, time: int, new_file: bool = False):
+        """(private) Queues the positions of the nodes at the time to the
+        trace file, opening it if needed."""
 
-            if tracefile:
-                tracefile.write(str(Global.current_time) + "," + str(node.position.x) + "," + str(
-                    node.position.y) + "," + str(node.id) + "\n")
+        filename = f'traces/{config.simulation_name+SynchronousThread.tracefile_suffix}.{config.trace_format}'
+        writer = SynchronousThread.trace_writer
 
-        if tracefile:
-            tracefile.close()
+        if (writer is None or new_file or writer.filename != filename):
+            if (writer is not None):
+                writer.close()
+
+            writer_type = DeltaTraceWriter if config.trace_format == 'npz' else TraceWriter
+            writer = writer_type(filename, append=not new_file)
+            SynchronousThread.trace_writer = writer
+
+        nodes = simulation.nodes()
+        slots = np.fromiter((node.position.slot for node in nodes),
+                            dtype=np.intp, count=len(nodes))
+        store = simulation.position_store
+
+        writer.write(time, [node.id for node in nodes],
+                     store.x[slots], store.y[slots])
 
     def __update_connections(self):
         """(private) Updates the connections in the network graph."""
 
-        # TODO: Criar logging para conexão
-        for node in simulation.nodes():
-            node: 'AbcNode'
+        simulation.connectivity_engine.update_connections()
+
+    def __replay_contact_plan(self):
+        """(private) Applies the edges of the current round from the contact
+        plan, instead of moving the nodes and evaluating their connections.
+        In the first round, the nodes are moved back to their positions before
+        the first round of the plan; they then keep them."""
+
+        nodes_by_id = {node.id: node for node in simulation.nodes()}
+
+        if (Global.current_time == 1):
+            self.__contact_plan.restore_positions(nodes_by_id)
+        added_edges, removed_edges = self.__contact_plan.edges_of(
+            Global.current_time, nodes_by_id)
 
-            # reset neighboorhood_changed flag
-            node.neighborhood_changed = False
-            connections = 0
-            disconnections = 0
-
-            # update the connections
-            for possible_neighbor in simulation.nodes():
-                possible_neighbor: 'AbcNode'
-
-                if possible_neighbor == node:
-                    continue
-
-                is_connected = node.connectivity_model.is_connected(
-                    node, possible_neighbor)
-                has_edge = simulation.has_edge(node, possible_neighbor)
-
-                if (is_connected and not has_edge):
-                    simulation.add_edge(node, possible_neighbor)
-                    node.neighborhood_changed = True
-                    connections += 1
-
-                elif (not is_connected and has_edge):
-                    simulation.remove_edge(node, possible_neighbor)
-                    simulation.packets_in_the_air.denyFromEdge(
-                        node, possible_neighbor)
-                    node.neighborhood_changed = True
-                    disconnections += 1
-
-            if node.neighborhood_changed:
-                Global.round_logs.append(
-                    f'Node {node.id} had {connections} connections and {disconnections} disconnections')
+        simulation.connectivity_engine.apply_edge_changes(
+            added_edges, removed_edges)
 
     def __step_nodes(self):
         """(private) Performs a step for each node in the network graph."""
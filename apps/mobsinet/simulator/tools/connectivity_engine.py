@@ -0,0 +1,504 @@
+import numpy as np
+from .spatial_grid import SpatialGrid
+from .kd_tree_index import KDTreeIndex
+from .parallel_connectivity import ParallelConnectivity
+from ..global_vars import Global
+from ..configuration.sim_config import config
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..network_simulator import NetworkSimulator
+    from ..models.nodes.abc_node import AbcNode
+
+
+class ConnectivityEngine:
+    """Evaluates the connectivity models of the nodes and keeps the edges of
+    the simulation graph up to date.
+
+    Nodes whose connectivity model is `deterministic` only have the pairs
+    that involve them evaluated while they are dirty. A node becomes dirty
+    when it is added to the simulation, when its coordinates change or when
+    its connectivity model is replaced. Nodes whose model depends on chance,
+    or on anything but the positions, are evaluated every round.
+    """
+
+    # Number of rows evaluated per call of `is_connected_batch`, which bounds
+    # the size of the temporary arrays of the vectorized models.
+    batch_rows = 256
+    # Minimum number of pairs for which the pairwise evaluation is split
+    # between worker processes, below which forking does not pay off.
+    min_parallel_pairs = 20000
+
+    def __init__(self, simulation: 'NetworkSimulator'):
+        self.simulation = simulation
+        self.spatial_grid = SpatialGrid()
+        self.kd_tree_index = KDTreeIndex()
+        self.parallel_connectivity = ParallelConnectivity()
+        self.dirty_nodes: set['AbcNode'] = set()
+        # edges added and removed by the last update
+        self.last_added_edges: list[tuple['AbcNode', 'AbcNode']] = []
+        self.last_removed_edges: list[tuple['AbcNode', 'AbcNode']] = []
+        self.__grid_radius: float | None = None
+        self.__changed_nodes: list['AbcNode'] = []
+
+    def mark_dirty(self, node: 'AbcNode'):
+        """Mark the node so that its connections are re-evaluated in the next
+        update."""
+
+        self.dirty_nodes.add(node)
+
+    def node_removed(self, node: 'AbcNode'):
+        """Forget the node after it was removed from the simulation."""
+
+        self.dirty_nodes.discard(node)
+        self.spatial_grid.remove(node)
+
+        if (node.connectivity_model is not None):
+            node.connectivity_model.release_node(node)
+
+    def close(self):
+        """Terminate the worker processes of the parallel evaluation, if
+        any."""
+
+        self.parallel_connectivity.close()
+
+    def update_connections(self, full: bool = False):
+        """Updates the connections in the network graph.
+
+        If every node uses a connectivity model of the same type and that
+        model implements `is_connected_batch`, the connections are evaluated
+        in blocks of rows with a few array operations.
+
+        Otherwise, each pair is evaluated with `is_connected`. If every node
+        uses a connectivity model that advertises a maximum radius, the nodes
+        are indexed in the spatial index chosen by `config.connectivity_index`
+        and each node only tests the nodes within the largest radius (plus its
+        current neighbors, so that out of range edges are removed):
+
+        - `'grid'`: a uniform grid sized to the largest radius, kept up to
+          date with the moved nodes;
+        - `'kdtree'`: a k-d tree rebuilt every round, for large maps with
+          clustered nodes;
+        - `'none'`: no index, every pair of nodes is tested.
+
+        If some model is not range-limited, every pair of nodes is tested.
+
+        Pairs whose models are symmetric with each other (see
+        `AbcConnectivityModel.is_symmetric_with`) are evaluated once and the
+        decision is used for both directed edges.
+
+        If `config.connectivity_processes` is greater than 1, the source nodes
+        evaluated with `is_connected` are split between that many worker
+        processes (see `ParallelConnectivity`).
+
+        Parameters
+        ----------
+        full : bool, optional
+            If `True`, every pair of nodes is re-evaluated, not only the pairs
+            that involve a dirty node or a node whose connectivity model is not
+            deterministic.
+        """
+
+        self.__reset_changed_nodes()
+
+        nodes = self.simulation.nodes()
+
+        if (full):
+            sources = nodes
+        else:
+            # the decisions of models that are not deterministic may change
+            # even if no node moved
+            sources = [node for node in nodes if node in self.dirty_nodes or
+                       not node.connectivity_model.deterministic]
+        self.dirty_nodes.clear()
+
+        if (len(sources) == 0):
+            return
+
+        changes: dict['AbcNode', tuple[list['AbcNode'], list['AbcNode']]] = {}
+
+        if (self.__has_single_model_type(nodes) and
+                self.__evaluate_batch(nodes, sources, changes)):
+            # the grid was not kept up to date with the moved nodes
+            self.__grid_radius = None
+        else:
+            self.__evaluate_pairwise(nodes, sources, changes)
+
+        self.__apply_changes(changes)
+
+    def apply_edge_changes(self, added_edges: list[tuple['AbcNode', 'AbcNode']], removed_edges: list[tuple['AbcNode', 'AbcNode']]):
+        """Apply edges that changed without evaluating any connectivity
+        model, as when replaying a contact plan. It replaces
+        `update_connections` for the round.
+
+        Parameters
+        ----------
+        added_edges : list[tuple[AbcNode, AbcNode]]
+            The edges to add, as (node, neighbor) pairs.
+        removed_edges : list[tuple[AbcNode, AbcNode]]
+            The edges to remove, as (node, neighbor) pairs.
+        """
+
+        self.__reset_changed_nodes()
+        self.dirty_nodes.clear()
+
+        changes: dict['AbcNode', tuple[list['AbcNode'], list['AbcNode']]] = {}
+
+        for node, neighbor in added_edges:
+            self.__record(changes, node, neighbor, True)
+        for node, neighbor in removed_edges:
+            self.__record(changes, node, neighbor, False)
+
+        self.__apply_changes(changes)
+
+    def __reset_changed_nodes(self):
+        """(private) Resets the flags of the nodes whose neighborhood changed
+        in the last update."""
+
+        for node in self.__changed_nodes:
+            # reset neighboorhood_changed flag
+            node.neighborhood_changed = False
+        self.__changed_nodes = []
+        self.last_added_edges = []
+        self.last_removed_edges = []
+
+    def __evaluate_batch(self, nodes: list['AbcNode'], sources: list['AbcNode'], changes) -> bool:
+        """(private) Evaluates the pairs that involve a source node with
+        `is_connected_batch`.
+
+        The changes are recorded in `changes` only once every block was
+        evaluated, so that a model that gives up on a block leaves no change
+        behind for the pairwise evaluation to record again.
+
+        Returns
+        -------
+        bool
+            `False` if the connectivity model is not vectorized, in which
+            case no change was recorded.
+        """
+
+        batch_changes: dict['AbcNode', tuple[list['AbcNode'], list['AbcNode']]] = {}
+
+        if (not self.__evaluate_batch_blocks(nodes, sources, batch_changes)):
+            return False
+
+        for node, (added, removed) in batch_changes.items():
+            node_added, node_removed = changes.setdefault(node, ([], []))
+            node_added.extend(added)
+            node_removed.extend(removed)
+
+        return True
+
+    def __evaluate_batch_blocks(self, nodes: list['AbcNode'], sources: list['AbcNode'], changes) -> bool:
+        """(private) Evaluates the blocks of `__evaluate_batch` and records
+        their changes. Returns `False` as soon as a block is not evaluated."""
+
+        model = nodes[0].connectivity_model
+
+        if (self.__is_symmetric(nodes)):
+            return self.__evaluate_symmetric_batch(model, nodes, sources, changes)
+
+        source_set = set(sources)
+        others = [node for node in nodes if node not in source_set]
+
+        # edges from the sources to every node
+        for start in range(0, len(sources), self.batch_rows):
+            rows = sources[start:start + self.batch_rows]
+            block = model.is_connected_batch(rows, nodes)
+
+            if (block is None):
+                return False
+
+            for node, row in zip(rows, block):
+                connected = [nodes[j] for j in np.flatnonzero(row).tolist()
+                             if nodes[j] is not node]
+                current = list(self.simulation.graph.successors(node))
+
+                self.__record_differences(changes, connected, current,
+                                          lambda neighbor: (node, neighbor))
+
+        if (len(others) == 0):
+            return True
+
+        # edges from the other nodes to the sources
+        for start in range(0, len(sources), self.batch_rows):
+            columns = sources[start:start + self.batch_rows]
+            block = model.is_connected_batch(others, columns)
+
+            if (block is None):
+                return False
+
+            for j, target in enumerate(columns):
+                connected = [others[i]
+                             for i in np.flatnonzero(block[:, j]).tolist()]
+                current = [node for node in self.simulation.graph.predecessors(target)
+                           if node not in source_set]
+
+                self.__record_differences(changes, connected, current,
+                                          lambda node: (node, target))
+
+        return True
+
+    def __evaluate_symmetric_batch(self, model, nodes: list['AbcNode'], sources: list['AbcNode'], changes) -> bool:
+        """(private) Evaluates the pairs that involve a source node with
+        `is_connected_batch`, once per unordered pair.
+
+        A pair of two sources is decided by the row of the source that comes
+        first in `sources`, so the row of the other source ignores it.
+        """
+
+        rank = {node: i for i, node in enumerate(sources)}
+        # rank of the source of each column, or len(sources) for the others
+        column_ranks = np.array([rank.get(node, len(sources)) for node in nodes])
+
+        for start in range(0, len(sources), self.batch_rows):
+            rows = sources[start:start + self.batch_rows]
+            block = model.is_connected_batch(rows, nodes)
+
+            if (block is None):
+                return False
+
+            for i, (node, row) in enumerate(zip(rows, block)):
+                node_rank = start + i
+                decided = row & (column_ranks > node_rank)
+                connected = [nodes[j]
+                             for j in np.flatnonzero(decided).tolist()]
+
+                current_out = [neighbor for neighbor in self.simulation.graph.successors(node)
+                               if rank.get(neighbor, len(sources)) > node_rank]
+                current_in = [neighbor for neighbor in self.simulation.graph.predecessors(node)
+                              if rank.get(neighbor, len(sources)) > node_rank]
+
+                self.__record_differences(changes, connected, current_out,
+                                          lambda neighbor: (node, neighbor))
+                self.__record_differences(changes, connected, current_in,
+                                          lambda neighbor: (neighbor, node))
+
+        return True
+
+    def __evaluate_pairwise(self, nodes: list['AbcNode'], sources: list['AbcNode'], changes):
+        """(private) Evaluates the pairs that involve a source node with
+        `is_connected`."""
+
+        rank = {node: i for i, node in enumerate(sources)}
+        spatial_index = self.__spatial_index(
+            nodes, sources, self.__max_radius(nodes))
+        sources_candidates = spatial_index.candidates_of(
+            sources) if spatial_index else None
+        # decided once for the round instead of once per pair
+        symmetric = self.__is_symmetric(nodes)
+
+        parallel_changes = self.parallel_connectivity.evaluate(
+            self.simulation.graph, nodes, sources, sources_candidates,
+            symmetric, config.connectivity_processes) if self.__is_parallel(nodes, sources, sources_candidates) else None
+
+        if (parallel_changes is not None):
+            for node, neighbor, is_connected in parallel_changes:
+                self.__record(changes, node, neighbor, is_connected)
+            return
+
+        if (config.connectivity_processes <= 1):
+            self.parallel_connectivity.close()
+
+        if (symmetric and spatial_index is None):
+            # rank of the source of each node, or len(sources) for the others,
+            # to pair each source only with the nodes that it decides
+            node_ranks = np.array([rank.get(node, len(sources))
+                                   for node in nodes])
+            node_array = np.empty(len(nodes), dtype=object)
+            node_array[:] = nodes
+
+        for i, node in enumerate(sources):
+            node: 'AbcNode'
+
+            if (spatial_index is None):
+                candidates = node_array[node_ranks > i] if symmetric else nodes
+            else:
+                # deduplicated in insertion order, so that probabilistic
+                # models draw their numbers in the same order in every run
+                candidates = dict.fromkeys(sources_candidates[i])
+                candidates.update(dict.fromkeys(
+                    self.simulation.graph.successors(node)))
+                candidates.update(dict.fromkeys(
+                    self.simulation.graph.predecessors(node)))
+
+            for possible_neighbor in candidates:
+                possible_neighbor: 'AbcNode'
+
+                if possible_neighbor == node:
+                    continue
+
+                neighbor_rank = rank.get(possible_neighbor)
+
+                if (symmetric or node.connectivity_model.is_symmetric_with(possible_neighbor.connectivity_model)):
+                    # a pair of two sources is decided by the first of them
+                    if (neighbor_rank is None or neighbor_rank > i):
+                        self.__evaluate_symmetric_pair(
+                            node, possible_neighbor, changes)
+                    continue
+
+                self.__evaluate_pair(node, possible_neighbor, changes)
+
+                # pairs between two sources are evaluated from both sides
+                if (neighbor_rank is None):
+                    self.__evaluate_pair(possible_neighbor, node, changes)
+
+    def __is_parallel(self, nodes: list['AbcNode'], sources: list['AbcNode'], sources_candidates: list[list['AbcNode']] | None) -> bool:
+        """(private) Returns `True` if the pairs must be evaluated by the
+        worker processes."""
+
+        if (config.connectivity_processes <= 1):
+            return False
+
+        if (sources_candidates is None):
+            pairs = len(sources) * len(nodes)
+        else:
+            pairs = sum(len(candidates) for candidates in sources_candidates)
+
+        return pairs >= self.min_parallel_pairs
+
+    def __evaluate_pair(self, node: 'AbcNode', possible_neighbor: 'AbcNode', changes):
+        """(private) Evaluates the edge from the node to the possible neighbor
+        and records it if it changed."""
+
+        is_connected = bool(node.connectivity_model.is_connected(
+            node, possible_neighbor))
+        has_edge = self.simulation.has_edge(node, possible_neighbor)
+
+        if (is_connected != has_edge):
+            self.__record(changes, node, possible_neighbor, is_connected)
+
+    def __evaluate_symmetric_pair(self, node: 'AbcNode', possible_neighbor: 'AbcNode', changes):
+        """(private) Evaluates the pair once and records each of its two
+        edges that changed."""
+
+        is_connected = bool(node.connectivity_model.is_connected(
+            node, possible_neighbor))
+
+        if (is_connected != self.simulation.has_edge(node, possible_neighbor)):
+            self.__record(changes, node, possible_neighbor, is_connected)
+
+        if (is_connected != self.simulation.has_edge(possible_neighbor, node)):
+            self.__record(changes, possible_neighbor, node, is_connected)
+
+    def __record_differences(self, changes, connected: list['AbcNode'], current: list['AbcNode'], edge_of):
+        """(private) Records the edges to the connected nodes that are not
+        current and the edges to the current nodes that are not connected,
+        in the order of the lists. `edge_of` gives the (node, neighbor) pair
+        of the edge to or from a node of the lists."""
+
+        current_set = set(current)
+        connected_set = set(connected)
+
+        for other in connected:
+            if (other not in current_set):
+                self.__record(changes, *edge_of(other), True)
+        for other in current:
+            if (other not in connected_set):
+                self.__record(changes, *edge_of(other), False)
+
+    def __record(self, changes, node: 'AbcNode', neighbor: 'AbcNode', is_connected: bool):
+        """(private) Records that the edge from the node to the neighbor must
+        be added or removed."""
+
+        if (node not in changes):
+            changes[node] = ([], [])
+
+        changes[node][0 if is_connected else 1].append(neighbor)
+
+    def __apply_changes(self, changes):
+        """(private) Adds the edges from each node to its newly connected
+        nodes and removes the edges to its disconnected ones, all at once.
+        The packets in the air over the removed edges are denied delivery."""
+
+        added_edges: list[tuple['AbcNode', 'AbcNode']] = []
+        removed_edges: list[tuple['AbcNode', 'AbcNode']] = []
+
+        for node, (connected, disconnected) in changes.items():
+            node.neighborhood_changed = True
+            self.__changed_nodes.append(node)
+
+            added_edges.extend((node, neighbor) for neighbor in connected)
+            removed_edges.extend((node, neighbor) for neighbor in disconnected)
+
+            Global.round_logs.append(
+                f'Node {node.id} had {len(connected)} connections and {len(disconnected)} disconnections')
+
+        self.simulation.add_edges(added_edges)
+        self.simulation.remove_edges(removed_edges)
+        self.simulation.packets_in_the_air.deny_from_edges(removed_edges)
+
+        self.last_added_edges = added_edges
+        self.last_removed_edges = removed_edges
+
+    def __spatial_index(self, nodes: list['AbcNode'], sources: list['AbcNode'], max_radius: float | None) -> SpatialGrid | KDTreeIndex | None:
+        """(private) Brings the configured spatial index up to date and
+        returns it, or returns `None` if every pair must be tested.
+
+        Raises
+        ------
+        ValueError
+            If `config.connectivity_index` is not a known index.
+        """
+
+        if (config.connectivity_index not in ('grid', 'kdtree', 'none')):
+            raise ValueError(
+                f'Unknown connectivity index: {config.connectivity_index}')
+
+        if (max_radius is None or config.connectivity_index != 'grid'):
+            self.__grid_radius = None
+
+        if (max_radius is None or config.connectivity_index == 'none'):
+            return None
+
+        if (config.connectivity_index == 'kdtree'):
+            self.kd_tree_index.rebuild(nodes, max_radius)
+            return self.kd_tree_index
+
+        if (self.__grid_radius != max_radius or len(sources) == len(nodes)):
+            # the radius changed or the grid was not kept up to date
+            self.spatial_grid.rebuild(nodes, max_radius)
+            self.__grid_radius = max_radius
+        else:
+            for node in sources:
+                self.spatial_grid.update(node)
+
+        return self.spatial_grid
+
+    def __is_symmetric(self, nodes: list['AbcNode']) -> bool:
+        """(private) Returns `True` if all nodes use a connectivity model of
+        the same type that is symmetric with the model of the first node, so
+        that every pair can be evaluated once."""
+
+        model = nodes[0].connectivity_model
+
+        return (model.symmetric and self.__has_single_model_type(nodes) and
+                all(node.connectivity_model.is_symmetric_with(model) for node in nodes))
+
+    def __has_single_model_type(self, nodes: list['AbcNode']) -> bool:
+        """(private) Returns `True` if all nodes use a connectivity model of
+        the same type."""
+
+        model_type = type(nodes[0].connectivity_model)
+
+        for node in nodes:
+            if (type(node.connectivity_model) is not model_type):
+                return False
+
+        return True
+
+    def __max_radius(self, nodes: list['AbcNode']) -> float | None:
+        """(private) Returns the largest radius advertised by the connectivity
+        models of the nodes, or `None` if some model is not range-limited."""
+
+        max_radius = 0
+
+        for node in nodes:
+            radius = node.connectivity_model.get_max_radius()
+
+            if (radius is None):
+                return None
+
+            max_radius = max(max_radius, radius)
+
+        return max_radius
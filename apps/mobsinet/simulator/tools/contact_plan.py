@@ -0,0 +1,249 @@
+import numpy as np
+from ..global_vars import Global
+from .position import coordinates_array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..network_simulator import NetworkSimulator
+    from ..models.nodes.abc_node import AbcNode
+
+
+class ContactPlan:
+    """Edges added and removed in each round of a simulation whose mobility
+    and connectivity do not depend on chance.
+
+    The events of round r are stored at positions `offsets[r - 1]` to
+    `offsets[r]` of the `sources`, `targets` and `connected` arrays, with
+    the nodes identified by their ids. A plan recorded from a running
+    simulation (see `ContactRecorder`) also keeps the edges of the graph
+    before its first round in `initial_sources` and `initial_targets`.
+
+    The ids and the coordinates of the nodes before the first round are kept
+    in `initial_ids` and `initial_positions`, so that a replay starts from
+    the placement the plan was recorded with (see `restore_positions`).
+    """
+
+    def __init__(self, offsets: np.ndarray, sources: np.ndarray, targets: np.ndarray, connected: np.ndarray, initial_sources: np.ndarray | None = None, initial_targets: np.ndarray | None = None, initial_ids: np.ndarray | None = None, initial_positions: np.ndarray | None = None):
+        self.offsets = offsets
+        self.sources = sources
+        self.targets = targets
+        self.connected = connected
+        self.initial_sources = initial_sources if initial_sources is not None else np.zeros(
+            0, dtype=np.int32)
+        self.initial_targets = initial_targets if initial_targets is not None else np.zeros(
+            0, dtype=np.int32)
+        # None for the plans saved without the placement of the nodes
+        self.initial_ids = initial_ids
+        self.initial_positions = initial_positions
+
+    @property
+    def rounds(self) -> int:
+        """The number of rounds in the plan."""
+
+        return len(self.offsets) - 1
+
+    @staticmethod
+    def build(simulation: 'NetworkSimulator', rounds: int) -> 'ContactPlan':
+        """Run the mobility and connectivity phases of the simulation for the
+        rounds and record the edges that changed in each of them.
+
+        Nodes do not step, so no message is sent and no timer fires.
+
+        Parameters
+        ----------
+        simulation : NetworkSimulator
+            The simulation, with its nodes already added.
+        rounds : int
+            The number of rounds to record.
+
+        Raises
+        ------
+        ValueError
+            If the mobility or connectivity model of some node is not
+            deterministic.
+        """
+
+        for node in simulation.nodes():
+            if (not node.mobility_model.deterministic):
+                raise ValueError(
+                    f'The mobility model of node {node.id} is not deterministic.')
+            if (not node.connectivity_model.deterministic):
+                raise ValueError(
+                    f'The connectivity model of node {node.id} is not deterministic.')
+
+        nodes = simulation.nodes()
+        initial_ids = np.array([node.id for node in nodes], dtype=np.int32)
+        initial_positions = coordinates_array(nodes)
+
+        offsets = [0]
+        sources: list[int] = []
+        targets: list[int] = []
+        connected: list[bool] = []
+
+        for _ in range(rounds):
+            Global.current_time += 1
+
+            for node in simulation.nodes():
+                node.set_position(node.mobility_model.get_next_position(node))
+
+            simulation.connectivity_engine.update_connections()
+
+            for is_connected, edges in ((True, simulation.connectivity_engine.last_added_edges),
+                                        (False, simulation.connectivity_engine.last_removed_edges)):
+                for node, neighbor in edges:
+                    sources.append(node.id)
+                    targets.append(neighbor.id)
+                    connected.append(is_connected)
+
+            offsets.append(len(sources))
+
+        return ContactPlan(np.array(offsets, dtype=np.int64),
+                           np.array(sources, dtype=np.int32),
+                           np.array(targets, dtype=np.int32),
+                           np.array(connected, dtype=bool),
+                           initial_ids=initial_ids,
+                           initial_positions=initial_positions)
+
+    @staticmethod
+    def load(path: str) -> 'ContactPlan':
+        """Load a contact plan saved with `save`."""
+
+        with np.load(path) as data:
+            initial_edges = (data['initial_sources'], data['initial_targets']) \
+                if 'initial_sources' in data.files else (None, None)
+            placement = (data['initial_ids'], data['initial_positions']) \
+                if 'initial_ids' in data.files else (None, None)
+
+            return ContactPlan(data['offsets'], data['sources'],
+                               data['targets'], data['connected'], *initial_edges,
+                               *placement)
+
+    def save(self, path: str):
+        """Save the contact plan to a compressed `.npz` file."""
+
+        placement = {} if self.initial_ids is None else {
+            'initial_ids': self.initial_ids,
+            'initial_positions': self.initial_positions}
+
+        np.savez_compressed(path, offsets=self.offsets, sources=self.sources,
+                            targets=self.targets, connected=self.connected,
+                            initial_sources=self.initial_sources,
+                            initial_targets=self.initial_targets, **placement)
+
+    def restore_positions(self, nodes_by_id: dict[int, 'AbcNode']):
+        """Move the nodes back to the positions they had before the first
+        round of the plan. Plans saved without them leave the nodes in place.
+
+        Parameters
+        ----------
+        nodes_by_id : dict[int, AbcNode]
+            The nodes of the simulation by their ids.
+
+        Raises
+        ------
+        ValueError
+            If the nodes of the simulation are not the nodes of the plan.
+        """
+
+        if (self.initial_ids is None):
+            return
+
+        ids = self.initial_ids.tolist()
+
+        if (len(nodes_by_id) != len(ids) or any(node_id not in nodes_by_id for node_id in ids)):
+            raise ValueError(
+                'The nodes of the simulation are not the nodes of the contact plan.')
+
+        nodes = [nodes_by_id[node_id] for node_id in ids]
+        type(nodes[0]).set_positions(nodes, self.initial_positions)
+
+    def edges_of(self, round: int, nodes_by_id: dict[int, 'AbcNode']) -> tuple[list[tuple['AbcNode', 'AbcNode']], list[tuple['AbcNode', 'AbcNode']]]:
+        """Return the edges added and removed in the round.
+
+        Parameters
+        ----------
+        round : int
+            The round, starting at 1. Rounds past the end of the plan have no
+            event.
+        nodes_by_id : dict[int, AbcNode]
+            The nodes of the simulation by their ids.
+
+        Returns
+        -------
+        tuple[list[tuple[AbcNode, AbcNode]], list[tuple[AbcNode, AbcNode]]]
+            The added edges and the removed edges.
+
+        Raises
+        ------
+        ValueError
+            If the plan refers to a node that is not in the simulation.
+        """
+
+        if (round < 1 or round > self.rounds):
+            return [], []
+
+        start, end = self.offsets[round - 1], self.offsets[round]
+        added_edges: list[tuple['AbcNode', 'AbcNode']] = []
+        removed_edges: list[tuple['AbcNode', 'AbcNode']] = []
+
+        for source, target, is_connected in zip(self.sources[start:end].tolist(),
+                                                self.targets[start:end].tolist(),
+                                                self.connected[start:end].tolist()):
+            if (source not in nodes_by_id or target not in nodes_by_id):
+                raise ValueError(
+                    f'The contact plan refers to a node that is not in the simulation: {source if source not in nodes_by_id else target}')
+
+            edge = (nodes_by_id[source], nodes_by_id[target])
+            (added_edges if is_connected else removed_edges).append(edge)
+
+        return added_edges, removed_edges
+
+
+class ContactRecorder:
+    """Records the edges added and removed in each round of a running
+    simulation, as a `ContactPlan` that starts from the edges of the graph
+    when the recording started."""
+
+    def __init__(self, simulation: 'NetworkSimulator'):
+        """
+        Parameters
+        ----------
+        simulation : NetworkSimulator
+            The simulation, whose current edges are the initial ones.
+        """
+
+        edges = list(simulation.graph.edges)
+        nodes = simulation.nodes()
+
+        self.__initial_sources = np.array([node.id for node, _ in edges],
+                                          dtype=np.int32)
+        self.__initial_targets = np.array([neighbor.id for _, neighbor in edges],
+                                          dtype=np.int32)
+        self.__initial_ids = np.array([node.id for node in nodes],
+                                      dtype=np.int32)
+        self.__initial_positions = coordinates_array(nodes)
+        self.__offsets = [0]
+        self.__sources: list[int] = []
+        self.__targets: list[int] = []
+        self.__connected: list[bool] = []
+
+    def record_round(self, added_edges: list[tuple['AbcNode', 'AbcNode']], removed_edges: list[tuple['AbcNode', 'AbcNode']]):
+        """Record the edges added and removed in the next round."""
+
+        for is_connected, edges in ((True, added_edges), (False, removed_edges)):
+            for node, neighbor in edges:
+                self.__sources.append(node.id)
+                self.__targets.append(neighbor.id)
+                self.__connected.append(is_connected)
+
+        self.__offsets.append(len(self.__sources))
+
+    def plan(self) -> ContactPlan:
+        """Return the plan of the rounds recorded so far."""
+
+        return ContactPlan(np.array(self.__offsets, dtype=np.int64),
+                           np.array(self.__sources, dtype=np.int32),
+                           np.array(self.__targets, dtype=np.int32),
+                           np.array(self.__connected, dtype=bool),
+                           self.__initial_sources, self.__initial_targets,
+                           self.__initial_ids, self.__initial_positions)
@@ -6,6 +6,7 @@ from .inbox import Inbox
 from ..global_vars import Global
 from typing import TYPE_CHECKING
 from ..configuration.sim_config import config
+from .packet_event_log import DELIVERED, DENIED
 
 if (TYPE_CHECKING):
     from ..models.nodes.abc_node import AbcNode
@@ -45,6 +46,10 @@ class InboxPacketBuffer:
                     simulation.graph.edges[p.origin,
                                            p.destination]['number_of_packets'] -= 1
 
+                if (Global.packet_event_log is not None):
+                    Global.packet_event_log.append(
+                        p, DELIVERED if p.positive_delivery else DENIED)
+
                 if p.positive_delivery:
                     self.arriving_packets.append(p)
                     Global.round_logs.append(
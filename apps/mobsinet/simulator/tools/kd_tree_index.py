@@ -0,0 +1,73 @@
+import numpy as np
+from scipy.spatial import cKDTree
+from .position import coordinates_array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..models.nodes.abc_node import AbcNode
+
+
+class KDTreeIndex:
+    """Spatial index backed by a k-d tree over the positions of the nodes.
+
+    Unlike a uniform grid, its cost does not depend on how the nodes are
+    spread over the map, which suits large maps with clustered nodes.
+    """
+
+    def __init__(self):
+        self.radius: float = 0
+        self.nodes: list['AbcNode'] = []
+        self.tree: cKDTree | None = None
+
+    def rebuild(self, nodes: list['AbcNode'], radius: float):
+        """Build the tree from the current positions of the nodes.
+
+        Parameters
+        ----------
+        nodes : list[AbcNode]
+            The nodes to index.
+        radius : float
+            The search radius used by `candidates_of`.
+        """
+
+        # tolerance so that pairs exactly at the radius are never missed
+        self.radius = radius * (1 + 1e-9) + 1e-12
+        self.nodes = nodes
+        self.tree = cKDTree(coordinates_array(nodes))
+
+    def candidates_of(self, nodes: list['AbcNode']) -> list[list['AbcNode']]:
+        """Return, for each node, the indexed nodes within the radius.
+
+        The node itself may be included in its own candidates.
+
+        Parameters
+        ----------
+        nodes : list[AbcNode]
+            The nodes to query.
+
+        Returns
+        -------
+        list[list[AbcNode]]
+            The candidates of `nodes[i]` at position i.
+        """
+
+        if (len(nodes) == len(self.nodes)):
+            return self.__all_candidates(nodes)
+
+        neighbors = self.tree.query_ball_point(
+            coordinates_array(nodes), self.radius)
+
+        return [[self.nodes[j] for j in indices] for indices in neighbors]
+
+    def __all_candidates(self, nodes: list['AbcNode']) -> list[list['AbcNode']]:
+        """(private) Returns the candidates of every indexed node from a
+        single `query_pairs` call."""
+
+        candidates: dict['AbcNode', list['AbcNode']] = {
+            node: [] for node in self.nodes}
+
+        for i, j in self.tree.query_pairs(self.radius, output_type='ndarray'):
+            candidates[self.nodes[i]].append(self.nodes[j])
+            candidates[self.nodes[j]].append(self.nodes[i])
+
+        return [candidates[node] for node in nodes]
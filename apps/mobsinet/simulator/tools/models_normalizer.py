@@ -17,6 +17,22 @@ if TYPE_CHECKING:
 
 
 class ModelsNormalizer:
+    # classes already imported, by module name and attribute
+    __imported: dict[tuple[str, str], type] = {}
+
+    @staticmethod
+    def __import_model(module_name: str, attribute: str = 'model') -> type:
+        """(private) Returns the class exported by a model module, importing
+        the module only the first time."""
+
+        key = (module_name, attribute)
+
+        if (key not in ModelsNormalizer.__imported):
+            ModelsNormalizer.__imported[key] = getattr(
+                importlib.import_module(module_name), attribute)
+
+        return ModelsNormalizer.__imported[key]
+
     @staticmethod
     def normalize_mobility_model(mobility_model: Type['AbcMobilityModel'] | 'AbcMobilityModel' | str | None) -> 'AbcMobilityModel':
         """(static) Normalizes the mobility model.
@@ -43,11 +59,11 @@ class ModelsNormalizer:
             if (mobility_model.__contains__(':')):
                 project_name, mobility_model = mobility_model.split(':')
                 
-                mobility_model: Type['AbcMobilityModel'] = importlib.import_module(
-                    config.PROJECT_DIR.replace('/', '.') + project_name + '.mobility_models.' + mobility_model).model
+                mobility_model: Type['AbcMobilityModel'] = ModelsNormalizer.__import_model(
+                    config.PROJECT_DIR.replace('/', '.') + project_name + '.mobility_models.' + mobility_model)
             else:
-                mobility_model: Type['AbcMobilityModel'] = importlib.import_module(
-                    f'apps.mobsinet.simulator.defaults.mobility_models.{mobility_model}').model
+                mobility_model: Type['AbcMobilityModel'] = ModelsNormalizer.__import_model(
+                    f'apps.mobsinet.simulator.defaults.mobility_models.{mobility_model}')
             
 
         if type(mobility_model) is type or type(mobility_model) is ABCMeta:
@@ -81,11 +97,11 @@ class ModelsNormalizer:
             if (message_transmission_model.__contains__(':')):
                 project_name, message_transmission_model = message_transmission_model.split(':')
                 
-                message_transmission_model: Type['AbcMessageTransmissionModel'] = importlib.import_module(
-                    config.PROJECT_DIR.replace('/', '.') + project_name + '.message_transmission_models.' + message_transmission_model).model
+                message_transmission_model: Type['AbcMessageTransmissionModel'] = ModelsNormalizer.__import_model(
+                    config.PROJECT_DIR.replace('/', '.') + project_name + '.message_transmission_models.' + message_transmission_model)
             else:
-                message_transmission_model: Type['AbcMessageTransmissionModel'] = importlib.import_module(
-                    f'apps.mobsinet.simulator.defaults.message_transmission_models.{message_transmission_model}').model
+                message_transmission_model: Type['AbcMessageTransmissionModel'] = ModelsNormalizer.__import_model(
+                    f'apps.mobsinet.simulator.defaults.message_transmission_models.{message_transmission_model}')
 
         if type(message_transmission_model) is type or type(message_transmission_model) is ABCMeta:
             message_transmission_model: 'AbcMessageTransmissionModel' = message_transmission_model()
@@ -118,11 +134,11 @@ class ModelsNormalizer:
             if (connectivity_model.__contains__(':')):
                 project_name, connectivity_model = connectivity_model.split(':')
                 
-                connectivity_model: Type['AbcConnectivityModel'] = importlib.import_module(
-                    config.PROJECT_DIR.replace('/', '.') + project_name + '.connectivity_models.' + connectivity_model).model
+                connectivity_model: Type['AbcConnectivityModel'] = ModelsNormalizer.__import_model(
+                    config.PROJECT_DIR.replace('/', '.') + project_name + '.connectivity_models.' + connectivity_model)
             else:
-                connectivity_model: Type['AbcConnectivityModel'] = importlib.import_module(
-                    f'apps.mobsinet.simulator.defaults.connectivity_models.{connectivity_model}').model
+                connectivity_model: Type['AbcConnectivityModel'] = ModelsNormalizer.__import_model(
+                    f'apps.mobsinet.simulator.defaults.connectivity_models.{connectivity_model}')
             
             
 
@@ -157,11 +173,11 @@ class ModelsNormalizer:
             if (interference_model.__contains__(':')):
                 project_name, interference_model = interference_model.split(':')
                 
-                interference_model: Type['AbcInterferenceModel'] = importlib.import_module(
-                    config.PROJECT_DIR.replace('/', '.') + project_name + '.interference_models.' + interference_model).model
+                interference_model: Type['AbcInterferenceModel'] = ModelsNormalizer.__import_model(
+                    config.PROJECT_DIR.replace('/', '.') + project_name + '.interference_models.' + interference_model)
             else:
-                interference_model: Type['AbcInterferenceModel'] = importlib.import_module(
-                    f'apps.mobsinet.simulator.defaults.interference_models.{interference_model}').model
+                interference_model: Type['AbcInterferenceModel'] = ModelsNormalizer.__import_model(
+                    f'apps.mobsinet.simulator.defaults.interference_models.{interference_model}')
 
         if type(interference_model) is type or type(interference_model) is ABCMeta:
             interference_model: 'AbcInterferenceModel' = interference_model()
@@ -194,11 +210,11 @@ class ModelsNormalizer:
             if (reliability_model.__contains__(':')):
                 project_name, reliability_model = reliability_model.split(':')
                 
-                reliability_model: Type['AbcReliabilityModel'] = importlib.import_module(
-                    config.PROJECT_DIR.replace('/', '.') + project_name + '.reliability_models.' + reliability_model).model
+                reliability_model: Type['AbcReliabilityModel'] = ModelsNormalizer.__import_model(
+                    config.PROJECT_DIR.replace('/', '.') + project_name + '.reliability_models.' + reliability_model)
             else:
-                reliability_model: Type['AbcReliabilityModel'] = importlib.import_module(
-                    f'apps.mobsinet.simulator.defaults.reliability_models.{reliability_model}').model
+                reliability_model: Type['AbcReliabilityModel'] = ModelsNormalizer.__import_model(
+                    f'apps.mobsinet.simulator.defaults.reliability_models.{reliability_model}')
             
 
         if type(reliability_model) is type or type(reliability_model) is ABCMeta:
@@ -232,11 +248,11 @@ class ModelsNormalizer:
             if (distribution_model.__contains__(':')):
                 project_name, distribution_model = distribution_model.split(':')
                 
-                distribution_model: Type['AbcDistributionModel'] = importlib.import_module(
-                    config.PROJECT_DIR.replace('/', '.') + project_name + '.distribution_models.' + distribution_model).model
+                distribution_model: Type['AbcDistributionModel'] = ModelsNormalizer.__import_model(
+                    config.PROJECT_DIR.replace('/', '.') + project_name + '.distribution_models.' + distribution_model)
             else:
-                distribution_model: Type['AbcDistributionModel'] = importlib.import_module(
-                    f'apps.mobsinet.simulator.defaults.distribution_models.{distribution_model}').model
+                distribution_model: Type['AbcDistributionModel'] = ModelsNormalizer.__import_model(
+                    f'apps.mobsinet.simulator.defaults.distribution_models.{distribution_model}')
 
         if type(distribution_model) is type or type(distribution_model) is ABCMeta:
             distribution_model: 'AbcDistributionModel' = distribution_model()
@@ -268,9 +284,9 @@ class ModelsNormalizer:
             if (node_constructor.__contains__(':')):
                 project_name, node_constructor = node_constructor.split(':')
                 
-                node_constructor: Type['AbcNode'] = importlib.import_module(
-                    config.PROJECT_DIR.replace('/', '.') + project_name + '.nodes.' + node_constructor).node
+                node_constructor: Type['AbcNode'] = ModelsNormalizer.__import_model(
+                    config.PROJECT_DIR.replace('/', '.') + project_name + '.nodes.' + node_constructor, 'node')
             else:
-                node_constructor: Type['AbcNode'] = importlib.import_module(
-                    f'apps.mobsinet.simulator.defaults.nodes.{node_constructor}').node
+                node_constructor: Type['AbcNode'] = ModelsNormalizer.__import_model(
+                    f'apps.mobsinet.simulator.defaults.nodes.{node_constructor}', 'node')
         return node_constructor
@@ -0,0 +1,86 @@
+import heapq
+import itertools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..models.nodes.abc_node import AbcNode
+
+
+class MovementScheduler:
+    """Nodes to move in each round of the movement phase.
+
+    After a node moves, its mobility model tells the first round in which
+    the node may move again (see `AbcMobilityModel.get_stationary_until`).
+    Nodes that stay where they are in the next round leave the active movers
+    and wait in a queue ordered by that round, so the movement phase only
+    visits the nodes that may move.
+    """
+
+    def __init__(self):
+        # nodes that may move in the next round, in the order they became
+        # active
+        self.__active: dict['AbcNode', None] = {}
+        self.__wake_times: dict['AbcNode', float] = {}
+        self.__queue: list[tuple[float, int, 'AbcNode']] = []
+        self.__counter = itertools.count()
+        self.__last_time = None
+
+    def node_added(self, node: 'AbcNode'):
+        """Move a node added to the simulation from the next round on."""
+
+        self.wake(node)
+
+    def node_removed(self, node: 'AbcNode'):
+        """Forget a node removed from the simulation."""
+
+        self.__active.pop(node, None)
+        self.__wake_times.pop(node, None)
+
+    def wake(self, node: 'AbcNode'):
+        """Move the node from the next round on, as when its mobility model
+        is replaced."""
+
+        self.__wake_times.pop(node, None)
+        self.__active[node] = None
+
+    def movers(self, time: float) -> list['AbcNode']:
+        """Return the nodes to move in the round, after waking the ones whose
+        stationary time is over. If the time went back, as when the
+        simulation restarts, every node is woken."""
+
+        if (self.__last_time is not None and time < self.__last_time):
+            for node in list(self.__wake_times):
+                self.wake(node)
+            self.__queue = []
+
+        self.__last_time = time
+
+        while (len(self.__queue) > 0 and self.__queue[0][0] <= time):
+            wake_time, _, node = heapq.heappop(self.__queue)
+
+            # entries of nodes woken or removed since they were queued are
+            # stale
+            if (self.__wake_times.get(node) == wake_time):
+                self.wake(node)
+
+        return list(self.__active)
+
+    def moved(self, nodes: list['AbcNode'], time: float):
+        """Take the nodes that moved in the round and stay where they are in
+        the next one out of the active movers."""
+
+        for node in nodes:
+            if (node not in self.__active):
+                continue
+
+            wake_time = node.mobility_model.get_stationary_until(node)
+
+            if (wake_time <= time + 1):
+                continue
+
+            del self.__active[node]
+            self.__wake_times[node] = wake_time
+
+            if (wake_time != float('inf')):
+                heapq.heappush(self.__queue,
+                               (wake_time, next(self.__counter), node))
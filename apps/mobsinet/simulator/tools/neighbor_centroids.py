@@ -0,0 +1,212 @@
+from .position import Position
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..network_simulator import NetworkSimulator
+    from ..models.nodes.abc_node import AbcNode
+
+
+class NeighborCentroids:
+    """Running sums of the positions of the neighbors of each node, so that
+    the centroid of the neighbors of a node is found without visiting the
+    other nodes.
+
+    Two nodes are neighbors if there is an edge between them in either
+    direction. The sums are only kept after the first centroid is asked for.
+    From then on, the simulation reports the edges that changed and the nodes
+    that moved, and the sums are brought up to date with them before the
+    next centroid is returned.
+    """
+
+    def __init__(self, simulation: 'NetworkSimulator'):
+        self.simulation = simulation
+        self.enabled = False
+        self.__neighbors: dict['AbcNode', set['AbcNode']] = {}
+        self.__sums: dict['AbcNode', list[float]] = {}
+        # coordinates of each node when they were last added to the sums
+        self.__coordinates: dict['AbcNode', tuple[float, float, float]] = {}
+        self.__total = [0.0, 0.0, 0.0]
+        # changes reported since the sums were last brought up to date
+        self.__moved_nodes: set['AbcNode'] = set()
+        self.__changed_pairs: set[frozenset['AbcNode']] = set()
+
+    def node_added(self, node: 'AbcNode'):
+        """Start keeping the sums of a node added to the simulation."""
+
+        if (not self.enabled):
+            return
+
+        self.__update()
+
+        coordinates = node.position.get_coordinates()
+
+        self.__neighbors[node] = set()
+        self.__sums[node] = [0.0, 0.0, 0.0]
+        self.__coordinates[node] = coordinates
+        self.__add(self.__total, coordinates, 1)
+
+        # the node may have been added with edges
+        self.__changed_pairs.update(frozenset((node, neighbor))
+                                    for neighbor in self.__adjacent(node))
+
+    def node_removed(self, node: 'AbcNode'):
+        """Forget a node removed from the simulation."""
+
+        if (not self.enabled or node not in self.__neighbors):
+            return
+
+        self.__update()
+
+        coordinates = self.__coordinates.pop(node)
+
+        for neighbor in self.__neighbors.pop(node):
+            self.__neighbors[neighbor].discard(node)
+            self.__add(self.__sums[neighbor], coordinates, -1)
+
+        del self.__sums[node]
+        self.__add(self.__total, coordinates, -1)
+
+    def node_moved(self, node: 'AbcNode'):
+        """Report that the coordinates of the node may have changed."""
+
+        if (self.enabled):
+            self.__moved_nodes.add(node)
+
+    def edges_changed(self, edges: list[tuple['AbcNode', 'AbcNode']]):
+        """Report that the edges were added or removed."""
+
+        if (self.enabled):
+            self.__changed_pairs.update(frozenset(edge) for edge in edges)
+
+    def centroid_of(self, node: 'AbcNode') -> Position | None:
+        """Return the centroid of the neighbors of the node, or `None` if it
+        has no neighbor."""
+
+        self.__enable()
+        self.__update()
+
+        count = len(self.__neighbors.get(node, ()))
+
+        if (count == 0):
+            return None
+
+        sums = self.__sums[node]
+
+        return Position(sums[0] / count, sums[1] / count, sums[2] / count)
+
+    def centroid_of_others(self, node: 'AbcNode') -> Position | None:
+        """Return the centroid of every node of the simulation but the node,
+        or `None` if there is no other node."""
+
+        self.__enable()
+        self.__update()
+
+        count = len(self.__coordinates)
+        total = list(self.__total)
+
+        if (node in self.__coordinates):
+            count -= 1
+            self.__add(total, self.__coordinates[node], -1)
+
+        if (count == 0):
+            return None
+
+        return Position(total[0] / count, total[1] / count, total[2] / count)
+
+    def __enable(self):
+        """(private) Computes the sums from the current graph the first time
+        a centroid is asked for."""
+
+        if (self.enabled):
+            return
+
+        self.enabled = True
+
+        for node in self.simulation.nodes():
+            coordinates = node.position.get_coordinates()
+
+            self.__neighbors[node] = self.__adjacent(node)
+            self.__coordinates[node] = coordinates
+            self.__add(self.__total, coordinates, 1)
+
+        for node, neighbors in self.__neighbors.items():
+            sums = [0.0, 0.0, 0.0]
+
+            for neighbor in neighbors:
+                self.__add(sums, self.__coordinates[neighbor], 1)
+
+            self.__sums[node] = sums
+
+    def __update(self):
+        """(private) Applies the moves and then the edge changes reported
+        since the last update."""
+
+        for node in self.__moved_nodes:
+            if (node not in self.__coordinates):
+                continue
+
+            old_coordinates = self.__coordinates[node]
+            coordinates = node.position.get_coordinates()
+
+            if (coordinates == old_coordinates):
+                continue
+
+            delta = tuple(new - old for new, old in
+                          zip(coordinates, old_coordinates))
+
+            for neighbor in self.__neighbors[node]:
+                self.__add(self.__sums[neighbor], delta, 1)
+
+            self.__add(self.__total, delta, 1)
+            self.__coordinates[node] = coordinates
+
+        self.__moved_nodes.clear()
+
+        for pair in self.__changed_pairs:
+            if (len(pair) != 2 or not pair <= self.__coordinates.keys()):
+                continue
+
+            node_a, node_b = pair
+            were_neighbors = node_b in self.__neighbors[node_a]
+            are_neighbors = self.simulation.has_edge(node_a, node_b) or \
+                self.simulation.has_edge(node_b, node_a)
+
+            if (were_neighbors == are_neighbors):
+                continue
+
+            sign = 1 if are_neighbors else -1
+
+            if (are_neighbors):
+                self.__neighbors[node_a].add(node_b)
+                self.__neighbors[node_b].add(node_a)
+            else:
+                self.__neighbors[node_a].discard(node_b)
+                self.__neighbors[node_b].discard(node_a)
+
+            self.__add(self.__sums[node_a], self.__coordinates[node_b], sign)
+            self.__add(self.__sums[node_b], self.__coordinates[node_a], sign)
+
+        self.__changed_pairs.clear()
+
+    def __adjacent(self, node: 'AbcNode') -> set['AbcNode']:
+        """(private) Returns the nodes with an edge to or from the node in the
+        graph."""
+
+        graph = self.simulation.graph
+
+        if (node not in graph):
+            return set()
+
+        neighbors = set(graph.successors(node))
+        neighbors.update(graph.predecessors(node))
+        neighbors.discard(node)
+
+        return neighbors
+
+    @staticmethod
+    def __add(sums: list[float], coordinates: tuple[float, float, float], sign: int):
+        """(private) Adds the coordinates, times the sign, to the sums."""
+
+        sums[0] += sign * coordinates[0]
+        sums[1] += sign * coordinates[1]
+        sums[2] += sign * coordinates[2]
@@ -8,6 +8,8 @@ from .nack_box import NackBox
 from ..configuration.sim_config import config
 from ..network_simulator import simulation
 from .packet_type import PacketType
+from .packet_event_log import DELIVERED, DENIED
+from ..global_vars import Global
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -55,6 +57,9 @@ class PacketEvent(Event):
         if (simulation.has_edge(self.packet.origin, self.packet.destination)):
             simulation.graph.edges[self.packet.origin,
                                    self.packet.destination]['number_of_packets'] += 1
+        if (Global.packet_event_log is not None):
+            Global.packet_event_log.append(
+                self.packet, DELIVERED if self.packet.positive_delivery else DENIED)
         if self.packet.positive_delivery:
             self.packet.destination.handle_messages(
                 self.inbox.reset_for_packet(self.packet))
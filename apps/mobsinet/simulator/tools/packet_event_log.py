@@ -0,0 +1,182 @@
+import os
+import numpy as np
+from ..configuration.sim_config import config
+from ..global_vars import Global
+from .packet_type import PacketType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..models.nodes.packet import Packet
+
+# Records of a packet event log file.
+RECORD_DTYPE = np.dtype([('time', '<f8'), ('origin', '<i8'), ('destination', '<i8'),
+                         ('type', 'u1'), ('event', 'u1')])
+
+# Header of a packet event log file: the number of record slots and the
+# number of records appended since the file was created.
+HEADER_DTYPE = np.dtype([('magic', 'S8'), ('capacity', '<u8'),
+                         ('appended', '<u8')])
+
+MAGIC = b'PKTLOG01'
+
+# Codes of the `type` field, in the order of `PacketType`.
+TYPE_CODES = {packet_type: code for code,
+              packet_type in enumerate(PacketType.values())}
+
+# Codes of the `event` field.
+SENT = 0
+DELIVERED = 1
+DENIED = 2
+
+
+class PacketEventLog:
+    """Fixed-width records of the packets sent, delivered and denied, in a
+    memory-mapped ring file.
+
+    Each record is written straight to the mapped pages, so appending one
+    costs about as much as setting an attribute and the records reach the
+    file without any formatting. When the file is full, the oldest records
+    are overwritten. `read` returns the records from the oldest to the
+    newest for offline analysis.
+
+    The log is enabled by setting `config.packet_event_log` to the path of
+    the file; it is then opened by `open_configured` when the project is
+    initialized, and closed when a simulation thread ends. A closed log is
+    mapped again by the next `append`, so packets sent between two runs are
+    recorded as well.
+    """
+
+    def __init__(self, filename: str, capacity: int):
+        """
+        Parameters
+        ----------
+        filename : str
+            The path to the log file. An existing file is replaced.
+        capacity : int
+            The number of records kept in the file.
+        """
+
+        if (capacity <= 0):
+            raise ValueError('The capacity of the log must be positive.')
+
+        self.filename = filename
+        self.capacity = capacity
+        self.closed = False
+
+        self.__map('w+')
+
+        self.__header['magic'] = MAGIC
+        self.__header['capacity'] = capacity
+        self.appended = 0
+
+    @staticmethod
+    def open_configured():
+        """Open the log set in `config.packet_event_log` as
+        `Global.packet_event_log`, unless it is already open, or drop it if
+        the log is disabled."""
+
+        filename = config.packet_event_log
+        log = Global.packet_event_log
+
+        if (log is not None and log.filename != filename):
+            log.close()
+            log = Global.packet_event_log = None
+
+        if (filename is None):
+            return
+
+        if (log is None):
+            Global.packet_event_log = PacketEventLog(
+                filename, config.packet_event_log_capacity)
+        elif (log.closed):
+            log.reopen()
+
+    def append(self, packet: 'Packet', event: int):
+        """Append a record of the packet at the current time.
+
+        Parameters
+        ----------
+        packet : Packet
+            The packet.
+        event : int
+            `SENT`, `DELIVERED` or `DENIED`.
+        """
+
+        if (self.closed):
+            self.reopen()
+
+        self.__records[self.appended % self.capacity] = (
+            Global.current_time, packet.origin.id, packet.destination.id,
+            TYPE_CODES.get(packet.type, 255), event)
+
+        self.appended += 1
+        self.__header['appended'] = self.appended
+
+    def flush(self):
+        """Write the mapped pages to the disk, unless the log is closed."""
+
+        if (not self.closed):
+            self.__file.flush()
+
+    def close(self):
+        """Write the mapped pages to the disk and unmap the file. The next
+        `append` maps it again."""
+
+        if (self.closed):
+            return
+
+        self.flush()
+        self.closed = True
+        self.__file = self.__header = self.__records = None
+
+    def reopen(self):
+        """Map the file of a closed log again, to append more records."""
+
+        if (self.closed):
+            self.__map('r+')
+            self.closed = False
+
+    def __map(self, mode: str):
+        """(private) Maps the header and the records of the file."""
+
+        self.__file = np.memmap(self.filename, dtype=np.uint8, mode=mode,
+                                shape=HEADER_DTYPE.itemsize + self.capacity * RECORD_DTYPE.itemsize)
+        self.__header = np.ndarray((), HEADER_DTYPE, buffer=self.__file)
+        self.__records = np.ndarray((self.capacity,), RECORD_DTYPE, buffer=self.__file,
+                                    offset=HEADER_DTYPE.itemsize)
+
+    @staticmethod
+    def read(filename: str) -> np.ndarray:
+        """Return the records of a log file, from the oldest to the newest.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the log file.
+
+        Returns
+        -------
+        np.ndarray
+            The records, with the fields of `RECORD_DTYPE`.
+        """
+
+        header = np.fromfile(filename, dtype=HEADER_DTYPE, count=1)
+
+        if (len(header) == 0 or header['magic'][0] != MAGIC):
+            raise ValueError(f'{filename} is not a packet event log file.')
+
+        capacity = int(header['capacity'][0])
+        appended = int(header['appended'][0])
+
+        if (os.path.getsize(filename) < HEADER_DTYPE.itemsize + capacity * RECORD_DTYPE.itemsize):
+            raise ValueError(f'{filename} is truncated.')
+
+        records = np.memmap(filename, dtype=RECORD_DTYPE, mode='r',
+                            offset=HEADER_DTYPE.itemsize, shape=(capacity,))
+
+        if (appended <= capacity):
+            return np.array(records[:appended])
+
+        start = appended % capacity
+
+        return np.concatenate((records[start:], records[:start]))
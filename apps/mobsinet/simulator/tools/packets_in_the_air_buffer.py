@@ -10,6 +10,9 @@ class PacketsInTheAirBuffer(object):
     def __init__(self) -> None:
         self.active_packets: list[Packet] = []
         self.passive_packets: list[Packet] = []
+        # active packets by (origin, destination), so that the packets on a
+        # removed edge are found without scanning every active packet
+        self.active_packets_by_edge: dict[tuple['AbcNode', 'AbcNode'], list[Packet]] = {}
 
         self.new_added = True
 
@@ -36,10 +39,13 @@ class PacketsInTheAirBuffer(object):
 
         self.new_added = True
         self.active_packets.append(packet)
+        self.active_packets_by_edge.setdefault(
+            (packet.origin, packet.destination), []).append(packet)
 
     def remove(self, packet: Packet):
         try:
             self.active_packets.remove(packet)
+            self.__remove_from_edge_index(packet)
         except ValueError:
             try:
                 self.passive_packets.remove(packet)
@@ -47,9 +53,33 @@ class PacketsInTheAirBuffer(object):
                 pass
 
     def denyFromEdge(self, origin: 'AbcNode', destination: 'AbcNode'):
-        for packet in self.active_packets:
-            if (packet.origin == origin and packet.destination == destination):
-                packet.deny_delivery()
+        for packet in self.active_packets_by_edge.get((origin, destination), ()):
+            packet.deny_delivery()
+
+    def deny_from_edges(self, edges: list[tuple['AbcNode', 'AbcNode']]):
+        """Deny the delivery of the active packets sent over the edges.
+
+        Parameters
+        ----------
+        edges : list[tuple[AbcNode, AbcNode]]
+            The removed edges, as (origin, destination) pairs.
+        """
+
+        if (len(self.active_packets_by_edge) == 0):
+            return
+
+        for origin, destination in edges:
+            self.denyFromEdge(origin, destination)
+
+    def __remove_from_edge_index(self, packet: Packet):
+        """(private) Removes the active packet from the index by edge."""
+
+        edge = (packet.origin, packet.destination)
+        packets = self.active_packets_by_edge[edge]
+        packets.remove(packet)
+
+        if (len(packets) == 0):
+            del self.active_packets_by_edge[edge]
 
     def upgrade_to_active(self, packet: Packet):
         self.passive_packets.remove(packet)
@@ -0,0 +1,254 @@
+import multiprocessing
+import pickle
+import random
+from multiprocessing import shared_memory
+import numpy as np
+from .position import coordinates_array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import networkx as nx
+    from ..models.nodes.abc_node import AbcNode
+
+# Copy of the nodes of the simulation in a worker process.
+_nodes: list['AbcNode'] = []
+# Positions of `_nodes`, shared with the main process.
+_positions: np.ndarray | None = None
+_shared_memory: shared_memory.SharedMemory | None = None
+
+
+def _init_worker(shared_memory_name: str, count: int, nodes_data: bytes):
+    """Load the copy of the nodes, attach the worker to the shared positions
+    and reseed its random generators, which would otherwise repeat the ones
+    of the other workers."""
+
+    global _nodes, _positions, _shared_memory
+
+    random.seed()
+    np.random.seed()
+
+    _nodes = pickle.loads(nodes_data)
+
+    _shared_memory = shared_memory.SharedMemory(name=shared_memory_name)
+    _positions = np.ndarray((count, 3), dtype=np.float64,
+                            buffer=_shared_memory.buf)
+
+
+def _evaluate_shard(shard) -> list[tuple[int, int, bool]]:
+    """Evaluate the pairs that involve a shard of the source nodes in a
+    worker, following the same rules as the serial evaluation of the
+    connectivity engine.
+
+    Returns
+    -------
+    list[tuple[int, int, bool]]
+        The edges (node index, neighbor index, is connected) that changed.
+    """
+
+    # only the edges from and to the sources of the shard are sent
+    sources, sources_candidates, rank_array, symmetric, edge_sources, edge_targets = shard
+    ranks = rank_array.tolist()
+
+    for node, (x, y, z) in zip(_nodes, _positions.tolist()):
+        node.position.set_coordinates(x, y, z)
+
+    edges = set(zip(edge_sources.tolist(), edge_targets.tolist()))
+    adjacency: dict[int, set[int]] = {}
+
+    if (sources_candidates is not None):
+        for u, v in edges:
+            adjacency.setdefault(u, set()).add(v)
+            adjacency.setdefault(v, set()).add(u)
+
+    changes: list[tuple[int, int, bool]] = []
+
+    def evaluate(i: int, j: int) -> bool:
+        is_connected = bool(
+            _nodes[i].connectivity_model.is_connected(_nodes[i], _nodes[j]))
+
+        if (is_connected != ((i, j) in edges)):
+            changes.append((i, j, is_connected))
+
+        return is_connected
+
+    for k, i in enumerate(sources.tolist()):
+        model = _nodes[i].connectivity_model
+
+        if (sources_candidates is None and symmetric):
+            # only the nodes whose pair with the source it decides
+            candidates = np.flatnonzero(
+                (rank_array < 0) | (rank_array > ranks[i])).tolist()
+        elif (sources_candidates is None):
+            candidates = range(len(_nodes))
+        else:
+            candidates = dict.fromkeys(sources_candidates[k].tolist())
+            candidates.update(dict.fromkeys(sorted(adjacency.get(i, ()))))
+
+        for j in candidates:
+            if (j == i):
+                continue
+
+            if (symmetric or model.is_symmetric_with(_nodes[j].connectivity_model)):
+                # a pair of two sources is decided by the first of them
+                if (ranks[j] < 0 or ranks[j] > ranks[i]):
+                    is_connected = evaluate(i, j)
+
+                    if (is_connected != ((j, i) in edges)):
+                        changes.append((j, i, is_connected))
+                continue
+
+            evaluate(i, j)
+
+            # pairs between two sources are evaluated from both sides
+            if (ranks[j] < 0):
+                evaluate(j, i)
+
+    return changes
+
+
+class ParallelConnectivity:
+    """Pool of worker processes that evaluate `is_connected` for shards of
+    the source nodes of the connectivity engine.
+
+    The workers are started from a fork server, or spawned where there is
+    none, so that they are not forked from the threads of the web server.
+    They get a pickled snapshot of the nodes and of their connectivity
+    models, which is taken again whenever a node or a connectivity model is
+    replaced. The positions of the nodes are copied to shared memory every
+    round. Any other attribute that a connectivity model reads must not
+    change while the workers are alive. If the nodes cannot be pickled, the
+    pairs are left to the serial evaluation.
+    """
+
+    def __init__(self):
+        self.processes = 0
+        self.__pool = None
+        self.__shared_memory: shared_memory.SharedMemory | None = None
+        self.__positions: np.ndarray | None = None
+        self.__snapshot: list[tuple[int, int]] = []
+        # snapshot of the nodes that could not be pickled
+        self.__unpicklable_snapshot: list[tuple[int, int]] | None = None
+
+    def evaluate(self, graph: 'nx.DiGraph', nodes: list['AbcNode'], sources: list['AbcNode'], sources_candidates: list[list['AbcNode']] | None, symmetric: bool, processes: int) -> list[tuple['AbcNode', 'AbcNode', bool]] | None:
+        """Evaluate the pairs that involve the source nodes in the worker
+        processes.
+
+        Parameters
+        ----------
+        graph : nx.DiGraph
+            The network graph, whose edges are compared to the decisions.
+        nodes : list[AbcNode]
+            Every node of the simulation.
+        sources : list[AbcNode]
+            The nodes whose pairs are evaluated.
+        sources_candidates : list[list[AbcNode]] | None
+            The nodes within range of each source, as given by the spatial
+            index, or `None` to pair each source with every node.
+        symmetric : bool
+            Whether every pair of nodes is symmetric, so that it is evaluated
+            once without asking the models.
+        processes : int
+            The number of worker processes.
+
+        Returns
+        -------
+        list[tuple[AbcNode, AbcNode, bool]] | None
+            The edges (node, neighbor, is connected) that changed, or `None`
+            if the nodes cannot be sent to the workers.
+        """
+
+        if (not self.__start(nodes, processes)):
+            return None
+
+        self.__positions[:] = coordinates_array(nodes)
+
+        index = {node: i for i, node in enumerate(nodes)}
+        source_indices = np.array([index[node] for node in sources],
+                                  dtype=np.intp)
+        ranks = np.full(len(nodes), -1, dtype=np.intp)
+        ranks[source_indices] = np.arange(len(sources))
+
+        if (sources_candidates is not None):
+            sources_candidates = [np.array([index[node] for node in candidates], dtype=np.intp)
+                                  for candidates in sources_candidates]
+
+        shards = []
+
+        for shard in np.array_split(np.arange(len(sources)), processes):
+            if (len(shard) == 0):
+                continue
+
+            shard_candidates = None if sources_candidates is None else \
+                sources_candidates[shard[0]:shard[-1] + 1]
+            edges = self.__edges_of(graph, index,
+                                    [sources[k] for k in shard.tolist()])
+            shards.append((source_indices[shard], shard_candidates,
+                           ranks, symmetric, edges[:, 0], edges[:, 1]))
+
+        return [(nodes[i], nodes[j], is_connected)
+                for shard_changes in self.__pool.map(_evaluate_shard, shards)
+                for i, j, is_connected in shard_changes]
+
+    def close(self):
+        """Terminate the worker processes and release the shared memory."""
+
+        if (self.__pool is not None):
+            self.__pool.terminate()
+            self.__pool.join()
+            self.__pool = None
+
+        if (self.__shared_memory is not None):
+            self.__positions = None
+            self.__shared_memory.close()
+            self.__shared_memory.unlink()
+            self.__shared_memory = None
+
+        self.__snapshot = []
+
+    def __start(self, nodes: list['AbcNode'], processes: int) -> bool:
+        """(private) Starts the workers again if the nodes, their
+        connectivity models or the number of processes changed. Returns
+        `False` if the nodes cannot be pickled."""
+
+        snapshot = [(id(node), id(node.connectivity_model)) for node in nodes]
+
+        if (self.__pool is not None and processes == self.processes and
+                snapshot == self.__snapshot):
+            return True
+
+        if (snapshot == self.__unpicklable_snapshot):
+            return False
+
+        self.close()
+
+        try:
+            nodes_data = pickle.dumps(nodes, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            self.__unpicklable_snapshot = snapshot
+            return False
+
+        self.__shared_memory = shared_memory.SharedMemory(
+            create=True, size=max(len(nodes), 1) * 3 * 8)
+        self.__positions = np.ndarray((len(nodes), 3), dtype=np.float64,
+                                      buffer=self.__shared_memory.buf)
+
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() \
+            else 'spawn'
+        self.__pool = multiprocessing.get_context(start_method).Pool(
+            processes, _init_worker, (self.__shared_memory.name, len(nodes), nodes_data))
+
+        self.processes = processes
+        self.__snapshot = snapshot
+
+        return True
+
+    def __edges_of(self, graph: 'nx.DiGraph', index: dict['AbcNode', int], sources: list['AbcNode']) -> np.ndarray:
+        """(private) Returns the edges from and to the sources, as pairs of
+        node indices."""
+
+        edges = [(index[node], index[neighbor])
+                 for node in sources for neighbor in graph.successors(node)]
+        edges.extend((index[neighbor], index[node])
+                     for node in sources for neighbor in graph.predecessors(node))
+
+        return np.array(edges, dtype=np.intp).reshape(-1, 2)
@@ -1,5 +1,14 @@
 import math
 from copy import deepcopy
+from typing import TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from ..models.nodes.abc_node import AbcNode
+    from .position_store import PositionStore
+
+# Coordinates of a `PositionView` that are mirrored in its store.
+_AXES = frozenset(('x', 'y', 'z'))
 
 
 class Position:
@@ -54,6 +63,140 @@ class Position:
         return f"({self.x},{self.y},{self.z})"
 
 
+class PositionView(Position):
+    """Position whose coordinates are mirrored in a slot of a
+    `PositionStore`.
+
+    It is the position of a node in the simulation. The coordinates are
+    plain attributes, so reading them costs as much as with a `Position`;
+    assigning one also writes it to the arrays of the store, and the store
+    writes the coordinates it sets in bulk back to the views.
+    """
+
+    def __init__(self, store: 'PositionStore', slot: int):
+        self.store = store
+        self.slot = slot
+        self.load(store.x.item(slot), store.y.item(slot), store.z.item(slot))
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+
+        if (name in _AXES):
+            getattr(self.store, name)[self.slot] = value
+
+    def load(self, x, y, z):
+        """Set the coordinates of the view without writing them to the
+        store. Called by the store after writing them to its arrays."""
+
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'z', z)
+
+    def copy(self):
+        """Generate a plain position with the same coordinates and return
+        it."""
+
+        return Position(*self.get_coordinates())
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+
+def coordinates_array(nodes: list['AbcNode']) -> np.ndarray:
+    """Return an (n, 3) array with the coordinates of the nodes.
+
+    Parameters
+    ----------
+    nodes : list[AbcNode]
+        The nodes whose coordinates are gathered.
+
+    Returns
+    -------
+    np.ndarray
+        Row i holds the x, y and z coordinates of `nodes[i]`.
+    """
+
+    positions = [node.position for node in nodes]
+    store = _common_store(positions)
+
+    if (store is not None):
+        return store.coordinates(_slots(positions))
+
+    return np.array([position.get_coordinates() for position in positions],
+                    dtype=np.float64).reshape(len(nodes), 3)
+
+
+def set_coordinates_array(nodes: list['AbcNode'], coordinates: np.ndarray):
+    """Write an (n, 3) array of coordinates into the positions of the nodes.
+
+    Unlike `AbcNode.set_position`, the nodes are not marked to have their
+    connections re-evaluated.
+
+    Parameters
+    ----------
+    nodes : list[AbcNode]
+        The nodes whose positions are written.
+    coordinates : np.ndarray
+        Row i holds the new x, y and z coordinates of `nodes[i]`.
+    """
+
+    positions = [node.position for node in nodes]
+    store = _common_store(positions)
+
+    if (store is not None):
+        store.set_coordinates(_slots(positions), coordinates)
+        return
+
+    for node, (x, y, z) in zip(nodes, coordinates.tolist()):
+        node._position = Position(x, y, z)
+
+
+def _common_store(positions: list[Position]) -> 'PositionStore | None':
+    """(private) Returns the store of the positions if all of them are views
+    of the same store, or `None` otherwise."""
+
+    if (len(positions) == 0 or not isinstance(positions[0], PositionView)):
+        return None
+
+    store = positions[0].store
+
+    for position in positions:
+        if (not isinstance(position, PositionView) or position.store is not store):
+            return None
+
+    return store
+
+
+def _slots(positions: list[PositionView]) -> np.ndarray:
+    """(private) Returns the slots of the views as an array."""
+
+    return np.fromiter((position.slot for position in positions),
+                       dtype=np.intp, count=len(positions))
+
+
+def distance_matrix(nodes_a: list['AbcNode'], nodes_b: list['AbcNode']) -> np.ndarray:
+    """Return the Euclidean distance between every pair of nodes.
+
+    Parameters
+    ----------
+    nodes_a : list[AbcNode]
+        The nodes of the rows.
+    nodes_b : list[AbcNode]
+        The nodes of the columns.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (len(nodes_a), len(nodes_b)) where the element
+        (i, j) is the distance between `nodes_a[i]` and `nodes_b[j]`.
+    """
+
+    difference = coordinates_array(nodes_a)[:, np.newaxis, :] - \
+        coordinates_array(nodes_b)[np.newaxis, :, :]
+
+    return np.sqrt(np.sum(difference ** 2, axis=2))
+
+
 if __name__ == "__main__":
     # Example usage
     p1 = Position(1, 2, 3)
@@ -0,0 +1,99 @@
+import numpy as np
+from .position import Position, PositionView
+
+
+class PositionStore:
+    """Coordinates of the nodes of the simulation in contiguous arrays.
+
+    Each node in the simulation owns a slot, and its `position` is a
+    `PositionView` of that slot. The slots in use are always `0` to
+    `size - 1`, so vectorized code can read the coordinates of every node
+    without touching the node objects.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.size = 0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.z = np.zeros(capacity, dtype=np.float64)
+        self.views: list[PositionView] = []
+
+    def add(self, position: Position) -> PositionView:
+        """Allocate a slot with the coordinates of the position.
+
+        Parameters
+        ----------
+        position : Position
+            The initial coordinates.
+
+        Returns
+        -------
+        PositionView
+            The view of the new slot.
+        """
+
+        if (self.size == len(self.x)):
+            self.__grow(2 * len(self.x))
+
+        view = PositionView(self, self.size)
+        self.views.append(view)
+        self.size += 1
+
+        view.set_coordinates(*position.get_coordinates())
+
+        return view
+
+    def remove(self, view: PositionView):
+        """Release the slot of the view.
+
+        The last slot is moved into the released one, so the view of the
+        last slot changes its slot. The removed view must not be used
+        anymore.
+        """
+
+        last = self.size - 1
+        moved = self.views.pop()
+
+        if (moved is not view):
+            slot = view.slot
+            self.x[slot] = self.x[last]
+            self.y[slot] = self.y[last]
+            self.z[slot] = self.z[last]
+            moved.slot = slot
+            self.views[slot] = moved
+
+        self.size = last
+
+    def coordinates(self, slots: np.ndarray | None = None) -> np.ndarray:
+        """Return an (n, 3) array with the coordinates of the slots.
+
+        Parameters
+        ----------
+        slots : np.ndarray, optional
+            The slots to read. Defaults to every slot in use.
+        """
+
+        if (slots is None):
+            slots = slice(0, self.size)
+
+        return np.column_stack((self.x[slots], self.y[slots], self.z[slots]))
+
+    def set_coordinates(self, slots: np.ndarray, coordinates: np.ndarray):
+        """Write the rows of an (n, 3) array of coordinates into the slots."""
+
+        self.x[slots] = coordinates[:, 0]
+        self.y[slots] = coordinates[:, 1]
+        self.z[slots] = coordinates[:, 2]
+
+        views = self.views
+
+        for slot, (x, y, z) in zip(np.asarray(slots).tolist(), coordinates.tolist()):
+            views[slot].load(x, y, z)
+
+    def __grow(self, capacity: int):
+        """(private) Reallocates the arrays with a larger capacity."""
+
+        for axis in ('x', 'y', 'z'):
+            array = np.zeros(capacity, dtype=np.float64)
+            array[:self.size] = getattr(self, axis)[:self.size]
+            setattr(self, axis, array)
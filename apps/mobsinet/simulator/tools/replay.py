@@ -0,0 +1,229 @@
+import threading
+import numpy as np
+from ..configuration.sim_config import config
+from ..global_vars import Global
+from ..network_simulator import simulation
+from .color import Color
+from .contact_plan import ContactPlan
+from .models_normalizer import ModelsNormalizer
+from .packet_event_log import PacketEventLog, SENT, DELIVERED
+from .position import Position
+from .trace_2d import Trace2D
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..models.nodes.abc_node import AbcNode
+
+
+class Replay:
+    """Shows a recorded simulation again without running it.
+
+    The recording is made of the position trace of the nodes (see
+    `config.save_trace`), optionally the edges changed in each round, saved
+    next to the trace as `<name>.contacts.npz` (see `config.save_contacts`),
+    and the packet event log
+    (see `config.packet_event_log`). The replay moves inert nodes to the
+    recorded positions, applies the recorded edges to `simulation.graph` and
+    sets the message counters and round logs from the packet events, so
+    mobility, connectivity, interference and the logic of the nodes never
+    run. Any time of the recording can be shown with `seek`.
+    """
+
+    def __init__(self, trace_file: str, contacts_file: str | None = None, packet_log_file: str | None = None):
+        """
+        Parameters
+        ----------
+        trace_file : str
+            The position trace, in any format read by `Trace2D.load`.
+        contacts_file : str | None
+            The contact plan recorded with the trace. Without it, the graph
+            has no edges.
+        packet_log_file : str | None
+            The packet event log of the simulation. Without it, the message
+            counters stay at zero.
+        """
+
+        self.trace = Trace2D.load(trace_file)
+        self.contact_plan = ContactPlan.load(
+            contacts_file) if contacts_file is not None else None
+        self.packet_events = PacketEventLog.read(
+            packet_log_file) if packet_log_file is not None else None
+
+        self.start_time = float(
+            self.trace.time_values[0]) if len(self.trace) > 0 else 0
+        self.end_time = float(
+            self.trace.time_values[-1]) if len(self.trace) > 0 else 0
+
+        if (self.contact_plan is not None):
+            self.end_time = max(self.end_time, self.contact_plan.rounds)
+        if (self.packet_events is not None and len(self.packet_events) > 0):
+            self.end_time = max(self.end_time,
+                                float(self.packet_events['time'][-1]))
+
+        # time of each sent packet, to count the messages up to a time
+        self.__sent_times = self.packet_events['time'][self.packet_events['event'] == SENT] \
+            if self.packet_events is not None else np.zeros(0)
+
+        self.__nodes_by_id: dict[int, 'AbcNode'] = {}
+        # edges of the contact plan up to `__round`, by node ids
+        self.__edges: set[tuple[int, int]] = set()
+        self.__round = 0
+        self.__lock = threading.Lock()
+
+    def start(self):
+        """Replace the nodes of the simulation by the recorded ones and show
+        the first time of the recording."""
+
+        simulation.reset()
+        simulation.replay = self
+
+        self.__node_constructor = ModelsNormalizer.normalize_node_constructor(
+            'inert_node')
+        self.__models = (ModelsNormalizer.normalize_mobility_model('no_mobility'),
+                         ModelsNormalizer.normalize_connectivity_model(
+                             'no_connectivity'),
+                         ModelsNormalizer.normalize_interference_model(
+                             'no_interference'),
+                         ModelsNormalizer.normalize_reliability_model('no_reliability'))
+        self.__nodes_by_id = {}
+        self.__edges = self.__initial_edges()
+        self.__round = 0
+
+        self.seek(self.start_time)
+
+    def seek(self, time: float):
+        """Show the recording at the time.
+
+        Parameters
+        ----------
+        time : float
+            The time to show. The nodes are placed at their last recorded
+            positions up to it.
+        """
+
+        with self.__lock:
+            self.__place_nodes(time)
+            self.__apply_edges(time)
+            self.__set_packet_events(time)
+
+            Global.current_time = int(time) if float(time).is_integer() else time
+
+    def step(self) -> bool:
+        """Show the next round of the recording.
+
+        Returns
+        -------
+        bool
+            False if the recording already ended, True otherwise.
+        """
+
+        if (Global.current_time >= self.end_time):
+            return False
+
+        self.seek(Global.current_time + 1)
+
+        return True
+
+    def __place_nodes(self, time: float):
+        """(private) Adds the nodes recorded at the time, removes the others
+        and moves them to their positions."""
+
+        time_slot = int(np.searchsorted(
+            self.trace.time_values, time, side='right')) - 1
+
+        if (time_slot < 0):
+            rows = np.zeros(0, dtype=np.int64)
+        else:
+            rows = self.trace.rows_at(time_slot)
+
+        ids = np.asarray(self.trace.ids)[rows]
+
+        ids = [int(node_id) for node_id in ids.tolist()]
+        present = set(ids)
+
+        for node_id in list(self.__nodes_by_id):
+            if (node_id not in present):
+                simulation.remove_node(node_id)
+                del self.__nodes_by_id[node_id]
+
+        for node_id, x, y in zip(ids, np.asarray(self.trace.xs)[rows].tolist(),
+                                 np.asarray(self.trace.ys)[rows].tolist()):
+            node = self.__nodes_by_id.get(node_id)
+
+            if (node is None):
+                node = self.__node_constructor(node_id, Position(x, y, 0),
+                                               *self.__models)
+                node.set_color(Color(hex_str=config.node_color))
+                simulation.add_node(node)
+                self.__nodes_by_id[node_id] = node
+            else:
+                node.set_coordinates(x, y, 0)
+
+    def __apply_edges(self, time: float):
+        """(private) Brings the graph to the edges of the contact plan at the
+        time, between the nodes that are present."""
+
+        if (self.contact_plan is None):
+            return
+
+        plan = self.contact_plan
+        target_round = int(min(max(time, 0), plan.rounds))
+
+        if (target_round < self.__round):
+            self.__edges = self.__initial_edges()
+            self.__round = 0
+
+        if (target_round > self.__round):
+            start, end = plan.offsets[self.__round], plan.offsets[target_round]
+
+            for source, target, is_connected in zip(plan.sources[start:end].tolist(),
+                                                    plan.targets[start:end].tolist(),
+                                                    plan.connected[start:end].tolist()):
+                if (is_connected):
+                    self.__edges.add((source, target))
+                else:
+                    self.__edges.discard((source, target))
+
+            self.__round = target_round
+
+        nodes_by_id = self.__nodes_by_id
+        edges = {(nodes_by_id[source], nodes_by_id[target]) for source, target in self.__edges
+                 if source in nodes_by_id and target in nodes_by_id}
+        current_edges = set(simulation.graph.edges)
+
+        simulation.remove_edges(list(current_edges - edges))
+        simulation.add_edges(list(edges - current_edges))
+
+    def __set_packet_events(self, time: float):
+        """(private) Sets the message counters and the round logs from the
+        packet events of the time."""
+
+        Global.round_logs = []
+
+        if (self.packet_events is None):
+            return
+
+        times = self.packet_events['time']
+        start = int(np.searchsorted(times, time, side='left'))
+        end = int(np.searchsorted(times, time, side='right'))
+
+        Global.number_of_messages_over_all = int(
+            np.searchsorted(self.__sent_times, time, side='right'))
+        Global.number_of_messages_in_this_round = Global.number_of_messages_over_all - \
+            int(np.searchsorted(self.__sent_times, time, side='left'))
+
+        for record in self.packet_events[start:end]:
+            if (record['event'] != SENT):
+                Global.round_logs.append(
+                    f"Packet ({record['origin']}->{record['destination']}) "
+                    f"{'arrived' if record['event'] == DELIVERED else 'denied'}")
+
+    def __initial_edges(self) -> set[tuple[int, int]]:
+        """(private) Returns the edges of the contact plan before its first
+        round."""
+
+        if (self.contact_plan is None):
+            return set()
+
+        return set(zip(self.contact_plan.initial_sources.tolist(),
+                       self.contact_plan.initial_targets.tolist()))
@@ -0,0 +1,97 @@
+from math import floor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..models.nodes.abc_node import AbcNode
+    from .position import Position
+
+
+class SpatialGrid:
+    """Uniform hash grid that buckets nodes by their position.
+
+    When the cell size is at least the largest connection radius, every node
+    that can be connected to a given node lies in the 3x3x3 block of cells
+    around the cell of that node.
+    """
+
+    def __init__(self, cell_size: float = 1):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int, int], list['AbcNode']] = {}
+        self.node_cells: dict['AbcNode', tuple[int, int, int]] = {}
+
+    def rebuild(self, nodes: list['AbcNode'], cell_size: float):
+        """Rebuild the grid from the current positions of the nodes.
+
+        Parameters
+        ----------
+        nodes : list[AbcNode]
+            The nodes to index.
+        cell_size : float
+            The edge length of a cell. Values less than or equal to zero
+            fall back to a cell size of 1.
+        """
+
+        self.cell_size = cell_size if cell_size > 0 else 1
+        self.cells = {}
+        self.node_cells = {}
+
+        for node in nodes:
+            self.update(node)
+
+    def update(self, node: 'AbcNode'):
+        """Insert the node in the grid or move it to the cell of its current
+        position."""
+
+        cell = self.cell_of(node.position)
+        old_cell = self.node_cells.get(node)
+
+        if (old_cell == cell):
+            return
+
+        if (old_cell is not None):
+            self.cells[old_cell].remove(node)
+            if (len(self.cells[old_cell]) == 0):
+                del self.cells[old_cell]
+
+        self.cells.setdefault(cell, []).append(node)
+        self.node_cells[node] = cell
+
+    def remove(self, node: 'AbcNode'):
+        """Remove the node from the grid, if it is indexed."""
+
+        cell = self.node_cells.pop(node, None)
+
+        if (cell is not None):
+            self.cells[cell].remove(node)
+            if (len(self.cells[cell]) == 0):
+                del self.cells[cell]
+
+    def cell_of(self, position: 'Position') -> tuple[int, int, int]:
+        """Return the key of the cell that contains the position."""
+
+        return (floor(position.x / self.cell_size),
+                floor(position.y / self.cell_size),
+                floor(position.z / self.cell_size))
+
+    def candidates_of(self, nodes: list['AbcNode']) -> list[list['AbcNode']]:
+        """Return the candidates of each node, as given by `candidates`."""
+
+        return [self.candidates(node) for node in nodes]
+
+    def candidates(self, node: 'AbcNode') -> list['AbcNode']:
+        """Return the nodes in the cell of the node and in the adjacent cells.
+
+        The node itself is included in the result.
+        """
+
+        cx, cy, cz = self.cell_of(node.position)
+        candidates: list['AbcNode'] = []
+
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    cell = self.cells.get((cx + dx, cy + dy, cz + dz))
+                    if cell:
+                        candidates.extend(cell)
+
+        return candidates
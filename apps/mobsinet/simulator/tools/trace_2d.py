@@ -0,0 +1,380 @@
+import os
+import numpy as np
+import utm
+
+# Lines of a binary trace file, as saved by `Trace2D.save`.
+LINE_DTYPE = np.dtype([('time', '<f8'), ('x', '<f8'), ('y', '<f8'),
+                       ('id', '<f8')])
+
+# The dense rows table of a trace is only built while it has at most this
+# many cells per line of the trace, or at most `MIN_TABLE_CELLS` cells.
+MAX_CELLS_PER_LINE = 4
+MIN_TABLE_CELLS = 1 << 16
+
+
+class Trace2D:
+    """Positions of a 2D trace stored as columns sorted by time and node id.
+
+    The row of each (time, node id) pair is kept in a dense table, so the
+    position of a node at a time is found in constant time. When most pairs
+    have no line, as in traces with sparse or non-integer timestamps, there
+    is no table (`rows` is `None`) and the row is searched among the lines of
+    the time instead. If the trace has several lines for a pair, the first
+    one is used.
+    """
+
+    def __init__(self, times: np.ndarray, xs: np.ndarray, ys: np.ndarray, ids: np.ndarray, index: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None):
+        """
+        Parameters
+        ----------
+        times : np.ndarray
+            The time of each line of the trace.
+        xs : np.ndarray
+            The x coordinate (or latitude) of each line of the trace.
+        ys : np.ndarray
+            The y coordinate (or longitude) of each line of the trace.
+        ids : np.ndarray
+            The node id of each line of the trace.
+        index : tuple[np.ndarray, np.ndarray, np.ndarray | None] | None
+            The time values, node id values and rows table of columns that
+            are already sorted, as kept in the attributes of another trace.
+            The columns are sorted and indexed if it is not given.
+        """
+
+        if (index is None):
+            # stable, so the lines of a pair keep the order of the file
+            order = np.lexsort((ids, times))
+
+            times = np.asarray(times, dtype=np.float64)[order]
+            xs = np.asarray(xs, dtype=np.float64)[order]
+            ys = np.asarray(ys, dtype=np.float64)[order]
+            ids = np.asarray(ids, dtype=np.float64)[order]
+
+            time_values, time_slots = np.unique(times, return_inverse=True)
+            id_values, id_slots = np.unique(ids, return_inverse=True)
+
+            cells = len(time_values) * len(id_values)
+
+            if (cells <= max(MAX_CELLS_PER_LINE * len(times), MIN_TABLE_CELLS)):
+                first = np.ones(len(times), dtype=bool)
+                first[1:] = (time_slots[1:] != time_slots[:-1]) | \
+                    (id_slots[1:] != id_slots[:-1])
+
+                # rows[time slot, id slot] is the first row of the pair, or -1
+                rows = np.full((len(time_values), len(id_values)), -1,
+                               dtype=np.int64)
+                rows[time_slots[first], id_slots[first]] = \
+                    np.flatnonzero(first)
+            else:
+                rows = None
+        else:
+            time_values, id_values, rows = index
+
+        self.times = times
+        self.xs = xs
+        self.ys = ys
+        self.ids = ids
+        self.time_values = time_values
+        self.id_values = id_values
+        self.rows = rows
+
+        self.min_x = float(self.xs.min()) if len(self.xs) > 0 else None
+        self.max_x = float(self.xs.max()) if len(self.xs) > 0 else None
+        self.min_y = float(self.ys.min()) if len(self.ys) > 0 else None
+        self.max_y = float(self.ys.max()) if len(self.ys) > 0 else None
+
+        self.__time_slots = {time: slot for slot,
+                             time in enumerate(time_values.tolist())}
+        self.__id_slots = {node_id: slot for slot,
+                           node_id in enumerate(id_values.tolist())}
+
+        # first row of each time slot, and the number of rows at the end
+        self.__time_offsets = np.searchsorted(
+            self.times, np.append(time_values, np.inf)) if rows is None else None
+
+        # binary file mapped by `from_binary`, if any
+        self.filename: str | None = None
+        self.__utm: Trace2D | None = None
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __deepcopy__(self, memo) -> 'Trace2D':
+        # traces are not modified, so cloned models share them
+        return self
+
+    @staticmethod
+    def load(filename: str) -> 'Trace2D':
+        """Load a trace file, either a CSV file, a binary `.npy` file saved
+        with `save` or a `.npz` file written by `DeltaTraceWriter`.
+
+        Binary files are mapped in memory instead of being read, so the
+        processes that load the same file share its pages.
+        """
+
+        if (filename.endswith('.npy')):
+            return Trace2D.from_binary(filename)
+
+        if (filename.endswith('.npz')):
+            return Trace2D.from_delta(filename)
+
+        return Trace2D.from_csv(filename)
+
+    @staticmethod
+    def from_csv(filename: str) -> 'Trace2D':
+        """Parse a CSV trace file with a header line and the format
+        `timestamp, x, y, id` or `timestamp, lat, long, id`."""
+
+        data = np.loadtxt(filename, delimiter=',', skiprows=1, ndmin=2)
+
+        if (len(data) == 0):
+            data = np.zeros((0, 4))
+
+        return Trace2D(data[:, 0], data[:, 1], data[:, 2], data[:, 3])
+
+    @staticmethod
+    def from_binary(filename: str) -> 'Trace2D':
+        """Map a binary trace file saved with `save` in memory."""
+
+        lines = np.load(filename, mmap_mode='r')
+
+        if (lines.dtype != LINE_DTYPE):
+            raise ValueError(
+                f'{filename} is not a trace file: unexpected dtype {lines.dtype}.')
+
+        with np.load(Trace2D.index_filename(filename)) as index:
+            trace = Trace2D(lines['time'], lines['x'], lines['y'], lines['id'],
+                            (index['time_values'], index['id_values'],
+                             index['rows'] if 'rows' in index.files else None))
+
+        trace.filename = filename
+
+        return trace
+
+    @staticmethod
+    def from_delta(filename: str) -> 'Trace2D':
+        """Read a trace file written by `DeltaTraceWriter`.
+
+        The file only has the lines of the nodes that moved, so each node is
+        given its last position in every round from its first line until it
+        left the simulation.
+        """
+
+        with np.load(filename) as data:
+            groups = sorted({name.split('/')[0] for name in data.files})
+            columns = {column: np.concatenate([data[f'{group}/{column}'] for group in groups])
+                       if len(groups) > 0 else np.zeros(0)
+                       for column in ('rounds', 'time', 'id', 'x', 'y')}
+
+        time_values = np.unique(columns['rounds'])
+        id_values = np.unique(columns['id'])
+        time_slots = np.searchsorted(time_values, columns['time'])
+        id_slots = np.searchsorted(id_values, columns['id'])
+
+        shape = (len(time_values), len(id_values))
+        xs = np.full(shape, np.nan)
+        ys = np.full(shape, np.nan)
+        xs[time_slots, id_slots] = columns['x']
+        ys[time_slots, id_slots] = columns['y']
+
+        # slot of the last line of each node up to each round, or -1
+        last_slots = np.full(shape, -1, dtype=np.int64)
+        last_slots[time_slots, id_slots] = time_slots
+        np.maximum.accumulate(last_slots, axis=0, out=last_slots)
+
+        columns_of_ids = np.arange(len(id_values))
+        xs = xs[last_slots, columns_of_ids]
+        ys = ys[last_slots, columns_of_ids]
+
+        # lines with NaN coordinates mark the nodes that left
+        present = (last_slots >= 0) & ~np.isnan(xs)
+        time_slots, id_slots = np.nonzero(present)
+
+        # np.nonzero follows the rows, so the lines are sorted by time and id
+        rows = np.full(shape, -1, dtype=np.int64)
+        rows[time_slots, id_slots] = np.arange(len(time_slots))
+
+        return Trace2D(time_values[time_slots], xs[time_slots, id_slots],
+                       ys[time_slots, id_slots], id_values[id_slots],
+                       (time_values, id_values, rows))
+
+    @staticmethod
+    def index_filename(filename: str) -> str:
+        """Return the name of the index file of a binary trace file."""
+
+        return filename.removesuffix('.npy') + '.index.npz'
+
+    @staticmethod
+    def utm_filename(filename: str) -> str:
+        """Return the name of the file of the UTM projection of a binary
+        trace file."""
+
+        return filename.removesuffix('.npy') + '.utm.npy'
+
+    def save(self, filename: str):
+        """Save the trace to a binary `.npy` file of lines sorted by time and
+        node id, and its index next to it (see `index_filename`)."""
+
+        if (not filename.endswith('.npy')):
+            raise ValueError(
+                'The name of a binary trace file must end with .npy.')
+
+        lines = np.empty(len(self), dtype=LINE_DTYPE)
+        lines['time'] = self.times
+        lines['x'] = self.xs
+        lines['y'] = self.ys
+        lines['id'] = self.ids
+
+        np.save(filename, lines)
+        np.savez(Trace2D.index_filename(filename), time_values=self.time_values,
+                 id_values=self.id_values,
+                 **({} if self.rows is None else {'rows': self.rows}))
+
+    def to_utm(self) -> 'Trace2D':
+        """Return the trace with its latitudes and longitudes projected to UTM
+        eastings and northings.
+
+        Each line is projected in its own UTM zone, as a single position
+        would be. The projected trace is cached for the next calls. For a
+        binary trace file, it is also saved next to the file (see
+        `utm_filename`) and mapped in memory, so the processes that project
+        the same file share its pages.
+        """
+
+        if (self.__utm is not None):
+            return self.__utm
+
+        if (len(self) == 0):
+            self.__utm = self
+            return self.__utm
+
+        index = (self.time_values, self.id_values, self.rows)
+
+        if (self.filename is not None):
+            lines = self.__load_utm_lines()
+
+            if (lines is not None):
+                self.__utm = Trace2D(lines['time'], lines['x'], lines['y'],
+                                     lines['id'], index)
+                return self.__utm
+
+        eastings, northings = Trace2D.project_to_utm(
+            np.asarray(self.xs), np.asarray(self.ys))
+        self.__utm = Trace2D(self.times, eastings, northings, self.ids, index)
+
+        return self.__utm
+
+    @staticmethod
+    def project_to_utm(latitudes: np.ndarray, longitudes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Project each point to the UTM zone and hemisphere that contain it,
+        with one call for the points of each zone.
+
+        Parameters
+        ----------
+        latitudes : np.ndarray
+            The latitudes of the points.
+        longitudes : np.ndarray
+            The longitudes of the points.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The eastings and the northings of the points.
+        """
+
+        # the borders of the zones are whole degrees, so a zone is found for
+        # each degree cell instead of each point
+        cells, cell_of_points = np.unique(
+            np.floor(np.column_stack((latitudes, longitudes))), axis=0,
+            return_inverse=True)
+        cell_zones = np.array([utm.latlon_to_zone_number(latitude, longitude)
+                               for latitude, longitude in cells.tolist()])
+        zones = cell_zones[cell_of_points.reshape(-1)]
+        northern = latitudes >= 0
+
+        eastings = np.empty(len(latitudes))
+        northings = np.empty(len(latitudes))
+
+        for zone, is_northern in set(zip(zones.tolist(), northern.tolist())):
+            points = (zones == zone) & (northern == is_northern)
+            eastings[points], northings[points], _, _ = utm.from_latlon(
+                latitudes[points], longitudes[points], force_zone_number=zone,
+                force_northern=is_northern)
+
+        return eastings, northings
+
+    def row_of(self, time: float, node_id: int) -> int:
+        """Return the row of the node at the time, or -1 if the trace has no
+        line for them."""
+
+        time_slot = self.__time_slots.get(time)
+        id_slot = self.__id_slots.get(node_id)
+
+        if (time_slot is None or id_slot is None):
+            return -1
+
+        if (self.rows is not None):
+            return int(self.rows[time_slot, id_slot])
+
+        start = int(self.__time_offsets[time_slot])
+        end = int(self.__time_offsets[time_slot + 1])
+        row = start + int(np.searchsorted(self.ids[start:end], node_id))
+
+        return row if row < end and self.ids[row] == node_id else -1
+
+    def rows_at(self, time_slot: int) -> np.ndarray:
+        """Return the first row of each node at the time of the slot, sorted
+        by node id.
+
+        Parameters
+        ----------
+        time_slot : int
+            The index of the time in `time_values`.
+        """
+
+        if (self.rows is not None):
+            rows = self.rows[time_slot]
+
+            return rows[rows >= 0]
+
+        start = int(self.__time_offsets[time_slot])
+        end = int(self.__time_offsets[time_slot + 1])
+        ids = np.asarray(self.ids[start:end])
+
+        first = np.ones(len(ids), dtype=bool)
+        first[1:] = ids[1:] != ids[:-1]
+
+        return start + np.flatnonzero(first)
+
+    def line(self, row: int) -> list[float]:
+        """Return the line of the trace at the row as
+        `[timestamp, x, y, id]`."""
+
+        return [self.times.item(row), self.xs.item(row), self.ys.item(row),
+                self.ids.item(row)]
+
+    def __load_utm_lines(self) -> np.ndarray | None:
+        """(private) Maps the UTM projection of the binary trace file, saving
+        it first if it is missing or older than the file. Returns `None` if
+        it cannot be saved."""
+
+        filename = Trace2D.utm_filename(self.filename)
+
+        if (not os.path.exists(filename) or
+                os.path.getmtime(filename) < os.path.getmtime(self.filename)):
+            lines = np.empty(len(self), dtype=LINE_DTYPE)
+            lines['time'] = self.times
+            lines['x'], lines['y'] = Trace2D.project_to_utm(
+                np.asarray(self.xs), np.asarray(self.ys))
+            lines['id'] = self.ids
+
+            # renamed once complete, so other processes never map a part
+            temporary = f'{filename}.{os.getpid()}.tmp.npy'
+
+            try:
+                np.save(temporary, lines)
+                os.replace(temporary, filename)
+            except OSError:
+                return None
+
+        return np.load(filename, mmap_mode='r')
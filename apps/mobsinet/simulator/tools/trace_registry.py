@@ -0,0 +1,89 @@
+import os
+import threading
+import weakref
+from .trace_2d import Trace2D
+
+
+class TraceRegistry:
+    """Process-wide cache of the traces loaded by the trace models, so that
+    each trace file is parsed once and kept in memory once.
+
+    Traces are keyed by the absolute path and the modification time of their
+    file, so a file that changed is loaded again. Each trace counts the
+    owners that hold it and leaves the cache when the last one releases it or
+    is garbage collected.
+    """
+
+    __traces: dict[tuple[str, int], Trace2D] = {}
+    __references: dict[tuple[str, int], int] = {}
+    # release of the trace held by each owner
+    __releases: 'weakref.WeakKeyDictionary[object, weakref.finalize]' = weakref.WeakKeyDictionary()
+    # reentrant, since a release may run from the garbage collector
+    __lock = threading.RLock()
+
+    @staticmethod
+    def acquire(filename: str, owner: object) -> Trace2D:
+        """Return the trace of the file, loading it if no owner holds it yet.
+
+        The trace that the owner held before is released.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the trace file, in any format read by `Trace2D.load`.
+        owner : object
+            The object that holds the trace, usually a model.
+
+        Returns
+        -------
+        Trace2D
+            The trace, shared with the other owners of the same file.
+        """
+
+        key = (os.path.abspath(filename), os.stat(filename).st_mtime_ns)
+
+        with TraceRegistry.__lock:
+            trace = TraceRegistry.__traces.get(key)
+
+            if (trace is None):
+                trace = Trace2D.load(filename)
+                TraceRegistry.__traces[key] = trace
+                TraceRegistry.__references[key] = 0
+
+            # referenced before the release, which could drop the same trace
+            TraceRegistry.__references[key] += 1
+            TraceRegistry.release(owner)
+            TraceRegistry.__releases[owner] = weakref.finalize(
+                owner, TraceRegistry.__release_key, key)
+
+        return trace
+
+    @staticmethod
+    def release(owner: object):
+        """Release the trace held by the owner, if any."""
+
+        with TraceRegistry.__lock:
+            release = TraceRegistry.__releases.pop(owner, None)
+
+            if (release is not None):
+                release()
+
+    @staticmethod
+    def references(filename: str) -> int:
+        """Return the number of owners of the current version of the file."""
+
+        key = (os.path.abspath(filename), os.stat(filename).st_mtime_ns)
+
+        return TraceRegistry.__references.get(key, 0)
+
+    @staticmethod
+    def __release_key(key: tuple[str, int]):
+        """(private) Drops a reference to the trace of the key, and the trace
+        itself when it was the last one."""
+
+        with TraceRegistry.__lock:
+            TraceRegistry.__references[key] -= 1
+
+            if (TraceRegistry.__references[key] == 0):
+                del TraceRegistry.__references[key]
+                del TraceRegistry.__traces[key]
@@ -0,0 +1,324 @@
+import itertools
+import queue
+import threading
+from typing import Iterator
+import numpy as np
+from .trace_2d import Trace2D
+
+
+class TraceStream:
+    """Reader of a CSV trace file sorted by time that keeps only a window of
+    its lines in memory.
+
+    The lines are parsed in chunks on a background thread and grouped in
+    windows of `window_duration` time units. The next windows are read while
+    the current one is used, so the rounds rarely wait for the file.
+
+    The models that replay the same trace share a stream from `shared`. The
+    shared streams are closed by `close_shared` when the simulation is
+    reset.
+    """
+
+    # number of lines parsed at once
+    chunk_lines = 65536
+    # number of windows read ahead of the current one
+    prefetched_windows = 1
+
+    # streams returned by `shared`, by file, window duration and format
+    __shared: dict[tuple[str, float, bool], 'TraceStream'] = {}
+
+    def __init__(self, filename: str, window_duration: float, is_lat_long: bool = False):
+        """
+        Parameters
+        ----------
+        filename : str
+            The path to a CSV trace file with a header line and the format
+            `timestamp, x, y, id` or `timestamp, lat, long, id`, sorted by
+            timestamp.
+        window_duration : float
+            The time covered by each window.
+        is_lat_long : bool
+            Whether the trace is in latitude/longitude format. The positions
+            are then projected to UTM, each in the zone that contains it.
+
+        Raises
+        ------
+        ValueError
+            If the window duration is not positive.
+        """
+
+        if (window_duration <= 0):
+            raise ValueError('The window duration must be positive.')
+
+        self.filename = filename
+        self.window_duration = window_duration
+        self.is_lat_long = is_lat_long
+
+        self.__bounds: tuple[float, float, float, float] | None = None
+        self.__bounds_thread: threading.Thread | None = None
+        self.__bounds_error: Exception | None = None
+        # bounds of the windows read so far
+        self.__read_bounds: tuple[float, float, float, float] | None = None
+        self.__closed = threading.Event()
+        self.__queue: queue.Queue | None = None
+        self.__stop: threading.Event | None = None
+        self.__window: Trace2D | None = None
+        self.__window_end = -np.inf
+        self.__exhausted = False
+        self.__last_time = -np.inf
+
+        self.__start()
+
+    @staticmethod
+    def shared(filename: str, window_duration: float, is_lat_long: bool = False) -> 'TraceStream':
+        """Return the stream of the trace shared by every model that replays
+        it with the same window duration and format, opening it if needed.
+
+        The parameters are those of the constructor.
+        """
+
+        key = (filename, window_duration, is_lat_long)
+
+        if (key not in TraceStream.__shared):
+            TraceStream.__shared[key] = TraceStream(*key)
+
+        return TraceStream.__shared[key]
+
+    @staticmethod
+    def close_shared():
+        """Close the streams returned by `shared` and forget them."""
+
+        for stream in TraceStream.__shared.values():
+            stream.close()
+
+        TraceStream.__shared.clear()
+
+    def position_of(self, time: float, node_id: int) -> tuple[float, float] | None:
+        """Return the position of the node at the time, or `None` if the trace
+        has no line for them.
+
+        The windows before the time are dropped. Asking for an earlier time
+        than the last one reads the trace again from its start.
+
+        Raises
+        ------
+        ValueError
+            If the trace file is not sorted by time.
+        """
+
+        if (time < self.__last_time):
+            self.__start()
+
+        self.__last_time = time
+
+        while (not self.__exhausted and time >= self.__window_end):
+            self.__next_window()
+
+        if (self.__window is None):
+            return None
+
+        row = self.__window.row_of(time, node_id)
+
+        if (row < 0):
+            return None
+
+        return self.__window.xs.item(row), self.__window.ys.item(row)
+
+    def start_bounds(self):
+        """Start reading the bounds of the whole trace on a background thread,
+        if it was not started yet, so that `bounds` does not read the file
+        itself."""
+
+        if (self.__bounds_thread is None):
+            self.__bounds_thread = threading.Thread(
+                target=self.__read_whole_bounds, daemon=True)
+            self.__bounds_thread.start()
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Return the minimum x, maximum x, minimum y and maximum y of the
+        whole trace, waiting for the reading started by `start_bounds`.
+
+        Raises
+        ------
+        ValueError
+            If the stream was closed before the bounds were read.
+        """
+
+        self.start_bounds()
+        self.__bounds_thread.join()
+
+        if (self.__bounds_error is not None):
+            raise self.__bounds_error
+
+        if (self.__bounds is None):
+            raise ValueError(
+                f'The trace stream of {self.filename} is closed.')
+
+        return self.__bounds
+
+    def read_bounds(self) -> tuple[float, float, float, float] | None:
+        """Return the minimum x, maximum x, minimum y and maximum y of the
+        windows read so far, or `None` if none was read."""
+
+        return self.__read_bounds
+
+    def close(self):
+        """Stop the background readers, which close the file."""
+
+        self.__closed.set()
+
+        if (self.__stop is not None):
+            self.__stop.set()
+
+    def __start(self):
+        """(private) Starts reading the trace from its start."""
+
+        if (self.__stop is not None):
+            self.__stop.set()
+
+        self.__queue = queue.Queue(maxsize=self.prefetched_windows)
+        self.__stop = threading.Event()
+        self.__window = None
+        self.__window_end = -np.inf
+        self.__exhausted = False
+        self.__last_time = -np.inf
+
+        threading.Thread(target=self.__read, args=(self.__queue, self.__stop),
+                         daemon=True).start()
+
+    def __next_window(self):
+        """(private) Replaces the current window with the next one read by the
+        background thread."""
+
+        item = self.__queue.get()
+
+        if (isinstance(item, Exception)):
+            self.__exhausted = True
+            self.__window = None
+            raise item
+
+        if (item is None):
+            self.__exhausted = True
+            self.__window = None
+            return
+
+        self.__window_end, self.__window = item
+
+        if (len(self.__window) > 0):
+            window = self.__window
+            bounds = (window.min_x, window.max_x, window.min_y, window.max_y)
+
+            if (self.__read_bounds is not None):
+                bounds = (min(bounds[0], self.__read_bounds[0]), max(bounds[1], self.__read_bounds[1]),
+                          min(bounds[2], self.__read_bounds[2]), max(bounds[3], self.__read_bounds[3]))
+
+            self.__read_bounds = bounds
+
+    def __read_whole_bounds(self):
+        """(private) Reads the bounds of the whole trace in chunks, unless the
+        stream is closed first."""
+
+        min_x = min_y = np.inf
+        max_x = max_y = -np.inf
+        chunks = self.__chunks(self.__closed)
+
+        try:
+            for chunk in chunks:
+                min_x = min(min_x, chunk[:, 1].min())
+                max_x = max(max_x, chunk[:, 1].max())
+                min_y = min(min_y, chunk[:, 2].min())
+                max_y = max(max_y, chunk[:, 2].max())
+        except Exception as e:
+            self.__bounds_error = e
+            return
+        finally:
+            chunks.close()
+
+        if (not self.__closed.is_set()):
+            self.__bounds = (float(min_x), float(max_x),
+                             float(min_y), float(max_y))
+
+    def __read(self, output: queue.Queue, stop: threading.Event):
+        """(private) Groups the lines of the trace in windows and puts them
+        in the output queue, followed by `None` at the end of the trace or by
+        the exception that stopped the reading."""
+
+        chunks = self.__chunks(stop)
+
+        try:
+            pending = np.zeros((0, 4))
+            has_chunks = True
+
+            while (has_chunks):
+                chunk = next(chunks, None)
+                has_chunks = chunk is not None
+
+                if (has_chunks):
+                    pending = np.concatenate((pending, chunk))
+
+                while (len(pending) > 0):
+                    end = pending[0, 0] + self.window_duration
+                    split = int(np.searchsorted(pending[:, 0], end))
+
+                    # the next chunk may still have lines of this window
+                    if (split == len(pending) and has_chunks):
+                        break
+
+                    window = pending[:split]
+                    pending = pending[split:]
+
+                    if (not self.__put(output, stop, (end, Trace2D(window[:, 0], window[:, 1], window[:, 2], window[:, 3])))):
+                        return
+
+            self.__put(output, stop, None)
+        except Exception as e:
+            self.__put(output, stop, e)
+        finally:
+            # closes the file even if the reading stopped in the middle
+            chunks.close()
+
+    def __chunks(self, stop: threading.Event) -> Iterator[np.ndarray]:
+        """(private) Yields the lines of the trace in chunks of at most
+        `chunk_lines` rows of `[timestamp, x, y, id]`, projected to UTM if
+        the trace is in latitude/longitude format."""
+
+        last_time = -np.inf
+
+        with open(self.filename, 'r') as f:
+            next(f, None)
+
+            while (not stop.is_set()):
+                lines = list(itertools.islice(f, self.chunk_lines))
+
+                if (len(lines) == 0):
+                    return
+
+                chunk = np.loadtxt(lines, delimiter=',', ndmin=2)
+
+                if (chunk.size == 0):
+                    continue
+
+                if (chunk[0, 0] < last_time or np.any(np.diff(chunk[:, 0]) < 0)):
+                    raise ValueError(
+                        f'The trace file {self.filename} is not sorted by time.')
+
+                last_time = chunk[-1, 0]
+
+                if (self.is_lat_long):
+                    chunk[:, 1], chunk[:, 2] = Trace2D.project_to_utm(
+                        chunk[:, 1], chunk[:, 2])
+
+                yield chunk
+
+    def __put(self, output: queue.Queue, stop: threading.Event, item) -> bool:
+        """(private) Puts the item in the output queue, waiting for room
+        unless the reading is stopped. Returns whether it was put."""
+
+        while (not stop.is_set()):
+            try:
+                output.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
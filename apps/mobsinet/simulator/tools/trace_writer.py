@@ -0,0 +1,242 @@
+import queue
+import threading
+import zipfile
+import numpy as np
+
+
+class TraceWriter:
+    """Writes the positions of the nodes to a CSV trace file with the format
+    `time,x,y,id`, as read by `Trace2D`.
+
+    The file is kept open while the simulation runs. Each call to `write`
+    only copies the positions of a round; the lines are formatted and
+    written by a background thread, which takes the rounds from a bounded
+    queue so that a slow disk holds the simulation back instead of filling
+    the memory.
+
+    Subclasses write other formats by overriding `_open_file`,
+    `_write_round`, `_flush_file` and `_close_file`, which run on the
+    background thread.
+    """
+
+    # rounds waiting to be written before `write` blocks
+    queue_size = 64
+
+    # queued by `flush` and `close`
+    __FLUSH = object()
+    __CLOSE = object()
+
+    def __init__(self, filename: str, append: bool = False):
+        """
+        Parameters
+        ----------
+        filename : str
+            The path to the trace file.
+        append : bool
+            Whether to add the positions to an existing file instead of
+            creating a new file.
+        """
+
+        self.filename = filename
+        self.closed = False
+        self._open_file(append)
+
+        self.__queue: queue.Queue = queue.Queue(type(self).queue_size)
+        self.__error: BaseException | None = None
+        self.__thread = threading.Thread(target=self.__write_rounds,
+                                         name=type(self).__name__, daemon=True)
+        self.__thread.start()
+
+    def write(self, time: int, ids: np.ndarray, xs: np.ndarray, ys: np.ndarray):
+        """Queue the positions of the nodes at the time.
+
+        Parameters
+        ----------
+        time : int
+            The time of the positions.
+        ids : np.ndarray
+            The id of each node.
+        xs : np.ndarray
+            The x coordinate of each node.
+        ys : np.ndarray
+            The y coordinate of each node.
+        """
+
+        self.__raise_error()
+
+        # copied, since the arrays may change before they are written
+        self.__queue.put((time, np.array(ids), np.array(xs, dtype=np.float64),
+                          np.array(ys, dtype=np.float64)))
+
+    def flush(self):
+        """Wait until the queued rounds are written to the file."""
+
+        self.__queue.put(TraceWriter.__FLUSH)
+        self.__queue.join()
+        self.__raise_error()
+
+    def close(self):
+        """Write the queued rounds and close the file."""
+
+        if (self.closed):
+            return
+
+        self.closed = True
+        self.__queue.put(TraceWriter.__CLOSE)
+        self.__thread.join()
+        self.__raise_error()
+
+    def _open_file(self, append: bool):
+        """Opens the file, writing its header line if it is new."""
+
+        self.__file = open(self.filename, 'a' if append else 'w')
+
+        if (not append):
+            self.__file.write('time,x,y,id\n')
+
+    def _write_round(self, time: int, ids: np.ndarray, xs: np.ndarray, ys: np.ndarray):
+        """Writes one line per node with its position at the time."""
+
+        line_format = f'{time},{{}},{{}},{{}}\n'
+
+        self.__file.write(''.join(map(
+            line_format.format, xs.tolist(), ys.tolist(), ids.tolist())))
+
+    def _flush_file(self):
+        """Writes what is buffered to the disk."""
+
+        self.__file.flush()
+
+    def _close_file(self):
+        """Closes the file."""
+
+        self.__file.close()
+
+    def __write_rounds(self):
+        """(private) Writes the queued rounds until `close`."""
+
+        while (True):
+            item = self.__queue.get()
+
+            try:
+                if (self.__error is not None):
+                    continue
+
+                if (item is TraceWriter.__CLOSE):
+                    self._close_file()
+                elif (item is TraceWriter.__FLUSH):
+                    self._flush_file()
+                else:
+                    self._write_round(*item)
+            except BaseException as error:
+                self.__error = error
+            finally:
+                self.__queue.task_done()
+
+                if (item is TraceWriter.__CLOSE):
+                    return
+
+    def __raise_error(self):
+        """(private) Raises the error of the background thread, if any."""
+
+        if (self.__error is not None):
+            raise self.__error
+
+
+class DeltaTraceWriter(TraceWriter):
+    """Writes the positions of the nodes to a compressed `.npz` trace file,
+    read back by `Trace2D.from_delta`.
+
+    A node has a line only in the rounds in which its position differs from
+    its last line, and a line with NaN coordinates in the round in which it
+    left the simulation. The lines are kept in columns (`time`, `id`, `x`
+    and `y`) and written as a group of arrays every `rounds_per_group`
+    rounds, together with the rounds of the group (`rounds`).
+    """
+
+    # rounds written in each group of arrays
+    rounds_per_group = 100
+
+    def _open_file(self, append: bool):
+        """Opens the archive and starts an empty group."""
+
+        self.__archive = zipfile.ZipFile(
+            self.filename, 'a' if append else 'w', zipfile.ZIP_DEFLATED)
+        self.__groups = sum(1 for name in self.__archive.namelist()
+                            if name.endswith('/rounds.npy'))
+
+        # last line of each node in the simulation, sorted by id
+        self.__ids = np.zeros(0)
+        self.__xs = np.zeros(0)
+        self.__ys = np.zeros(0)
+
+        self.__rounds: list[int] = []
+        self.__columns: list[tuple[np.ndarray, ...]] = []
+
+    def _write_round(self, time: int, ids: np.ndarray, xs: np.ndarray, ys: np.ndarray):
+        """Adds the lines of the nodes that moved, arrived or left to the
+        group, and writes the group when it is full."""
+
+        order = np.argsort(ids, kind='stable')
+        ids, xs, ys = ids[order], xs[order], ys[order]
+
+        slots = np.searchsorted(self.__ids, ids)
+        known = slots < len(self.__ids)
+        known[known] = self.__ids[slots[known]] == ids[known]
+
+        changed = ~known
+        changed[known] |= (self.__xs[slots[known]] != xs[known]) | \
+            (self.__ys[slots[known]] != ys[known])
+
+        left = ~np.isin(self.__ids, ids)
+        left_ids = self.__ids[left]
+
+        self.__rounds.append(time)
+        self.__columns.append((
+            np.full(changed.sum() + len(left_ids), time, dtype=np.float64),
+            np.concatenate((ids[changed], left_ids)).astype(np.float64),
+            np.concatenate((xs[changed], np.full(len(left_ids), np.nan))),
+            np.concatenate((ys[changed], np.full(len(left_ids), np.nan)))))
+
+        self.__ids, self.__xs, self.__ys = ids, xs, ys
+
+        if (len(self.__rounds) >= type(self).rounds_per_group):
+            self.__write_group()
+
+    def _flush_file(self):
+        """Writes the group, even if it is not full, and reopens the archive
+        so that its directory is on the disk."""
+
+        self.__write_group()
+        self.__archive.close()
+        self.__archive = zipfile.ZipFile(self.filename, 'a',
+                                         zipfile.ZIP_DEFLATED)
+
+    def _close_file(self):
+        """Writes the group and closes the archive."""
+
+        self.__write_group()
+        self.__archive.close()
+
+    def __write_group(self):
+        """(private) Writes the columns of the group as arrays named
+        `<group>/<column>.npy`."""
+
+        if (len(self.__rounds) == 0):
+            return
+
+        columns = {
+            'rounds': np.array(self.__rounds, dtype=np.float64),
+            'time': np.concatenate([lines[0] for lines in self.__columns]),
+            'id': np.concatenate([lines[1] for lines in self.__columns]),
+            'x': np.concatenate([lines[2] for lines in self.__columns]),
+            'y': np.concatenate([lines[3] for lines in self.__columns]),
+        }
+
+        for name, column in columns.items():
+            with self.__archive.open(f'{self.__groups:06d}/{name}.npy', 'w') as member:
+                np.lib.format.write_array(member, column)
+
+        self.__groups += 1
+        self.__rounds = []
+        self.__columns = []
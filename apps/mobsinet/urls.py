@@ -8,6 +8,9 @@ urlpatterns = [
     path('graph/init_simulation/', views.init_simulation, name='init_simulation'),
     path('graph/run_simulation/', views.run_simulation, name='run_simulation'),
     path('graph/stop_simulation/', views.stop_simulation, name='stop_simulation'),
+    path('graph/start_replay/', views.start_replay, name='start_replay'),
+    path('graph/seek_replay/', views.seek_replay, name='seek_replay'),
+    path('graph/stop_replay/', views.stop_replay, name='stop_replay'),
     path('graph/projects_names/', views.get_projects_names, name='projects_names'),
     path('graph/update_config/', views.update_config, name='update_config'),
     path('graph/add_nodes/', views.add_nodes, name='add_nodes'),
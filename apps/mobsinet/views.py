@@ -21,12 +21,15 @@ from .simulator.gnn.node_classification_gnn import NodeClassificationGNN
 from math import pi
 from .simulator.tools.models_normalizer import ModelsNormalizer
 from .simulator.synchronous_thread import SynchronousThread
+from .simulator.tools.replay import Replay
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 
 
 # Create your views here.
 # Caminho para a pasta PROJECTS
 PROJECTS_DIR = "apps/mobsinet/simulator/projects/"
+# Folder of the recordings that can be replayed
+TRACES_DIR = "traces/"
 
 
 def index(request):
@@ -114,6 +117,65 @@ def stop_simulation(request):
     return HttpResponse(status=200)
 
 
+def start_replay(request):
+    try:
+        trace = trace_file_path(request.GET.get('trace'))
+        contacts = trace_file_path(request.GET.get('contacts'), required=False)
+        packets = trace_file_path(request.GET.get('packets'), required=False)
+
+        replay = Replay(trace, contacts, packets)
+    except (ValueError, KeyError, OSError):
+        return HttpResponse(status=400)
+
+    if (simulation.running_thread):
+        simulation.stop()
+
+    replay.start()
+
+    return HttpResponse(status=200)
+
+
+def trace_file_path(name, required=True):
+    """
+    Return the path of a file of the traces folder, or None if the name is
+    empty and not required.
+
+    Raises ValueError if the name is required and empty, or if it is not the
+    name of a file directly inside the traces folder.
+    """
+
+    if (not name):
+        if (required):
+            raise ValueError('Missing trace file name.')
+        return None
+
+    traces_dir = os.path.realpath(TRACES_DIR)
+    path = os.path.realpath(os.path.join(traces_dir, name))
+
+    if (os.path.dirname(path) != traces_dir or not os.path.isfile(path)):
+        raise ValueError(f'{name} is not a file of the traces folder.')
+
+    return path
+
+
+def seek_replay(request):
+    if (simulation.replay is None):
+        return HttpResponse(status=400)
+
+    simulation.replay.seek(float(request.GET.get('time')))
+
+    return HttpResponse(status=200)
+
+
+def stop_replay(request):
+    if (simulation.running_thread):
+        simulation.stop()
+
+    simulation.replay = None
+
+    return HttpResponse(status=200)
+
+
 @csrf_exempt
 def update_config(request):
     if request.method == "POST":